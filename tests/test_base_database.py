@@ -0,0 +1,157 @@
+"""Unit tests for BaseDatabase, using a sqlite database."""
+
+import sys
+import tempfile
+import types
+import unittest
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+repo_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(repo_root))
+
+from sqlalchemy import event, text
+from sqlalchemy.exc import IntegrityError
+
+from tir.technologies import webapp_internal
+from tir.technologies.core import base_database
+from tir.technologies.core.base_database import BaseDatabase, dispose_engines, format_rows
+
+
+def database_config(database_name):
+    """Returns a config with the database keys of a sqlite file."""
+    return types.SimpleNamespace(database_driver="sqlite", database_name=str(database_name), database_server="",
+                                 database_port=0, database_user="", database_password="", dbq_oracle_server="",
+                                 database_pool_size=5)
+
+
+class TestBaseDatabase(unittest.TestCase):
+    """Test cases for the engine cache, query_execute, execute_many and format_rows of BaseDatabase."""
+
+    def setUp(self):
+        dispose_engines()
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = Path(self.folder.name, "tir.db")
+        self.database = BaseDatabase(database_config(self.path))
+
+        patcher = patch("tir.technologies.core.base_database.logger", MagicMock())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        dispose_engines()
+        self.folder.cleanup()
+
+    def test_engines_are_cached_by_connection(self):
+        """The same connection parameters return the same engine, other parameters another one."""
+        engine = self.database.connect_database()
+
+        self.assertIs(BaseDatabase(database_config(self.path)).connect_database(), engine)
+        self.assertIs(self.database.connect_database(database_name=str(self.path)), engine)
+        self.assertIsNot(self.database.connect_database(database_name=str(Path(self.folder.name, "other.db"))), engine)
+        self.assertEqual(len(base_database._engines), 2)
+
+    def test_dispose_engines_clears_the_cache(self):
+        """dispose_engines and disconnect_database without engine close every engine, so the next call creates a new one."""
+        engine = self.database.connect_database()
+
+        dispose_engines()
+        self.assertEqual(base_database._engines, {})
+        new_engine = self.database.connect_database()
+        self.assertIsNot(new_engine, engine)
+
+        self.database.disconnect_database()
+        self.assertEqual(base_database._engines, {})
+        self.assertIsNot(self.database.connect_database(), new_engine)
+
+    def test_disconnect_database_removes_only_the_engine(self):
+        """disconnect_database with an engine disposes it and keeps the other engines cached."""
+        engine = self.database.connect_database()
+        other = self.database.connect_database(database_name=str(Path(self.folder.name, "other.db")))
+
+        self.database.disconnect_database(engine)
+
+        self.assertEqual(list(base_database._engines.values()), [other])
+
+    def test_finish_disposes_the_engines(self):
+        """WebappInternal.Finish closes the connection pools of the database calls of the test."""
+        webapp = webapp_internal.WebappInternal.__new__(webapp_internal.WebappInternal)
+        webapp.config = types.SimpleNamespace(coverage=True)
+        webapp._base_database = self.database
+        self.database.connect_database()
+
+        with patch.object(webapp_internal.WebappInternal, "get_coverage"):
+            webapp.Finish()
+
+        self.assertEqual(base_database._engines, {})
+
+    def test_cached_engine_runs_queries(self):
+        """A cached engine keeps working for consecutive queries."""
+        with self.database.connect_database().begin() as conn:
+            conn.execute(text("CREATE TABLE SB1T10 (B1_COD TEXT)"))
+
+        for _ in range(3):
+            with self.database.connect_database().connect() as conn:
+                self.assertEqual(conn.execute(text("SELECT COUNT(*) FROM SB1T10")).scalar(), 0)
+
+    def test_query_execute_default_format(self):
+        """SELECT results are returned as a column dict of dicts by default."""
+        with self.database.connect_database().begin() as conn:
+            conn.execute(text("CREATE TABLE SB1T10 (B1_COD TEXT, B1_PRV1 NUMERIC(14, 2))"))
+            conn.execute(text("INSERT INTO SB1T10 VALUES ('TIR001', 1.5), ('TIR002', 10)"))
+
+        result = self.database.query_execute("SELECT B1_COD, B1_PRV1 FROM SB1T10 ORDER BY B1_COD", "", "", "", 0, "", "", "")
+
+        self.assertEqual(result, {"B1_COD": {0: "TIR001", 1: "TIR002"}, "B1_PRV1": {0: 1.5, 1: 10.0}})
+
+    def test_format_rows_converts_decimals_to_float(self):
+        """Decimal values of NUMERIC columns are floats in the dict and dataframe formats, and kept in the others."""
+        rows = [("TIR001", Decimal("1.50")), ("TIR002", Decimal("10"))]
+
+        result = format_rows(["B1_COD", "B1_PRV1"], rows)
+        self.assertEqual(result["B1_PRV1"], {0: 1.5, 1: 10.0})
+        self.assertTrue(all(type(value) is float for value in result["B1_PRV1"].values()))
+        self.assertEqual(str(format_rows(["B1_COD", "B1_PRV1"], rows, "dataframe")["B1_PRV1"].dtype), "float64")
+        self.assertEqual(format_rows(["B1_COD", "B1_PRV1"], rows, "records")[0], {"B1_COD": "TIR001", "B1_PRV1": Decimal("1.50")})
+
+    def create_products(self):
+        with self.database.connect_database().begin() as conn:
+            conn.execute(text("CREATE TABLE SB1T10 (B1_COD TEXT PRIMARY KEY, B1_DESC TEXT, B1_MSBLQL TEXT)"))
+
+    def products(self):
+        with self.database.connect_database().connect() as conn:
+            return conn.execute(text("SELECT B1_COD, B1_DESC, B1_MSBLQL FROM SB1T10 ORDER BY B1_COD")).fetchall()
+
+    def test_execute_many_binds_parameters_in_batches(self):
+        """Parameter lists are sent with executemany in batches of batch_size rows, dicts and strings once."""
+        self.create_products()
+        batches = []
+        event.listen(self.database.connect_database(), "before_cursor_execute",
+                     lambda conn, cursor, statement, parameters, context, executemany: batches.append(len(parameters) if executemany else 1))
+        rows = [{"cod": f"TIR00{index}", "desc": f"O'Brien {index}"} for index in range(5)]
+
+        affected = self.database.execute_many([("INSERT INTO SB1T10 (B1_COD, B1_DESC) VALUES (:cod, :desc)", rows),
+                                               ("UPDATE SB1T10 SET B1_MSBLQL = :blq WHERE B1_COD = :cod", {"blq": "1", "cod": "TIR000"}),
+                                               "UPDATE SB1T10 SET B1_MSBLQL = '2' WHERE B1_MSBLQL IS NULL"], batch_size=2)
+
+        self.assertEqual(batches, [2, 2, 1, 1, 1])
+        self.assertEqual(affected, 10)
+        self.assertEqual(self.products()[:2], [("TIR000", "O'Brien 0", "1"), ("TIR001", "O'Brien 1", "2")])
+
+    def test_execute_many_rolls_back_on_error(self):
+        """A failing statement rolls back every statement of the call."""
+        self.create_products()
+        self.database.execute_many([("INSERT INTO SB1T10 (B1_COD) VALUES (:cod)", {"cod": "KEEP"})])
+
+        with self.assertRaises(IntegrityError):
+            self.database.execute_many([("INSERT INTO SB1T10 (B1_COD) VALUES (:cod)", [{"cod": "TIR001"}, {"cod": "TIR002"}]),
+                                        ("UPDATE SB1T10 SET B1_DESC = 'CHANGED'", None),
+                                        ("INSERT INTO SB1T10 (B1_COD) VALUES (:cod)", [{"cod": "TIR003"}, {"cod": "KEEP"}])],
+                                       batch_size=1)
+
+        self.assertEqual(self.products(), [("KEEP", None, None)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+"""Unit tests for the page reads of Base through the CDP transport."""
+
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+repo_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(repo_root))
+
+from tir.technologies.core import base as base_module
+from tir.technologies.core.session import Session
+
+
+class FakeDriver:
+    """Driver with a fixed page source."""
+
+    page_source = "<html><body>selenium</body></html>"
+
+
+class FakeTransport:
+    """Transport returning a fixed snapshot, or failing when snapshot is None."""
+
+    def __init__(self, snapshot="<html><body>cdp</body></html>"):
+        self.html = snapshot
+        self.closed = False
+
+    def snapshot(self):
+        if self.html is None:
+            raise ConnectionError("CDP connection closed")
+        return self.html
+
+    def close(self):
+        self.closed = True
+
+
+def instance(driver, transport, async_transport=True):
+    """Returns a Base with the driver and transport in its own session, without starting a browser."""
+    base = base_module.Base.__new__(base_module.Base)
+    base.session = Session("cdp")
+    base.config = SimpleNamespace(async_transport=async_transport, browser="Chrome", time_out=1)
+    base.driver = driver
+    base.session.transport, base.session.transport_driver = transport, driver
+    return base
+
+
+class TestCdpTransport(unittest.TestCase):
+    """Test cases for Base.page_source and Base.transport."""
+
+    def test_page_source_reads_through_the_transport(self):
+        """With AsyncTransport the page is read through CDP, otherwise through Selenium."""
+        self.assertEqual(instance(FakeDriver(), FakeTransport()).page_source(), "<html><body>cdp</body></html>")
+        self.assertEqual(instance(FakeDriver(), FakeTransport(), async_transport=False).page_source(), FakeDriver.page_source)
+
+    def test_page_source_falls_back_to_selenium(self):
+        """A failing snapshot reads the page through Selenium."""
+        self.assertEqual(instance(FakeDriver(), FakeTransport(snapshot=None)).page_source(), FakeDriver.page_source)
+
+    def test_transport_is_replaced_with_the_driver(self):
+        """The transport of a previous driver is closed when the driver of the session changes."""
+        old_transport, new_transport = FakeTransport(), FakeTransport()
+        base = instance(FakeDriver(), old_transport)
+
+        with mock.patch.object(base_module, "CdpTransport", return_value=new_transport) as cdp_transport:
+            self.assertIs(base.transport, old_transport)
+            base.driver = FakeDriver()
+            self.assertIs(base.transport, new_transport)
+            self.assertIs(base.transport, new_transport)
+
+        self.assertTrue(old_transport.closed)
+        self.assertFalse(new_transport.closed)
+        cdp_transport.assert_called_once_with(base.driver, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+"""Unit tests for ConfigLoader.derive and the session-scoped config."""
+
+import json
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(repo_root))
+
+from tir.technologies.core.config import ConfigLoader
+from tir.technologies.core.session import Session, use_session
+
+
+class TestConfigContexts(unittest.TestCase):
+    """Test cases for configs derived per session."""
+
+    def setUp(self):
+        """Load a temporary config.json as the process config."""
+        self.folder = tempfile.TemporaryDirectory()
+        path = Path(self.folder.name, "config.json")
+        path.write_text(json.dumps({"Url": "http://localhost:1234", "Environment": "ENV01", "User": "admin",
+                                    "Password": "1234", "Browser": "Chrome"}), encoding="utf-8")
+        self.saved = (ConfigLoader._instance, ConfigLoader._json_data)
+        ConfigLoader._instance = None
+        ConfigLoader._json_data = None
+        self.config = ConfigLoader(str(path))
+
+    def tearDown(self):
+        ConfigLoader._instance, ConfigLoader._json_data = self.saved
+        self.folder.cleanup()
+
+    def test_derive_overrides_keys_without_changing_the_base(self):
+        """derive applies the overrides to a new config and keeps the other keys."""
+        derived = self.config.derive({"Environment": "ENV02", "User": "tir02"})
+
+        self.assertIsNot(derived, self.config)
+        self.assertEqual((derived.environment, derived.user, derived.url), ("ENV02", "tir02", "http://localhost:1234"))
+        self.assertEqual((self.config.environment, self.config.user), ("ENV01", "admin"))
+
+    def test_derive_rejects_unknown_keys(self):
+        """Override keys are validated like config.json keys."""
+        with self.assertRaises(ValueError):
+            self.config.derive({"Enviroment": "ENV02"})
+
+    def test_config_loader_returns_the_session_config(self):
+        """ConfigLoader() returns the config of the bound session and its runtime changes stay there."""
+        session = Session("env02", overrides={"Environment": "ENV02"})
+
+        with use_session(session):
+            scoped = ConfigLoader()
+            scoped.routine = "MATA010"
+
+        self.assertIs(scoped, session.config)
+        self.assertIs(ConfigLoader(), self.config)
+        self.assertEqual(ConfigLoader().environment, "ENV01")
+        self.assertNotEqual(getattr(self.config, "routine", ""), "MATA010")
+
+    def test_sessions_in_threads_keep_their_config(self):
+        """Threads bound to different sessions read their own environment."""
+        results = {}
+
+        def worker(environment):
+            with use_session(Session(environment, overrides={"Environment": environment})):
+                results[environment] = ConfigLoader().environment
+
+        threads = [threading.Thread(target=worker, args=(f"ENV0{index}",)) for index in range(2, 5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, {"ENV02": "ENV02", "ENV03": "ENV03", "ENV04": "ENV04"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+"""Unit tests for the OpenCSV data provider."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+repo_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(repo_root))
+
+from tir.technologies.core import csv_provider
+
+
+class TestCsvProvider(unittest.TestCase):
+    """Test cases for read_csv, CsvData.filter and iter_csv."""
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = str(Path(self.folder.name, "header.csv"))
+        Path(self.path).write_text("CAMPO;TIPO;VAZIO\nA00_FILIAL;C;\nA00_COD;C;\nA00_FILIAL;N;\n", encoding="latin-1")
+        csv_provider.clear_cache()
+
+    def tearDown(self):
+        csv_provider.clear_cache()
+        self.folder.cleanup()
+
+    def test_filter_matches_dataframe_mask(self):
+        """Indexed filters return the same rows and index as the boolean mask."""
+        data = csv_provider.read_csv(self.path, ";", "infer")
+        expected = pd.read_csv(self.path, sep=";", encoding="latin-1", dtype=str).dropna(axis=1, how="all")
+
+        self.assertEqual(list(data.df.columns), ["CAMPO", "TIPO"])
+        self.assertEqual(data.filter("CAMPO", "A00_FILIAL").to_dict(),
+                         expected[expected["CAMPO"] == "A00_FILIAL"].to_dict())
+        self.assertTrue(data.filter("CAMPO", "A01_COD").empty)
+
+    def test_file_is_cached_until_changed(self):
+        """The same file is read once and read again after it is changed."""
+        first = csv_provider.read_csv(self.path, ";", "infer")
+        self.assertIs(csv_provider.read_csv(self.path, ";", "infer"), first)
+        self.assertIsNot(csv_provider.read_csv(self.path, ";", None), first)
+
+        Path(self.path).write_text("CAMPO;TIPO\nB1_COD;C\n", encoding="latin-1")
+        os.utime(self.path, ns=(0, os.stat(self.path).st_mtime_ns + 1_000_000))
+
+        changed = csv_provider.read_csv(self.path, ";", "infer")
+        self.assertIsNot(changed, first)
+        self.assertEqual(changed.df["CAMPO"].tolist(), ["B1_COD"])
+
+    def test_iter_csv_filters_each_chunk(self):
+        """Streaming reads the filtered rows chunk by chunk."""
+        chunks = list(csv_provider.iter_csv(self.path, ";", "infer", chunksize=1, filter_column="CAMPO", filter_value="A00_FILIAL"))
+
+        self.assertEqual([chunk["TIPO"].tolist() for chunk in chunks], [["C"], ["N"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+"""Unit tests for the local chromedriver cache."""
+
+import sys
+import tempfile
+import threading
+import types
+import unittest
+import unittest.mock
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(repo_root))
+
+from tir.technologies.core import driver_cache
+
+
+class TestDriverCache(unittest.TestCase):
+    """Test cases for write_index, cached_driver and resolve_chromedriver."""
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = Path(self.folder.name)
+        driver_cache._resolved.clear()
+
+    def tearDown(self):
+        driver_cache._resolved.clear()
+        self.folder.cleanup()
+
+    def config(self, **keys):
+        return types.SimpleNamespace(**{"driver_cache_path": str(self.path), "driver_cache_offline": False,
+                                        "chromedriver_version": "", "ssl_chrome_auto_install_disable": False, **keys})
+
+    def driver(self, name):
+        path = Path(self.path, name)
+        path.write_text("", encoding="utf-8")
+        return str(path)
+
+    def test_concurrent_writes_keep_every_entry(self):
+        """Workers writing different keys at the same time don't lose each other's entries."""
+        drivers = {f"linux-chrome-{version}": self.driver(f"chromedriver{version}") for version in range(100, 120)}
+
+        threads = [threading.Thread(target=driver_cache.write_index, args=(self.path, key, path)) for key, path in drivers.items()]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual({key: entry["path"] for key, entry in driver_cache.read_index(self.path).items()}, drivers)
+        self.assertEqual(list(Path(self.path, driver_cache.INDEX_FOLDER).glob("*.tmp")), [])
+
+    def test_cached_driver_is_resolved_without_download(self):
+        """A driver in the index is returned without calling ChromeDriverManager, once per process."""
+        driver_cache.write_index(self.path, driver_cache.cache_key("120"), self.driver("chromedriver"))
+
+        with unittest.mock.patch.object(driver_cache, "browser_major_version", return_value="120") as version, \
+                unittest.mock.patch.object(driver_cache, "download_driver", side_effect=AssertionError("downloaded")):
+            self.assertEqual(driver_cache.resolve_chromedriver(self.config()), str(Path(self.path, "chromedriver")))
+            driver_cache.resolve_chromedriver(self.config())
+
+        self.assertEqual(version.call_count, 1)
+
+    def test_missing_chrome_raises(self):
+        """Without Chrome and without a pinned version there is no driver to resolve."""
+        with unittest.mock.patch.object(driver_cache, "browser_major_version", return_value=""), \
+                unittest.mock.patch.object(driver_cache, "download_driver", side_effect=AssertionError("downloaded")):
+            with self.assertRaises(FileNotFoundError):
+                driver_cache.resolve_chromedriver(self.config())
+
+    def test_offline_cache_miss_raises(self):
+        """DriverCacheOffline never downloads a missing driver."""
+        with unittest.mock.patch.object(driver_cache, "download_driver", side_effect=AssertionError("downloaded")):
+            with self.assertRaises(FileNotFoundError):
+                driver_cache.resolve_chromedriver(self.config(driver_cache_offline=True, chromedriver_version="120.0.6099.109"))
+
+    def test_read_index_lists_every_key(self):
+        """Each key of the index folder is listed, and invalid entries are skipped."""
+        path = self.driver("chromedriver")
+        driver_cache.write_index(self.path, "linux-chrome-119", path)
+        driver_cache.write_index(self.path, "linux-chrome-pinned-120.0.6099.109", path)
+        Path(self.path, driver_cache.INDEX_FOLDER, "linux-chrome-118.json").write_text("{", encoding="utf-8")
+
+        self.assertEqual({key: entry["path"] for key, entry in driver_cache.read_index(self.path).items()},
+                         {"linux-chrome-119": path, "linux-chrome-pinned-120.0.6099.109": path})
+
+
+if __name__ == "__main__":
+    unittest.main()
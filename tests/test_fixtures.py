@@ -0,0 +1,119 @@
+"""Unit tests for the fixture loader, using a sqlite database through BaseDatabase."""
+
+import json
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+repo_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(repo_root))
+
+from sqlalchemy import event, text
+
+from tir.technologies.core import fixtures
+from tir.technologies.core.base_database import BaseDatabase, dispose_engines
+from tir.technologies.core.fixtures import Fixture, read_datasets
+
+
+class TestFixture(unittest.TestCase):
+    """Test cases for read_datasets and Fixture load/restore."""
+
+    def setUp(self):
+        """Create a SB1T10 table with one existing product."""
+        self.folder = tempfile.TemporaryDirectory()
+        config = types.SimpleNamespace(database_driver="sqlite", database_name=str(Path(self.folder.name, "fixtures.db")),
+                                       database_server="", database_port=0, database_user="", database_password="",
+                                       dbq_oracle_server="", database_pool_size=5)
+        with patch("tir.technologies.core.base_database.logger", MagicMock()):
+            self.engine = BaseDatabase(config).connect_database()
+        with self.engine.begin() as conn:
+            conn.execute(text("CREATE TABLE SB1T10 (B1_FILIAL TEXT, B1_COD TEXT, B1_DESC TEXT)"))
+            conn.execute(text("INSERT INTO SB1T10 VALUES ('01', 'TIR001', 'ORIGINAL'), ('01', 'KEEP', 'UNTOUCHED')"))
+
+        patcher = patch("tir.technologies.core.fixtures.logger", MagicMock())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        dispose_engines()
+        self.folder.cleanup()
+
+    def rows(self):
+        with self.engine.connect() as conn:
+            return conn.execute(text("SELECT B1_COD, B1_DESC FROM SB1T10 ORDER BY B1_COD")).fetchall()
+
+    def test_read_datasets_csv_and_json(self):
+        """CSV files and JSON lists use the file name as table, JSON objects map tables."""
+        Path(self.folder.name, "sb1t10.csv").write_text("B1_FILIAL;B1_COD;B1_DESC\n01;TIR002;NEW\n", encoding="utf-8")
+        Path(self.folder.name, "data.json").write_text(json.dumps({"SA1T10": [{"A1_COD": "000001"}]}), encoding="utf-8")
+
+        datasets = read_datasets([self.folder.name])
+
+        self.assertEqual(datasets["SB1T10"], [{"B1_FILIAL": "01", "B1_COD": "TIR002", "B1_DESC": "NEW"}])
+        self.assertEqual(datasets["SA1T10"], [{"A1_COD": "000001"}])
+
+    def test_read_datasets_rejects_invalid_table_name(self):
+        """Table names must be plain identifiers."""
+        path = Path(self.folder.name, "bad.json")
+        path.write_text(json.dumps({"SB1T10; DROP TABLE X": []}), encoding="utf-8")
+
+        with self.assertRaises(ValueError):
+            read_datasets(path)
+
+    def test_load_replaces_rows_with_same_keys_and_restore_reverts(self):
+        """Existing rows with the fixture keys are saved, replaced and inserted back by restore."""
+        datasets = {"SB1T10": [{"B1_FILIAL": "01", "B1_COD": "TIR001", "B1_DESC": "FIXTURE"},
+                               {"B1_FILIAL": "01", "B1_COD": "TIR002", "B1_DESC": "NEW"}]}
+
+        fixture = Fixture(datasets, self.engine, keys={"SB1T10": ["B1_FILIAL", "B1_COD"]}, batch_size=1).load()
+
+        self.assertEqual(self.rows(), [("KEEP", "UNTOUCHED"), ("TIR001", "FIXTURE"), ("TIR002", "NEW")])
+
+        fixture.restore()
+
+        self.assertEqual(self.rows(), [("KEEP", "UNTOUCHED"), ("TIR001", "ORIGINAL")])
+
+    def test_load_is_rolled_back_on_error(self):
+        """A failing table leaves the database unchanged."""
+        datasets = {"SB1T10": [{"B1_FILIAL": "01", "B1_COD": "TIR002", "B1_DESC": "NEW"}],
+                    "SB2T10": [{"B2_COD": "TIR002"}]}
+
+        with self.assertRaises(Exception):
+            Fixture(datasets, self.engine).load()
+
+        self.assertEqual(self.rows(), [("KEEP", "UNTOUCHED"), ("TIR001", "ORIGINAL")])
+
+    def test_load_selects_the_saved_rows_in_batches(self):
+        """The rows to be saved are selected with one query per batch of keys, for one and many key columns."""
+        statements = []
+        event.listen(self.engine, "before_cursor_execute",
+                     lambda conn, cursor, statement, parameters, context, executemany: statements.append(statement))
+        datasets = {"SB1T10": [{"B1_FILIAL": "01", "B1_COD": f"TIR{index:03d}", "B1_DESC": "FIXTURE"} for index in range(1, 8)]}
+
+        with patch.object(fixtures, "MAX_PARAMETERS", 6):
+            for keys in (["B1_COD"], ["B1_FILIAL", "B1_COD"]):
+                statements.clear()
+                fixture = Fixture(datasets, self.engine, keys={"SB1T10": keys}).load()
+
+                self.assertEqual(len([statement for statement in statements if statement.startswith("SELECT")]),
+                                 2 if len(keys) == 1 else 3)
+                self.assertEqual(fixture.saved["SB1T10"], [{"B1_FILIAL": "01", "B1_COD": "TIR001", "B1_DESC": "ORIGINAL"}])
+                fixture.restore()
+                self.assertEqual(self.rows(), [("KEEP", "UNTOUCHED"), ("TIR001", "ORIGINAL")])
+
+    def test_load_rejects_rows_with_other_columns(self):
+        """Rows with missing or extra columns, or datasets without the key columns, raise before the database is changed."""
+        for rows, keys in (([{"B1_COD": "TIR002", "B1_DESC": "NEW"}, {"B1_COD": "TIR003"}], None),
+                           ([{"B1_COD": "TIR002"}, {"B1_COD": "TIR003", "B1_DESC": "NEW"}], None),
+                           ([{"B1_COD": "TIR002", "B1_DESC": "NEW"}], {"SB1T10": ["B1_FILIAL", "B1_COD"]})):
+            with self.assertRaises(ValueError):
+                Fixture({"SB1T10": rows}, self.engine, keys=keys).load()
+
+        self.assertEqual(self.rows(), [("KEEP", "UNTOUCHED"), ("TIR001", "ORIGINAL")])
+
+
+if __name__ == "__main__":
+    unittest.main()
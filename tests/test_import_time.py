@@ -0,0 +1,39 @@
+"""Import-time budget of the tir entry points."""
+
+import os
+import sys
+import unittest
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(repo_root))
+
+from tir.technologies.core.import_benchmark import check, measure
+
+# Generous default for shared agents; lower it with TIR_IMPORT_BUDGET to tighten the gate.
+BUDGET = float(os.environ.get("TIR_IMPORT_BUDGET", "3"))
+
+
+class TestImportTime(unittest.TestCase):
+    """Heavy modules must be imported on first use, not by importing tir."""
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        os.chdir(repo_root)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+
+    def test_import_tir_loads_no_heavy_module(self):
+        """import tir stays within the budget without loading selenium, pandas, cv2..."""
+        result = measure("tir", runs=3)
+        self.assertEqual(check(result, BUDGET), [])
+
+    def test_import_webapp_internal_loads_only_browser_modules(self):
+        """webapp_internal loads selenium and bs4 but not pandas, cv2, sqlalchemy or webdriver_manager."""
+        result = measure("tir.technologies.webapp_internal", runs=1)
+        self.assertEqual(check(result, BUDGET), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
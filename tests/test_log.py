@@ -2,6 +2,7 @@ import tempfile
 from pathlib import Path
 import types
 import uuid
+import json
 
 import pytest
 
@@ -37,6 +38,13 @@ class DummyConfig:
         self.api_url_ip = ''
         self.api_json_path = str(repo_root / 'Log')
         self.debug_log = False
+        self.async_log = False
+        self.log_queue_size = 1000
+        self.time_out = 90
+        self.screenshot_format = 'png'
+        self.screenshot_quality = 80
+        self.results_store = False
+        self.history_path = ''
 cfg_mod.ConfigLoader = lambda path=None: DummyConfig(path)
 sys.modules['tir.technologies.core.config'] = cfg_mod
 
@@ -48,6 +56,21 @@ def logger():
 logcfg_mod.logger = logger
 sys.modules['tir.technologies.core.logging_config'] = logcfg_mod
 
+
+def load_core_module(name):
+    core_spec = importlib.util.spec_from_file_location(f'tir.technologies.core.{name}', str(repo_root / 'tir' / 'technologies' / 'core' / f'{name}.py'))
+    core_mod = importlib.util.module_from_spec(core_spec)
+    sys.modules[f'tir.technologies.core.{name}'] = core_mod
+    core_spec.loader.exec_module(core_mod)
+    return core_mod
+
+
+log_sender_mod = load_core_module('log_sender')
+http_session_mod = load_core_module('http_session')
+log_spool_mod = load_core_module('log_spool')
+results_store_mod = load_core_module('results_store')
+history_mod = load_core_module('execution_history')
+
 spec.loader.exec_module(mod)
 Log = mod.Log
 
@@ -63,6 +86,9 @@ def make_log_with_cfg(tmp_dir: Path):
     cfg.issue = 'ISS'
     cfg.execution_id = 'EID'
     cfg.debug_log = False
+    cfg.async_log = False
+    cfg.screenshot_format = 'png'
+    cfg.screenshot_quality = 80
     l.config = cfg
     return l
 
@@ -80,15 +106,14 @@ def test_diagnostic_io_reports(tmp_path):
 def test_take_screenshot_writes_file(tmp_path):
     l = make_log_with_cfg(tmp_path)
 
-    # Prepare a fake driver that actually writes the file so we can assert existence
+    # Prepare a fake driver that returns the screenshot bytes
     captured = []
-    def save_screenshot(path):
-        captured.append(path)
-        Path(path).write_text('screenshot')
-        return True
+    def get_screenshot_as_png():
+        captured.append(True)
+        return b'screenshot'
 
     driver = types.SimpleNamespace()
-    driver.save_screenshot = save_screenshot
+    driver.get_screenshot_as_png = get_screenshot_as_png
 
     screenshot_name = 'my_test'
     stack_item = f"testcase_{uuid.uuid4().hex[:6]}"
@@ -98,20 +123,20 @@ def test_take_screenshot_writes_file(tmp_path):
     testsuite = l.get_file_name("testsuite")
     folder_path = Path(l.config.log_http, l.config.country, l.release, l.config.issue, l.config.execution_id, testsuite)
     # Assert that driver was called and file was created at that path
-    assert captured, "Driver.save_screenshot was not called"
-    written_path = Path(captured[0])
-    assert written_path.exists()
+    assert captured, "Driver.get_screenshot_as_png was not called"
+    written = list(folder_path.glob(f'*_{stack_item}_{screenshot_name}.png'))
+    assert written and written[0].read_bytes() == b'screenshot'
 
 
 def test_take_screenshot_fallback_on_write_fail(tmp_path, monkeypatch):
     l = make_log_with_cfg(tmp_path)
 
-    # Simulate write failure (e.g., directory read-only)
-    def failing_save_screenshot(path):
-        raise PermissionError("Simulated write fail")
+    # Simulate capture failure (e.g., browser closed)
+    def failing_get_screenshot_as_png():
+        raise PermissionError("Simulated capture fail")
 
     driver = types.SimpleNamespace()
-    driver.save_screenshot = failing_save_screenshot
+    driver.get_screenshot_as_png = failing_get_screenshot_as_png
 
     # Monkeypatch tempfile.gettempdir to a controlled dir
     temp_dir = tmp_path / 'fallback'
@@ -120,4 +145,260 @@ def test_take_screenshot_fallback_on_write_fail(tmp_path, monkeypatch):
 
     # Should not crash; should log and continue
     l.take_screenshot_log(driver, description='fail_test', stack_item='testcase_123')
-    # Verify if file was created in fallback (if applicable)
+
+
+def test_take_screenshot_falls_back_to_temp_dir_when_folder_not_writable(tmp_path, monkeypatch):
+    l = make_log_with_cfg(tmp_path / 'readonly')
+    temp_dir = tmp_path / 'fallback'
+    temp_dir.mkdir()
+    monkeypatch.setattr('tempfile.gettempdir', lambda: str(temp_dir))
+    monkeypatch.setattr(l, 'folder_is_writable', lambda folder: False)
+
+    driver = types.SimpleNamespace(get_screenshot_as_png=lambda: b'screenshot')
+    l.take_screenshot_log(driver, description='ro', stack_item='testcase_456')
+
+    assert list(temp_dir.glob('*_testcase_456_ro.png'))
+
+
+def test_folder_writable_check_is_cached(tmp_path, monkeypatch):
+    l = make_log_with_cfg(tmp_path)
+    diagnostics = []
+    monkeypatch.setattr(l, 'diagnostic_io', lambda folder: diagnostics.append(folder) or {})
+
+    folder = tmp_path / 'shots'
+    assert l.folder_is_writable(folder)
+    assert l.folder_is_writable(folder)
+    assert len(diagnostics) == 1
+    assert not list(folder.glob('.write_test_*'))
+
+
+def test_log_sender_retries_with_backoff_until_success():
+    sender = log_sender_mod.LogSender(backoff_base=0.01)
+    attempts = []
+    fallback = []
+
+    def job(attempt):
+        attempts.append(attempt)
+        return attempt == 3
+
+    sender.submit(job, fallback=lambda: fallback.append(True))
+    assert sender.flush(timeout=5)
+    assert attempts == [1, 2, 3]
+    assert not fallback
+
+
+def test_log_sender_calls_fallback_when_all_attempts_fail():
+    sender = log_sender_mod.LogSender(backoff_base=0.01)
+    fallback = []
+
+    sender.submit(lambda attempt: False, fallback=lambda: fallback.append(True), max_retries=2)
+    assert sender.flush(timeout=5)
+    assert fallback == [True]
+
+
+def test_log_sender_backoff_is_capped():
+    sender = log_sender_mod.LogSender(backoff_base=1.0, backoff_max=5.0)
+    assert [sender.backoff_delay(attempt) for attempt in range(1, 6)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+
+def test_log_sender_flush_timeout_saves_in_flight_job_once():
+    import threading
+    sender = log_sender_mod.LogSender(backoff_base=0.01)
+    started, release = threading.Event(), threading.Event()
+    fallback = []
+
+    def job(attempt):
+        started.set()
+        release.wait(5)
+        return False
+
+    sender.submit(job, fallback=lambda: fallback.append('in flight'), max_retries=1)
+    sender.submit(lambda attempt: True, fallback=lambda: fallback.append('queued'))
+    assert started.wait(5)
+
+    assert not sender.flush(timeout=0.2)
+    assert sorted(fallback) == ['in flight', 'queued']
+
+    release.set()
+    assert sender.flush(timeout=5)
+    assert sorted(fallback) == ['in flight', 'queued']
+
+
+def test_send_log_with_retries_async_does_not_block(tmp_path, monkeypatch):
+    l = Log(user='tester', station='station')
+    l.config.async_log = True
+    submitted = []
+
+    class FakeSender:
+        def submit(self, job, fallback=None, max_retries=4):
+            submitted.append((job, fallback, max_retries))
+
+    monkeypatch.setattr(mod, 'log_sender', lambda: FakeSender())
+    monkeypatch.setattr(l, 'post_log', lambda body, attempt, api_url, api_url_ip: 400)
+
+    l.send_log_with_retries({'cLogProgra': 'MATA010'}, 'http://api', 'http://ip', str(tmp_path))
+
+    job, fallback, max_retries = submitted[0]
+    assert max_retries == 4
+    assert job(1) is False
+    fallback()
+    log_spool_mod.close_spools()
+    saved = list(tmp_path.glob('*.ndjson'))
+    assert saved and 'MATA010' in saved[0].read_text()
+
+
+def test_log_spool_appends_records_and_replay_truncates(tmp_path, monkeypatch):
+    spool = log_spool_mod.LogSpool(tmp_path, fsync_every=2)
+    for number in range(5):
+        spool.append(['http://api/createlog/'], json.dumps({'CTNUMBER': number}))
+    spool.close()
+
+    lines = spool.path.read_text(encoding='utf-8').splitlines()
+    assert len(lines) == 5
+
+    posted = []
+    def post_record(urls, body, timeout):
+        posted.append(json.loads(body))
+        return len(posted) <= 3
+
+    monkeypatch.setattr(log_spool_mod, 'post_record', post_record)
+
+    assert log_spool_mod.replay(tmp_path, batch_size=2) == 3
+    remaining = [json.loads(line)['data']['CTNUMBER'] for line in spool.path.read_text(encoding='utf-8').splitlines()]
+    assert remaining == [3, 4]
+
+    monkeypatch.setattr(log_spool_mod, 'post_record', lambda urls, body, timeout: True)
+    assert log_spool_mod.replay(tmp_path, batch_size=2) == 2
+    assert not spool.path.exists()
+
+
+def test_log_spool_bulk_replay_posts_arrays(tmp_path, monkeypatch):
+    spool = log_spool_mod.LogSpool(tmp_path)
+    for number in range(3):
+        spool.append(['http://api/createlog/'], json.dumps({'CTNUMBER': number}))
+    spool.close()
+
+    posted = []
+    monkeypatch.setattr(log_spool_mod, 'post_record', lambda urls, body, timeout: posted.append(json.loads(body)) or True)
+
+    assert log_spool_mod.replay(tmp_path, batch_size=10, bulk=True) == 3
+    assert posted == [[{'CTNUMBER': 0}, {'CTNUMBER': 1}, {'CTNUMBER': 2}]]
+
+
+def test_log_spool_replay_skips_spool_locked_by_writer(tmp_path, monkeypatch):
+    spool = log_spool_mod.LogSpool(tmp_path)
+    spool.append(['http://api/createlog/'], json.dumps({'CTNUMBER': 0}))
+
+    posted = []
+    monkeypatch.setattr(log_spool_mod, 'post_record', lambda urls, body, timeout: posted.append(json.loads(body)) or True)
+
+    assert log_spool_mod.replay(tmp_path) == 0
+    spool.append(['http://api/createlog/'], json.dumps({'CTNUMBER': 1}))
+    spool.close()
+
+    assert log_spool_mod.replay(tmp_path) == 2
+    assert posted == [{'CTNUMBER': 0}, {'CTNUMBER': 1}]
+    assert not list(tmp_path.iterdir())
+
+    spool.append(['http://api/createlog/'], json.dumps({'CTNUMBER': 2}))
+    spool.close()
+    assert [json.loads(line)['data'] for line in spool.path.read_text(encoding='utf-8').splitlines()] == [{'CTNUMBER': 2}]
+
+
+def test_http_post_uses_shared_session_with_endpoint_timeout(monkeypatch):
+    calls = []
+
+    class FakeSession:
+        def post(self, url, **kwargs):
+            calls.append((url, kwargs))
+            return types.SimpleNamespace(status_code=201)
+
+    session = FakeSession()
+    monkeypatch.setattr(http_session_mod, 'http_session', lambda: session)
+    before = http_session_mod.http_metrics().get('createlog_ip', {}).get('requests', 0)
+
+    response = http_session_mod.post('createlog_ip', 'http://ip/createlog/', data='{}')
+
+    assert response.status_code == 201
+    assert calls[0][1]['timeout'] == http_session_mod.ENDPOINT_TIMEOUTS['createlog_ip']
+    assert http_session_mod.http_metrics()['createlog_ip']['requests'] == before + 1
+
+
+def test_save_file_appends_only_new_rows_to_results_store(tmp_path):
+    l = Log(user='tester', station='station', folder=str(tmp_path), program='MATA010', release='12.1.2410')
+    l.config.results_store = True
+
+    l.new_line(True, '')
+    l.save_file()
+    l.test_case_log = []
+    l.new_line(False, 'field; error')
+    l.save_file()
+    l.save_file()
+
+    stores = list(Path(tmp_path, 'station_v6').glob('*' + results_store_mod.RESULTS_SUFFIX))
+    assert len(stores) == 1
+    assert not list(Path(tmp_path, 'station_v6').glob('*_auto.csv'))
+
+    rows = results_store_mod.read_rows(stores, program='MATA010')
+    assert [row[6] for row in rows] == [1, 0]
+    assert rows[1][11] == 'field, error'
+
+    csv_path = tmp_path / 'export.csv'
+    assert results_store_mod.export_csv(stores, csv_path) == 2
+    lines = csv_path.read_text(encoding='windows-1252').splitlines()
+    assert lines[0] == ';'.join(l.generate_header())
+    assert lines[1].startswith('"') and ';1;1;0;' in lines[1]
+
+
+def test_rotating_log_handler_compresses_and_indexes_segments(tmp_path):
+    handler_spec = importlib.util.spec_from_file_location('tir_logging_config', str(repo_root / 'tir' / 'technologies' / 'core' / 'logging_config.py'))
+    logging_config_mod = importlib.util.module_from_spec(handler_spec)
+    handler_spec.loader.exec_module(logging_config_mod)
+
+    handler = logging_config_mod.RotatingLogHandler(str(tmp_path / 'TIR_suite_1.log'), max_bytes=1000)
+    test_logger = logging.getLogger('test_rotating_log_handler')
+    test_logger.propagate = False
+    test_logger.addHandler(handler)
+    test_logger.setLevel(logging.DEBUG)
+
+    for number in range(100):
+        test_logger.debug(f'line {number} ' + 'x' * 40)
+
+    test_logger.removeHandler(handler)
+    handler.close()
+
+    segments = sorted(tmp_path.glob('TIR_suite_1.*.log.gz'))
+    assert segments
+    assert not list(tmp_path.glob('TIR_suite_1.*.log'))
+    index = (tmp_path / 'TIR_index.csv').read_text(encoding='utf-8').splitlines()
+    assert len(index) == len(segments) + 1
+    assert index[-1].startswith('TIR_suite_1.log;')
+
+
+def test_new_line_records_execution_history(tmp_path):
+    l = Log(user='tester', station='station', program='MATA010')
+    l.config.history_path = str(tmp_path / 'history.db')
+    l.seconds = 12.5
+
+    l.new_line(False, 'error')
+
+    slowest = history_mod.ExecutionHistory(l.config.history_path).slowest()
+    assert slowest[0]['program'] == 'MATA010'
+    assert slowest[0]['average'] == 12.5
+
+
+def test_execution_history_regressions_and_flaky(tmp_path):
+    history = history_mod.ExecutionHistory(tmp_path / 'history.db')
+    for seconds, passed in [(10, True), (11, True), (9, True), (30, True)]:
+        history.record('SUITE', 'test_slow', 'MATA010', seconds, passed)
+    for passed in [True, False, True, False]:
+        history.record('SUITE', 'test_flaky', 'MATA020', 5, passed, '' if passed else 'error')
+
+    regressions = history.regressions(threshold=0.5)
+    assert [row['testcase'] for row in regressions] == ['test_slow']
+    assert regressions[0]['baseline'] == 10
+
+    flaky = history.flaky()
+    assert flaky[0]['testcase'] == 'test_flaky'
+    assert flaky[0]['flakiness'] == 1.0
+    assert history.slowest(limit=1)[0]['testcase'] == 'test_slow'
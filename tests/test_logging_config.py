@@ -0,0 +1,81 @@
+"""Unit tests for the QueueListener of the TIR logger."""
+
+import io
+import json
+import logging
+import sys
+import types
+import unittest
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(repo_root))
+
+from tir.technologies.core import logging_config
+
+
+class TestQueueListener(unittest.TestCase):
+    """Test cases for start_queue_listener and stop_queue_listener."""
+
+    def setUp(self):
+        self.saved_config = logging_config.config
+        logging_config.config = types.SimpleNamespace(log_record_queue_size=10)
+        self.stream = io.StringIO()
+        handler = logging.StreamHandler(self.stream)
+        handler.setFormatter(logging_config.JsonFormatter())
+        self.logger = logging.getLogger(f"tir_test_{id(self)}")
+        self.logger.propagate = False
+        self.logger.addHandler(handler)
+        self.handler = handler
+
+    def tearDown(self):
+        logging_config.stop_queue_listener()
+        self.logger.removeHandler(self.handler)
+        logging_config.config = self.saved_config
+
+    def records(self):
+        return [json.loads(line) for line in self.stream.getvalue().splitlines()]
+
+    def test_exception_reaches_the_json_formatter(self):
+        """exc_info survives the queue, so the JSON line has the exception field."""
+        logging_config.start_queue_listener(self.logger)
+        self.assertIsInstance(self.logger.handlers[0], logging_config.BlockingQueueHandler)
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            self.logger.exception("failed %s", "MATA010")
+        logging_config.stop_queue_listener()
+
+        record = self.records()[0]
+        self.assertEqual(record["message"], "failed MATA010")
+        self.assertIn("ValueError: boom", record["exception"])
+
+    def test_records_after_stop_are_written(self):
+        """Stopping the listener gives the handlers back to the logger."""
+        logging_config.start_queue_listener(self.logger)
+        self.logger.warning("queued")
+        logging_config.stop_queue_listener()
+        self.logger.warning("after stop")
+
+        self.assertEqual([record["message"] for record in self.records()], ["queued", "after stop"])
+        self.assertEqual(self.logger.handlers, [self.handler])
+
+    def test_exit_handler_is_registered_once(self):
+        """Restarting the listener doesn't register stop_queue_listener again."""
+        registered = []
+        saved = (logging_config.atexit.register, logging_config._exit_registered)
+        logging_config.atexit.register = registered.append
+        logging_config._exit_registered = False
+        try:
+            logging_config.start_queue_listener(self.logger)
+            logging_config.start_queue_listener(self.logger)
+        finally:
+            logging_config.atexit.register, logging_config._exit_registered = saved
+
+        self.assertEqual(registered, [logging_config.stop_queue_listener])
+        self.assertEqual(len(self.logger.handlers), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+"""Unit tests for the soft recovery of WebappInternal after an error."""
+
+import sys
+import types
+import unittest
+import unittest.mock
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(repo_root))
+
+from tir.technologies import webapp_internal
+
+
+def webapp(**config):
+    """Returns a WebappInternal with only the state used by the recovery, without a browser."""
+    instance = webapp_internal.WebappInternal.__new__(webapp_internal.WebappInternal)
+    instance.config = types.SimpleNamespace(**{"soft_recovery": True, "routine": "MATA010", "routine_type": "SetLateralMenu",
+                                               "time_out": 2, **config})
+    instance.recovering = False
+    instance.restarting = False
+    instance.restart_counter = 0
+    instance.calls = []
+    return instance
+
+
+class TestRecovery(unittest.TestCase):
+    """Test cases for recover, soft_reset and restore_routine."""
+
+    def test_soft_reset_stops_the_recovery(self):
+        """When the routine opens again after escaping to the menu, the browser isn't reloaded."""
+        instance = webapp()
+        instance.soft_reset = lambda: instance.calls.append("soft") or True
+        instance.restart = lambda refresh=False: instance.calls.append(("restart", refresh))
+
+        instance.recover("test_MATA010_CT001")
+
+        self.assertEqual(instance.calls, ["soft"])
+        self.assertFalse(instance.recovering)
+
+    def test_routine_not_reopened_tries_the_next_step(self):
+        """soft_reset fails when the routine doesn't open again, so the page is reloaded."""
+        instance = webapp()
+        instance.escape_to_main_menu = lambda timeout=None, log_error=True: True
+        instance.routine_open = lambda: False
+        opened = []
+        instance.restart = lambda refresh=False: instance.calls.append(("restart", refresh))
+
+        with unittest.mock.patch("tir.technologies.core.events.emit", lambda *args, **kwargs: opened.append(args)):
+            instance.recover("test_MATA010_CT001")
+
+        self.assertEqual(opened, [("route.set_lateral_menu", "MATA010")])
+        self.assertEqual(instance.calls, [("restart", True)])
+
+    def test_log_error_inside_a_step_does_not_recover_again(self):
+        """Errors logged during the recovery fail the current step instead of starting a nested one."""
+        instance = webapp()
+        recover = instance.recover
+        nested = []
+        instance.recover = lambda stack_item="": nested.append(stack_item) or recover(stack_item)
+        instance.soft_reset = lambda: instance.log_error("Menu item not found")
+        instance.restart = lambda refresh=False: instance.calls.append(("restart", refresh))
+
+        recover("test_MATA010_CT001")
+
+        self.assertEqual(nested, [])
+        self.assertEqual(instance.calls, [("restart", True)])
+
+    def test_setupclass_restarts_the_browser(self):
+        """Errors in setUpClass skip the soft steps."""
+        instance = webapp()
+        instance.soft_reset = lambda: instance.calls.append("soft") or True
+        instance.restart = lambda refresh=False: instance.calls.append(("restart", refresh))
+
+        instance.recover("setUpClass")
+
+        self.assertEqual(instance.calls, [("restart", False)])
+
+    def test_errors_during_the_browser_restart_retry_and_fail(self):
+        """Errors logged while the browser restarts restart it again, and the third one logs the row, closes the driver and fails."""
+        from tir.technologies.core.session import Session
+
+        instance = webapp(initial_program="SIGAFAT", skip_restart=False, smart_test=False, debug_log=False,
+                          new_log=False, screenshot=True, coverage=False, num_exec=False, check_dump=False)
+        instance.session = Session("recovery")
+        instance.driver = unittest.mock.MagicMock()
+        instance.blocker = None
+        instance.clear_grid = lambda: None
+        instance.log = unittest.mock.MagicMock(test_case_log=[])
+        instance.log.get_testcase_stack.return_value = "setUpClass"
+        instance.log.list_of_testcases.return_value = ["test_MATA010_CT001"]
+        instance.log.ident_test.return_value = ("setUpClass", "")
+        instance.utils = unittest.mock.MagicMock()
+        instance.utils.get_main_entrypoint_from_stack.return_value = "function_name"
+        restarts = []
+
+        def restart(refresh=False):
+            restarts.append(refresh)
+            if instance.restart_counter < 3:
+                instance.restart_counter += 1
+                instance.log_error("Couldn't find '[name=cUser]' element.")
+
+        instance.restart = restart
+
+        with self.assertRaises(AssertionError) as context:
+            instance.log_error("Couldn't find the environment.")
+
+        self.assertIn("Couldn't find '[name=cUser]' element.", str(context.exception))
+        self.assertNotIn("[Recovery]", str(context.exception))
+        self.assertEqual(restarts, [False] * 4)
+        instance.log.new_line.assert_called_once_with(False, "setUpClass - Couldn't find '[name=cUser]' element.")
+        instance.log.take_screenshot_log.assert_called_once()
+        instance.driver.close.assert_called_once()
+        self.assertEqual((instance.recovering, instance.restarting), (False, False))
+
+    def test_restore_routine_without_routine(self):
+        """Suites without a routine have nothing to reopen."""
+        self.assertTrue(webapp(routine="").restore_routine())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""Unit tests for the report normalizer and diff engine."""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(repo_root))
+
+from tir.technologies.core.report_comparison import (DATE_LABELS, MAX_BLOCK_LINES, TIME_LABELS, iter_differences,
+                                                     normalize, normalize_file, rule_set)
+
+
+class TestReportComparison(unittest.TestCase):
+    """Test cases for rule_set, normalize_file and iter_differences."""
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def write(self, name, lines):
+        path = Path(self.folder.name, name)
+        path.write_text("".join(f"{line}\n" for line in lines), encoding="utf-8")
+        return str(path)
+
+    def test_report_rules(self):
+        """Dates, times and slashes of .##r reports and the volatile attributes of .xml reports are fixed."""
+        rules = rule_set(".##r", DATE_LABELS, TIME_LABELS)
+
+        self.assertEqual(normalize("Emissão: 19-10-2026 DT.Ref.: 18-10-2026 Hora...: 10:11:12 1/2\n", rules),
+                         "Emissão: 01-01-2015 DT.Ref.: 01-01-2015 Hora...: 00:00:00 1@2\n")
+        self.assertEqual(normalize("Hora Término: 23:59:59\n", rules), "Hora Término: 00:00:00\n")
+        self.assertEqual(normalize('<?xml encoding="UTF-8"?><Data ss:Type="DateTime">2026-10-19T10:11:12</Data><Column ss:Width="37"/>',
+                                   rule_set(".XML")),
+                         '<?xml encoding=""?><Data ss:Type="DateTime">2015-01-01T00:00:00</Data><Column ss:Width="100"/>')
+        self.assertIs(rule_set(".##r", DATE_LABELS, TIME_LABELS), rules)
+
+    def test_normalize_file_matches_line_by_line(self):
+        """The auto file is the same as normalizing each line on its own."""
+        lines = [f"Emissão: {day:02d}-10-2026 Pedido {day}/{day + 1}" for day in range(1, 29)]
+        source = self.write("report.##r", lines)
+        target = str(Path(self.folder.name, "reportauto.##r"))
+        rules = rule_set(".##r", DATE_LABELS, TIME_LABELS)
+
+        self.assertEqual(normalize_file(source, target, rules, encoding="utf-8"), len(lines))
+        self.assertEqual(Path(target).read_text(encoding="utf-8"), "".join(normalize(f"{line}\n", rules) for line in lines))
+
+    def test_iter_differences_reports_every_block(self):
+        """Every block of differing lines is reported with its line numbers and context, also when memory-mapped."""
+        base = [f"line {index}" for index in range(1, 21)]
+        current = list(base)
+        current[2] = "changed 3"
+        current[3] = "changed 4"
+        current[14] = "changed 15"
+        current.append("extra 21")
+        base_path, current_path = self.write("base.##r", base), self.write("auto.##r", current)
+
+        for use_mmap in (False, True):
+            differences = list(iter_differences(base_path, current_path, context=1, use_mmap=use_mmap, encoding="utf-8"))
+
+            self.assertEqual([(difference.line, difference.last_line) for difference in differences], [(3, 4), (15, 15), (21, 21)])
+            self.assertEqual((differences[0].before, differences[0].base, differences[0].current, differences[0].after),
+                             (["line 2"], ["line 3", "line 4"], ["changed 3", "changed 4"], ["line 5"]))
+            self.assertEqual((differences[2].base, differences[2].current), ([], ["extra 21"]))
+            self.assertIn("  + 15  changed 15", str(differences[1]))
+
+        self.assertEqual(list(iter_differences(base_path, base_path)), [])
+
+    def test_iter_differences_synchronizes_after_inserted_and_deleted_lines(self):
+        """An inserted or deleted line is reported alone instead of shifting every following line."""
+        base = [f"line {index}" for index in range(1, 5001)]
+        current = base[:9] + ["inserted"] + base[9:2999] + base[3000:]
+        base_path, current_path = self.write("base.##r", base), self.write("auto.##r", current)
+
+        for use_mmap in (False, True):
+            differences = list(iter_differences(base_path, current_path, context=1, use_mmap=use_mmap, encoding="utf-8"))
+
+            self.assertEqual([(difference.line, difference.current_line, difference.base, difference.current) for difference in differences],
+                             [(10, 10, [], ["inserted"]), (3000, 3001, ["line 3000"], [])])
+            self.assertEqual((differences[0].before, differences[0].after), (["line 9"], ["line 10"]))
+            self.assertEqual(str(differences[0]), "Report difference in line 10:\n    9  line 9\n  + 10  inserted\n    10  line 10")
+
+    def test_iter_differences_limits_the_lines_of_a_block(self):
+        """Blocks keep up to MAX_BLOCK_LINES lines of each file and count the other ones."""
+        base = [f"line {index}" for index in range(1, 1001)]
+        current = ["changed"] * 1000
+        base_path, current_path = self.write("base.##r", base), self.write("auto.##r", current)
+
+        differences = list(iter_differences(base_path, current_path, encoding="utf-8"))
+
+        self.assertEqual(len(differences), 1)
+        self.assertEqual((len(differences[0].base), differences[0].base_count, differences[0].current_count), (MAX_BLOCK_LINES, 1000, 1000))
+        self.assertEqual(differences[0].last_line, 1000)
+        self.assertIn(f"  + ... {1000 - MAX_BLOCK_LINES} more line(s)", str(differences[0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""Unit tests for the duration-aware sharding and the work queue."""
+
+import json
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(repo_root))
+
+from tir.technologies.core.scheduler import (WorkQueue, plan_shards, predict, read_manifest, resolve_file,
+                                              results_durations, write_manifests)
+
+
+class TestScheduler(unittest.TestCase):
+    """Test cases for plan_shards, predict, results_durations, the manifests and WorkQueue."""
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = Path(self.folder.name)
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_plan_shards_balances_longest_first(self):
+        """Files are assigned longest first to the shard with the lowest load."""
+        plan = plan_shards({"a.py": 7, "b.py": 5, "c.py": 4, "d.py": 3, "e.py": 3}, shards=2)
+
+        self.assertEqual([[item["file"] for item in shard["files"]] for shard in plan], [["a.py", "d.py"], ["b.py", "c.py", "e.py"]])
+        self.assertEqual([shard["predicted_seconds"] for shard in plan], [10, 12])
+        self.assertEqual(plan_shards({"a.py": 1}, shards=0)[0]["files"], [{"file": "a.py", "predicted_seconds": 1}])
+
+    def test_predict_uses_history_then_results_then_median(self):
+        """Suites are predicted by name, then by program, and the unknown ones by the median."""
+        predicted = predict(["MATA010TESTSUITE.py", "MATA020TESTSUITE.py", "MATA030TESTSUITE.py", "MATA040TESTSUITE.py"],
+                            history={"MATA010TESTSUITE": 10}, results={"MATA020": 30, "MATA030": 20})
+
+        self.assertEqual(predicted, {"MATA010TESTSUITE.py": 10, "MATA020TESTSUITE.py": 30,
+                                     "MATA030TESTSUITE.py": 20, "MATA040TESTSUITE.py": 20})
+
+    def test_results_durations_reads_each_run_once(self):
+        """The cumulative CSV files of a suite run count its seconds once."""
+        header = "Data;Usuário;Estação;Programa;Data Programa;Total CTs;Passou;Falhou;Segundos\r\n"
+        rows = ['"19/10/2026";"tir";"st01";"MATA010";"";1;1;0;10\r\n', '"19/10/2026";"tir";"st01";"MATA010";"";1;1;0;20\r\n',
+                '"20/10/2026";"tir";"st01";"MATA010";"";1;1;0;50\r\n']
+        folder = Path(self.path, "Log", "st01")
+        folder.mkdir(parents=True)
+        Path(folder, "tir_1_auto.csv").write_text(header + rows[0], encoding="windows-1252")
+        Path(folder, "tir_2_auto.csv").write_text(header + rows[0] + rows[1], encoding="windows-1252")
+        Path(folder, "tir_3_auto.csv").write_text(header + rows[2], encoding="windows-1252")
+
+        self.assertEqual(results_durations([Path(self.path, "Log")]), {"MATA010": 40})
+
+    def test_manifests_keep_files_relative_to_their_folder(self):
+        """A manifest copied with its suites to another checkout reads the files of that checkout."""
+        suite = Path(self.path, "agent01", "tests", "MATA010TESTSUITE.py")
+        suite.parent.mkdir(parents=True)
+        suite.touch()
+        manifest = write_manifests(plan_shards({str(suite): 10}, shards=1), Path(self.path, "agent01", "manifests"))[0]
+
+        self.assertEqual(json.loads(manifest.read_text(encoding="utf-8"))["files"][0]["file"], "../tests/MATA010TESTSUITE.py")
+
+        shutil.copytree(Path(self.path, "agent01"), Path(self.path, "agent02"))
+        files = read_manifest(Path(self.path, "agent02", "manifests", manifest.name))
+        self.assertEqual(files, [{"file": str(Path(self.path, "agent02", "tests", "MATA010TESTSUITE.py").resolve()),
+                                  "predicted_seconds": 10}])
+        self.assertTrue(Path(files[0]["file"]).is_file())
+
+        self.assertEqual(resolve_file("../tests/MATA010TESTSUITE.py", Path(self.path, "agent02", "manifests")), Path(files[0]["file"]))
+        self.assertEqual(resolve_file(str(suite), Path(self.path, "agent02", "manifests")), suite.resolve())
+
+    def test_work_queue_claims_longest_and_reclaims_expired_leases(self):
+        """Files are claimed longest first and a file whose lease expired is claimed again."""
+        work_queue = WorkQueue(Path(self.path, "queue.db"), lease_seconds=60)
+        work_queue.put([{"file": "short.py", "predicted_seconds": 5}, {"file": "long.py", "predicted_seconds": 50}], shard=0)
+
+        dead = work_queue.claim("agent01-worker0")
+        self.assertEqual(dead["file"], "long.py")
+        self.assertTrue(work_queue.renew(dead["id"]))
+        self.assertEqual(work_queue.claim("agent01-worker1")["file"], "short.py")
+        self.assertIsNone(work_queue.claim("agent02-worker0"))
+
+        connection = work_queue.connect()
+        connection.execute("UPDATE queue SET expires = ? WHERE id = ?", (time.time() - 1, dead["id"]))
+        connection.close()
+
+        item = work_queue.claim("agent02-worker0")
+        self.assertEqual((item["id"], item["file"]), (dead["id"], "long.py"))
+        work_queue.done(item["id"], returncode=0, seconds=48)
+        self.assertFalse(work_queue.renew(item["id"]))
+        self.assertEqual(work_queue.status(), {"done": 1, "running": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
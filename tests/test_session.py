@@ -0,0 +1,71 @@
+"""Unit tests for the per-session driver, wait and errors of the technology instances."""
+
+import sys
+import threading
+import unittest
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(repo_root))
+
+from tir.technologies.core import base as base_module
+from tir.technologies.core.session import Session, current_session, use_session
+
+
+def instance():
+    """Returns a Base bound to the current session without starting a browser."""
+    base = base_module.Base.__new__(base_module.Base)
+    base.session = current_session()
+    return base
+
+
+class TestSessionRegistry(unittest.TestCase):
+    """Test cases for the session-backed Base.driver, Base.wait and Base.errors."""
+
+    def test_instances_of_a_session_share_its_state(self):
+        """Instances of the same session see the driver, wait and errors set by each other."""
+        with use_session(Session("shared")):
+            webapp, poui = instance(), instance()
+            webapp.driver, webapp.wait = "driver", "wait"
+            poui.errors.append("error")
+
+        self.assertEqual((poui.driver, poui.wait), ("driver", "wait"))
+        self.assertEqual(webapp.errors, ["error"])
+
+    def test_sessions_are_isolated(self):
+        """Two sessions keep their own driver, wait and errors."""
+        with use_session(Session("first")):
+            first = instance()
+        with use_session(Session("second")):
+            second = instance()
+
+        first.driver, first.wait = "driver 1", "wait 1"
+        first.errors.append("error 1")
+        second.driver = "driver 2"
+        second.errors = ["error 2"]
+
+        self.assertEqual((first.driver, first.wait, first.errors), ("driver 1", "wait 1", ["error 1"]))
+        self.assertEqual((second.driver, second.wait, second.errors), ("driver 2", None, ["error 2"]))
+
+    def test_threads_bind_their_own_session(self):
+        """Instances created in threads bound to different sessions don't share drivers."""
+        instances = {}
+
+        def worker(name):
+            with use_session(Session(name)):
+                instances[name] = instance()
+                instances[name].driver = f"{name} driver"
+
+        threads = [threading.Thread(target=worker, args=(f"worker-{index}",)) for index in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual({name: base.driver for name, base in instances.items()},
+                         {f"worker-{index}": f"worker-{index} driver" for index in range(3)})
+        self.assertIsNone(instance().driver)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""Unit tests for the warm browser session pool."""
+
+import sys
+import types
+import unittest
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(repo_root))
+
+from tir.technologies.core.session_pool import SessionPool
+
+
+class FakeDriver:
+    """WebDriver double that records quit and can lose its session."""
+
+    def __init__(self):
+        self.alive = True
+        self.quits = 0
+
+    @property
+    def current_url(self):
+        if not self.alive:
+            raise RuntimeError("invalid session id")
+        return "http://localhost:1234"
+
+    def quit(self):
+        self.quits += 1
+        self.alive = False
+
+
+class TestSessionPool(unittest.TestCase):
+    """Test cases for SessionPool.acquire and release."""
+
+    def setUp(self):
+        self.config = types.SimpleNamespace(url="http://localhost:1234", environment="ENV01", user="admin", browser="Chrome")
+        self.pool = SessionPool(max_uses=2)
+
+    def entry(self, driver=None, uses=1):
+        return {"key": self.pool.key(self.config), "driver": driver or FakeDriver(), "wait": None, "uses": uses,
+                "login": {"initial_program": "SIGAADV", "environment": ("01/01/2015", "99", "01", "01")}}
+
+    def test_released_browser_is_reused_by_the_same_key(self):
+        """A healthy browser goes back to the pool and is served to the next suite of the same key."""
+        entry = self.entry()
+
+        self.assertTrue(self.pool.release(entry))
+        self.assertIsNone(self.pool.acquire(types.SimpleNamespace(**{**vars(self.config), "user": "tir02"})))
+
+        acquired = self.pool.acquire(self.config)
+        self.assertIs(acquired, entry)
+        self.assertEqual(acquired["uses"], 2)
+        self.assertIsNone(self.pool.acquire(self.config))
+
+    def test_unhealthy_browser_is_closed(self):
+        """Browsers of suites with errors are closed instead of pooled."""
+        entry = self.entry()
+
+        self.assertFalse(self.pool.release(entry, healthy=False))
+        self.assertEqual(entry["driver"].quits, 1)
+        self.assertIsNone(self.pool.acquire(self.config))
+
+    def test_browser_is_closed_after_max_uses(self):
+        """A browser that served max_uses suites is closed on release."""
+        entry = self.entry(uses=2)
+
+        self.assertFalse(self.pool.release(entry))
+        self.assertEqual(entry["driver"].quits, 1)
+
+    def test_dead_browser_is_skipped_on_acquire(self):
+        """Idle browsers whose WebDriver session died are discarded when acquired."""
+        entry = self.entry()
+        self.pool.release(entry)
+        entry["driver"].alive = False
+
+        self.assertIsNone(self.pool.acquire(self.config))
+        self.assertEqual(entry["driver"].quits, 1)
+
+    def test_close_quits_idle_browsers(self):
+        """close quits every idle browser."""
+        entry = self.entry()
+        self.pool.release(entry)
+
+        self.pool.close()
+        self.assertEqual(entry["driver"].quits, 1)
+        self.assertIsNone(self.pool.acquire(self.config))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""Unit tests for the startup profiler."""
+
+import json
+import os
+import socket
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+repo_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(repo_root))
+
+from tir.technologies.core.startup_profiler import METRICS_FILE, StartupProfiler, startup_phase
+
+
+class Instance:
+    """Technology instance with a profiled startup method."""
+
+    def __init__(self, profiler=None):
+        self.startup = profiler
+
+    @startup_phase
+    def get_url(self, url):
+        return url
+
+
+class TestStartupProfiler(unittest.TestCase):
+    """Test cases for StartupProfiler summary, trace_events and finish and for startup_phase."""
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.profiler = StartupProfiler("WebappInternal", min_seconds=0)
+
+        patcher = patch("tir.technologies.core.startup_profiler.logger", MagicMock())
+        self.logger = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def profile(self):
+        """Records two user_screen phases, the second one nested in program_screen."""
+        with self.profiler.phase("user_screen"):
+            pass
+        with self.profiler.phase("program_screen"):
+            with self.profiler.phase("user_screen"):
+                pass
+
+    def test_summary_and_trace_events(self):
+        """Phases are summed by name, longest first, and exported as complete trace events with their depth."""
+        self.profile()
+        for event, seconds in zip(self.profiler.events, (0.5, 0.25, 1.0)):
+            event["seconds"] = seconds
+
+        summary = self.profiler.summary()
+        self.assertEqual(summary["phases"], {"program_screen": {"calls": 1, "seconds": 1.0},
+                                             "user_screen": {"calls": 2, "seconds": 0.75}})
+        self.assertGreaterEqual(summary["total"], 0)
+
+        events = self.profiler.trace_events()
+        self.assertEqual([(event["name"], event["ph"], event["dur"], event["args"]["depth"]) for event in events],
+                         [("user_screen", "X", 500000, 0), ("user_screen", "X", 250000, 1), ("program_screen", "X", 1000000, 0)])
+        self.assertEqual({event["pid"] for event in events}, {os.getpid()})
+
+    def test_finish_writes_metrics_and_trace(self):
+        """With StartupProfile and StartupTrace the metrics line and the trace file are written, once."""
+        self.profile()
+        config = types.SimpleNamespace(startup_profile=True, startup_trace=True)
+
+        summary = self.profiler.finish(config, self.folder.name, {"program": "SIGAFAT"})
+
+        path = Path(self.folder.name, "startup")
+        metrics = [json.loads(line) for line in Path(path, METRICS_FILE).read_text(encoding="utf-8").splitlines()]
+        self.assertEqual(len(metrics), 1)
+        self.assertEqual((metrics[0]["program"], metrics[0]["name"], metrics[0]["phases"]), ("SIGAFAT", "WebappInternal", summary["phases"]))
+
+        trace_files = list(path.glob("WebappInternal_*.trace.json"))
+        self.assertEqual(len(trace_files), 1)
+        self.assertEqual(len(json.loads(trace_files[0].read_text(encoding="utf-8"))["traceEvents"]), 3)
+
+        self.assertIsNone(self.profiler.finish(config, self.folder.name))
+        with self.profiler.phase("after_menu"):
+            pass
+        self.assertEqual(len(self.profiler.events), 3)
+
+    def test_finish_uses_the_log_folder_of_the_station(self):
+        """Without LogFolder the files go to the station folder of Log, and nothing is written without StartupProfile."""
+        cwd = os.getcwd()
+        os.chdir(self.folder.name)
+        self.addCleanup(os.chdir, cwd)
+
+        StartupProfiler().finish(types.SimpleNamespace(startup_profile=False, startup_trace=False))
+        self.assertFalse(Path(self.folder.name, "Log").exists())
+
+        with patch.object(sys, "platform", "win32"):
+            self.profiler.finish(types.SimpleNamespace(startup_profile=True, startup_trace=False))
+
+        self.assertTrue(Path(self.folder.name, "Log", socket.gethostname(), "startup", METRICS_FILE).is_file())
+
+    def test_startup_phase_decorator(self):
+        """Decorated methods are recorded while the profiler is active and just called otherwise."""
+        self.assertEqual(Instance(self.profiler).get_url("http://localhost"), "http://localhost")
+        self.assertEqual([event["name"] for event in self.profiler.events], ["get_url"])
+
+        self.profiler.active = False
+        self.assertEqual(Instance(self.profiler).get_url("http://localhost"), "http://localhost")
+        self.assertEqual(Instance().get_url("http://localhost"), "http://localhost")
+        self.assertEqual(len(self.profiler.events), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+"""Unit tests for the parallel suite runner."""
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(repo_root))
+
+from tir.technologies.core.suite_runner import SuiteRunner, collect_files
+
+# Suite that saves its Log rows twice, like Log.save_file: each file has every row so far.
+SUITE = """import json, os, sys, uuid
+from pathlib import Path
+sys.path.insert(0, {root!r})
+from tir.technologies.core.config import OVERRIDES_ENV
+folder = Path(json.loads(os.environ[OVERRIDES_ENV])["LogFolder"], "station_v6")
+folder.mkdir(parents=True, exist_ok=True)
+rows = ["Suite;Case\\r\\n"]
+for case in (1, 2):
+    rows.append('"{name}";"case %d"\\r\\n' % case)
+    Path(folder, f"tester_{{uuid.uuid4().hex}}_auto.csv").write_text("".join(rows), encoding="windows-1252")
+"""
+
+
+class TestSuiteRunner(unittest.TestCase):
+    """Test cases for SuiteRunner.run, merge and collect_files."""
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = Path(self.folder.name)
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def suite(self, name):
+        path = Path(self.path, "suites", f"{name}TESTSUITE.py")
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(SUITE.format(root=str(repo_root), name=name), encoding="utf-8")
+        return path
+
+    def test_merge_keeps_the_last_log_file_of_each_suite(self):
+        """Cumulative *_auto.csv files of a suite are merged once, from the last file."""
+        files = [self.suite(name) for name in ("MATA010", "MATA020", "MATA030")]
+
+        summary = SuiteRunner(files, workers=2, output=str(Path(self.path, "run"))).run()
+
+        self.assertTrue(summary["passed"], summary)
+        self.assertEqual(summary["merged"]["rows"], 6)
+        lines = Path(summary["merged"]["csv"]).read_text(encoding="windows-1252").splitlines()[1:]
+        self.assertEqual(sorted(lines), sorted(f'"{name}";"case {case}"' for name in ("MATA010", "MATA020", "MATA030")
+                                               for case in (1, 2)))
+        self.assertTrue(all(result["log_file"] for result in summary["suites"]))
+
+    def test_collect_files_expands_folders_and_manifests(self):
+        """Folders give their *TESTSUITE.py files and manifests give their files."""
+        suites = [self.suite(name) for name in ("MATA020", "MATA010")]
+        Path(suites[0].parent, "helper.py").write_text("", encoding="utf-8")
+        manifest = Path(self.path, "shard_0.json")
+        manifest.write_text(json.dumps({"files": [{"file": str(suites[0]), "seconds": 10}]}), encoding="utf-8")
+
+        self.assertEqual(collect_files([suites[0].parent, manifest, "MATA030TESTCASE.py"]),
+                         [suites[1], suites[0], suites[0], Path("MATA030TESTCASE.py")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1 +1,2 @@
-from .main import *
\ No newline at end of file
+from .main import *
+from .main import __getattr__  # noqa: F401
@@ -1,19 +1,43 @@
 import os
 from typing import List, Dict, Any
 
-from tir.technologies.webapp_internal import WebappInternal
-from tir.technologies.apw_internal import ApwInternal
-from tir.technologies.poui_internal import PouiInternal
 from tir.technologies.core.config import ConfigLoader
-from tir.technologies.core.base_database import BaseDatabase
 from tir.technologies.core.router import Router
+from tir.technologies.core.session import Session, current_session, bind_session, use_session
 
 """
 This file must contain the definition of all User Classes.
 
 These classes will contain only calls to the Internal classes.
+
+The Internal classes (and selenium, pandas, cv2, sqlalchemy...) are imported when a User Class
+is instantiated, so importing tir stays fast for the scripts and tools that use only part of it.
 """
 
+# Names exported by "from tir import *". The Internal classes are left out so the star import
+# doesn't import them; they are still available through __getattr__.
+__all__ = ["Webapp", "Apw", "Poui", "ConfigLoader", "Router", "Session", "current_session", "bind_session", "use_session"]
+
+_lazy_classes = {
+    "WebappInternal": "tir.technologies.webapp_internal",
+    "ApwInternal": "tir.technologies.apw_internal",
+    "PouiInternal": "tir.technologies.poui_internal",
+    "BaseDatabase": "tir.technologies.core.base_database",
+}
+
+
+def __getattr__(name):
+    """
+    [Internal]
+
+    Imports the Internal classes on first access, keeping "from tir.main import WebappInternal" working.
+    """
+    if name in _lazy_classes:
+        import importlib
+        return getattr(importlib.import_module(_lazy_classes[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class Webapp():
     """
     Instantiates the Webapp automated interface testing class.
@@ -24,9 +48,10 @@ class Webapp():
     :type: bool
     """
     def __init__(self, config_path="", autostart=True):
+        from tir.technologies.webapp_internal import WebappInternal
         self.__webapp = WebappInternal(config_path, autostart)
         self.__router = Router(config_path, inst_webapp=self.__webapp)
-        self.config = ConfigLoader()
+        self.config = self.__webapp.config
         self.coverage = self.config.coverage
         self._subscribe_routes()
 
@@ -1283,7 +1308,7 @@ class Webapp():
         """
         self.__webapp.program_screen(initial_program)
     
-    def OpenCSV(self, csv_file='', delimiter=';', column=None, header=None, filter_column=None, filter_value=''):
+    def OpenCSV(self, csv_file='', delimiter=';', column=None, header=None, filter_column=None, filter_value='', chunksize=None):
         """
         Returns a dictionary when the file has a header in another way returns a list
         The folder must be entered in the CSVPath parameter in the config.json.
@@ -1308,6 +1333,11 @@ class Webapp():
         :type filter_value: str
         :param filter_data: If you want filter a value by column, this parameter need to be a True value
         :type filter_data: bool
+        :param chunksize: For very large files, reads chunksize rows at a time and returns a generator with the data of each chunk - **Default:** None (whole file)
+        :type chunksize: int
+
+        .. note::
+            Files are read once per process and kept in memory until they are changed, so calling OpenCSV again on the same file is fast.
 
         >>> # Call the method:
         >>> file_csv = self.oHelper.OpenCSV(delimiter=";", csv_file="no_header.csv")
@@ -1327,8 +1357,11 @@ class Webapp():
         >>> file_csv_header_filter = self.oHelper.OpenCSV(delimiter=";", csv_file="header.csv", header=True, filter_column='CAMPO', filter_value='A00_FILIAL')
 
         >>> file_csv _no_header_filter = self.oHelper.OpenCSV(delimiter=";", csv_file="no_header.csv", filter_column=0, filter_value='A00_FILIAL')
+
+        >>> for chunk in self.oHelper.OpenCSV(delimiter=";", csv_file="big.csv", header=True, filter_column='CAMPO', filter_value='A00_FILIAL', chunksize=50000):
+        >>>     rows += len(chunk['CAMPO'])
         """
-        return self.__webapp.open_csv(csv_file, delimiter, column, header, filter_column, filter_value)
+        return self.__webapp.open_csv(csv_file, delimiter, column, header, filter_column, filter_value, chunksize)
 
     def StartDB(self):
         """
@@ -1339,21 +1372,22 @@ class Webapp():
         >>> # Call the method:
         >>> self.oHelper.StartDB()
         """
-        return self.__database.connect_database()
+        return self.__webapp.base_database.connect_database()
 
-    def StopDB(self, connection):
+    def StopDB(self, connection=None):
         """
+        Closes the connections of the database, or of every database when no connection is given.
 
-        :param connection: connection object
+        :param connection: connection object - **Default:** None (every database)
         :type param: object
         Usage:
 
         >>> # Call the method:
         >>> self.oHelper.StopDB(connection)
         """
-        self.__database.connect_database()
+        self.__webapp.base_database.disconnect_database(connection)
 
-    def QueryExecute(self, query, database_driver="", dbq_oracle_server="", database_server="", database_port=1433, database_name="", database_user="", database_password=""):
+    def QueryExecute(self, query, database_driver="", dbq_oracle_server="", database_server="", database_port=1433, database_name="", database_user="", database_password="", result_format="dict"):
         """
         Return a dictionary if the query statement is a SELECT otherwise print a number of row 
         affected in case of INSERT|UPDATE|DELETE statement.
@@ -1389,18 +1423,94 @@ class Webapp():
         :type database_user: str
         :param database_password: Database password
         :type database_password: str
+        :param result_format: Format of the SELECT result: "dict" (column dict of dicts), "records" (list of dicts), "tuples", "dataframe" or "arrow" (requires pyarrow). - **Default:** "dict"
+        :type result_format: str
 
         Usage:
 
         >>> # Call the method:
         >>> self.oHelper.QueryExecute("SELECT * FROM SA1T10")
+        >>> self.oHelper.QueryExecute("SELECT A1_COD, A1_NOME FROM SA1T10", result_format="records")
         >>> self.oHelper.QueryExecute("SELECT * FROM SA1T10", database_driver="DRIVER_ODBC_NAME", database_server="SERVER_NAME", database_name="DATABASE_NAME", database_user="sa", database_password="123456")
         >>> # Oracle ODBC Example:
         >>> self.oHelper.QueryExecute("SELECT * FROM SA1T10", database_driver="Oracle in OraClient19Home1", dbq_oracle_server="Host:Port/oracle instance", database_server="SERVER_NAME", database_name="DATABASE_NAME", database_user="sa", database_password="123456")
         >>> # Oracledb Example:
         >>> self.oHelper.QueryExecute("SELECT * FROM SA1T10", database_driver="Oracle", database_server="localhost/freepdb1", database_user="system", database_password="Oracle123")
         """
-        return self.__webapp.query_execute(query, database_driver, dbq_oracle_server, database_server, database_port, database_name, database_user, database_password)
+        return self.__webapp.query_execute(query, database_driver, dbq_oracle_server, database_server, database_port, database_name, database_user, database_password, result_format)
+
+    def ExecuteMany(self, statements, database_driver="", dbq_oracle_server="", database_server="", database_port=1433, database_name="", database_user="", database_password="", batch_size=1000):
+        """
+        Executes parameter-bound INSERT|UPDATE|DELETE statements in a single transaction and returns the number of rows affected.
+        If any statement fails, nothing is committed.
+
+        Each statement is a SQL string with :name placeholders, or a tuple with the SQL and its parameters:
+        a dict, or a list of dicts inserted in batches (fast_executemany on SQL Server, array binding on Oracle).
+
+        The connection parameters are the same as in QueryExecute.
+
+        :param statements: SQL strings or (SQL, parameters) tuples.
+        :type statements: list
+        :param batch_size: Number of parameter rows sent to the database at a time. - **Default:** 1000
+        :type batch_size: int
+
+        Usage:
+
+        >>> # Call the method:
+        >>> products = [{"filial": "01", "cod": f"TIR{i:03}", "desc": f"PRODUTO {i}"} for i in range(500)]
+        >>> self.oHelper.ExecuteMany([("INSERT INTO SB1T10 (B1_FILIAL, B1_COD, B1_DESC) VALUES (:filial, :cod, :desc)", products)])
+        >>> self.oHelper.ExecuteMany([("UPDATE SA1T10 SET A1_MSBLQL = :blq WHERE A1_COD = :cod", {"blq": "1", "cod": "000001"}),
+        >>>                           "DELETE FROM SC5T10 WHERE C5_NUM = 'TIR001'"])
+        """
+        return self.__webapp.execute_many(statements, database_driver, dbq_oracle_server, database_server, database_port, database_name, database_user, database_password, batch_size)
+
+    def LoadFixture(self, paths, keys=None, delimiter=";", database_driver="", dbq_oracle_server="", database_server="", database_port=1433, database_name="", database_user="", database_password=""):
+        """
+        Loads test data in bulk from CSV or JSON files, one file per table (SB1T10.csv, SA1T10.json),
+        or a JSON file with the rows by table. The tables are restored by TearDown: the fixture rows
+        are deleted and the rows with the same keys that existed before the load are inserted back.
+
+        The connection parameters are the same as in QueryExecute. Datasets of Protheus tables must have
+        unique R_E_C_N_O_ values.
+
+        :param paths: Dataset file, or list of files and folders.
+        :type paths: str or list
+        :param keys: Key columns by table. - **Default:** None (every column of the dataset)
+        :type keys: dict
+        :param delimiter: Delimiter of the CSV files. - **Default:** ";"
+        :type delimiter: str
+
+        Usage:
+
+        >>> # Call the method:
+        >>> self.oHelper.LoadFixture("fixtures/SB1T10.csv", keys={"SB1T10": ["B1_FILIAL", "B1_COD"]})
+        >>> self.oHelper.LoadFixture(["fixtures/"], keys={"SB1T10": ["R_E_C_N_O_"], "SA1T10": ["R_E_C_N_O_"]})
+        """
+        return self.__webapp.load_fixture(paths, keys, delimiter, database_driver, dbq_oracle_server, database_server, database_port, database_name, database_user, database_password)
+
+    def QueryStream(self, query, database_driver="", dbq_oracle_server="", database_server="", database_port=1433, database_name="", database_user="", database_password="", chunksize=10000, result_format="dataframe"):
+        """
+        Executes a SELECT with a server-side cursor and returns a generator of chunks of rows,
+        so large tables can be validated without loading the whole result in memory.
+
+        The connection parameters are the same as in QueryExecute.
+
+        :param query: ANSI SQL SELECT statement
+        :type query: str
+        :param chunksize: Number of rows of each chunk. - **Default:** 10000
+        :type chunksize: int
+        :param result_format: Format of each chunk: "dataframe", "records", "tuples", "dict" or "arrow" (requires pyarrow). - **Default:** "dataframe"
+        :type result_format: str
+
+        Usage:
+
+        >>> # Call the method:
+        >>> for chunk in self.oHelper.QueryStream("SELECT D2_DOC, D2_TOTAL FROM SD2T10 WHERE D_E_L_E_T_ = ' '", chunksize=5000):
+        >>>     total += chunk["D2_TOTAL"].sum()
+        >>> for rows in self.oHelper.QueryStream("SELECT F2_DOC FROM SF2T10", result_format="tuples"):
+        >>>     documents.update(row[0] for row in rows)
+        """
+        return self.__webapp.query_stream(query, database_driver, dbq_oracle_server, database_server, database_port, database_name, database_user, database_password, chunksize, result_format)
 
     def GetConfigValue(self, json_key):
         """
@@ -1687,6 +1797,7 @@ class Webapp():
 class Apw():
 
     def __init__(self, config_path=""):
+        from tir.technologies.apw_internal import ApwInternal
 
         self.__Apw = ApwInternal()
 
@@ -1759,8 +1870,9 @@ class Apw():
 class Poui():
 
     def __init__(self, config_path="", autostart=True):
+        from tir.technologies.poui_internal import PouiInternal
         self.__poui = PouiInternal(config_path, autostart)
-        self.config = ConfigLoader()
+        self.config = self.__poui.config
         self.coverage = self.config.coverage
 
     def __getattribute__(self, name):
@@ -31,9 +31,13 @@ from selenium.common.exceptions import TimeoutException
 from selenium.common.exceptions import WebDriverException
 from datetime import datetime
 from tir.technologies.core.logging_config import logger
+from tir.technologies.core.session import current_session
+from tir.technologies.core.session_pool import session_pool
 from tir.version import __version__
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+from tir.technologies.core.driver_cache import resolve_chromedriver
+from tir.technologies.core.cdp_transport import CdpTransport
+from tir.technologies.core.startup_profiler import StartupProfiler, startup_phase
 from pathlib import Path
 
 
@@ -61,30 +65,57 @@ class Base(unittest.TestCase):
     >>> def APWInternal(Base):
     """
 
-    _shared_driver = None
-    _shared_wait = None
-    errors = []
-    
+    # Whether the technology can reuse logged-in browsers of the SessionPool.
+    session_poolable = False
+
     @property
     def driver(self):
-        """Property to always get the current shared driver instance"""
-        return Base._shared_driver
-    
+        """Property to always get the driver of the current session"""
+        return self.session.driver
+
     @driver.setter
     def driver(self, value):
-        """Property to update the shared driver for all instances"""
-        Base._shared_driver = value
-    
+        """Property to update the driver of the session for all its instances"""
+        self.session.driver = value
+
     @property
     def wait(self):
-        """Property to always get the current shared wait instance"""
-        return Base._shared_wait
-    
+        """Property to always get the wait of the current session"""
+        return self.session.wait
+
     @wait.setter
     def wait(self, value):
-        """Property to update the shared wait for all instances"""
-        Base._shared_wait = value
-    
+        """Property to update the wait of the session for all its instances"""
+        self.session.wait = value
+
+    @property
+    def errors(self):
+        """Property to always get the error list of the current session"""
+        return self.session.errors
+
+    @errors.setter
+    def errors(self, value):
+        """Property to replace the error list of the session for all its instances"""
+        self.session.errors = value
+
+    @property
+    def transport(self):
+        """Property to get the CDP transport of the session driver when AsyncTransport is enabled, or None"""
+        if not self.config.async_transport or not self.driver or self.config.browser.lower() != "chrome":
+            return None
+
+        if self.session.transport_driver is not self.driver:
+            if self.session.transport:
+                self.session.transport.close()
+            self.session.transport_driver = self.driver
+            try:
+                self.session.transport = CdpTransport(self.driver, self.config.time_out)
+            except Exception as e:
+                logger().warning(f"AsyncTransport unavailable, using Selenium: {str(e)}")
+                self.session.transport = None
+
+        return self.session.transport
+
     def __init__(self, config_path="", autostart=True):
         """
         Definition of each global variable:
@@ -101,10 +132,19 @@ class Base(unittest.TestCase):
 
         log_file: A variable to control when to generate a log file of each execution of web_scrap. (Debug purposes)
 
+        pooled: Entry of the SessionPool when a logged-in browser was reused instead of calling Start.
+
+        session: The Session bound to the current thread, that owns the driver, wait, config, log and errors.
+
+        startup: StartupProfiler that times the phases until the end of Setup.
+
         wait: The global Selenium Wait defined to be used in the entire application.
         """
         #Global Variables:
 
+        self.startup = StartupProfiler(type(self).__name__)
+        self.session = current_session()
+
         self.config_path = config_path
 
         if self.config_path == "":
@@ -112,12 +152,15 @@ class Base(unittest.TestCase):
             if not os.path.isfile(self.config_path):
                 raise Exception(f"config.json file not found!")
 
-        self.config = ConfigLoader(self.config_path)
+        self.config = self.session.config or ConfigLoader(self.config_path)
+        self.session.config = self.config
         self.config.autostart = autostart
 
         self.language = LanguagePack(self.config.language) if self.config.language else ""
         self.log = Log(folder=self.config.log_folder, config_path=self.config_path)
         self.log.station = socket.gethostname()
+        if self.session.log is None:
+            self.session.log = self.log
         self.utils = Utils()
         self.test_case = []
         self.last_test_case = None
@@ -141,7 +184,14 @@ class Base(unittest.TestCase):
         self.twebview_context = False
         self.filter_blocked_containers = True
 
-        if autostart:
+        self.pooled = None
+        if autostart and self.session_poolable and self.config.session_pool:
+            self.pooled = session_pool().acquire(self.config)
+
+        if self.pooled:
+            self.driver = self.pooled["driver"]
+            self.wait = self.pooled["wait"]
+        elif autostart:
             self.Start()
 
 # Internal Methods
@@ -531,11 +581,11 @@ class Base(unittest.TestCase):
                 self.twebview_context = False
                 return BeautifulSoup(self.driver.page_source, "html.parser")
 
-            soup = BeautifulSoup(self.driver.page_source,"html.parser")
+            soup = BeautifulSoup(self.page_source(),"html.parser")
 
             if self.tmenu_out_iframe:
                 self.driver.switch_to.default_content()
-                soup = BeautifulSoup(self.driver.page_source,"html.parser")
+                soup = BeautifulSoup(self.page_source(),"html.parser")
 
             elif soup and soup.select('.session'):
 
@@ -1016,6 +1066,26 @@ class Base(unittest.TestCase):
             pass
     
 
+    def page_source(self):
+        """
+        [Internal]
+
+        Returns the HTML of the top document, through the CDP transport when AsyncTransport is enabled.
+
+        Usage:
+
+        >>> # Calling the method:
+        >>> soup = BeautifulSoup(self.page_source(), "html.parser")
+        """
+        transport = self.transport
+        if transport:
+            try:
+                return transport.snapshot()
+            except Exception as e:
+                logger().debug(f"AsyncTransport snapshot error: {str(e)}")
+
+        return self.driver.page_source
+
     def soup_to_selenium(self, soup_object=None, twebview=False):
         """
         [Internal]
@@ -1207,6 +1277,7 @@ class Base(unittest.TestCase):
             normalized_config = self.normalize_config_name(config_name)
             setattr(self.config, normalized_config, value)
 
+    @startup_phase
     def Start(self):
         """
         Opens the browser maximized and goes to defined URL.
@@ -1228,6 +1299,7 @@ class Base(unittest.TestCase):
         logger().info(f'TIR Version: {__version__}')
         logger().info(f'Python Version: {platform.python_version()}')
         logger().info("Starting the browser")
+        phase_start = time.perf_counter()
         if self.config.browser.lower() == "firefox":
             if sys.platform == 'linux':
                 driver_path = os.path.join(os.path.dirname(__file__), r'drivers/linux64/geckodriver')
@@ -1251,21 +1323,7 @@ class Base(unittest.TestCase):
                 chrome_options.add_argument('force-device-scale-factor=0.77')
 
             if self.config.chromedriver_auto_install:
-
-                counter = 1
-                while counter < 3:
-                    try:
-                        if self.config.ssl_chrome_auto_install_disable:
-                            os.environ['WDM_SSL_VERIFY'] = '0'
-                        driver_path = ChromeDriverManager().install()
-                        break
-                    except Exception as e:
-                        logger().info("Trying get driver_path from ChromeDriverManager().Install")
-                        time.sleep(30)
-                        counter += 1
-                        if counter > 2:
-                            raise e
-
+                driver_path = resolve_chromedriver(self.config)
             else:
                 if sys.platform == 'linux':
                     driver_path = Path(__file__).parent.resolve().joinpath('drivers', 'linux',
@@ -1288,13 +1346,16 @@ class Base(unittest.TestCase):
             chrome_options.add_argument('--quiet')
             chrome_options.binary_location = self.config.electron_binary_path
             self.driver = webdriver.Chrome(options=chrome_options, executable_path=driver_path)
+        self.startup.record("driver_launch", phase_start)
 
         if not self.config.browser.lower() == "electron":
+            phase_start = time.perf_counter()
             if self.config.headless:
                 self.driver.set_window_position(0, 0)
                 self.driver.set_window_size(1366, 768)
             else:
                 self.driver.maximize_window()
+            self.startup.record("window_sizing", phase_start)
 
             self.get_url()
 
@@ -1304,13 +1365,12 @@ class Base(unittest.TestCase):
             if window_size and not 768 in range(window_size['height'], window_size['height']+ 40):
                 logger().info(f"Screen size is different from default used in headless mode")
         self.wait = WebDriverWait(self.driver, self.config.time_out)
-        
-        Base.driver = self.driver
-        Base.wait = self.wait
 
         if not self.config.poui:
             if not self.config.skip_environment:
+                phase_start = time.perf_counter()
                 self.wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, start_program)))
+                self.startup.record("wait_program_screen", phase_start)
             try:
                 self.driver.execute_script(
                 "if (typeof app !== 'undefined' && app.resourceManager && "
@@ -1323,6 +1383,7 @@ class Base(unittest.TestCase):
             except Exception as e:
                 logger().debug(f"app resource store Value Error: {e}")
 
+    @startup_phase
     def get_url(self, url=None):
         """This method loads the URL in the browser and waits for the page to be ready.
 
@@ -1457,6 +1518,7 @@ class Base(unittest.TestCase):
         self.driver.switch_to_default_content()
         return self.driver.find_elements(By.CSS_SELECTOR, selector)
 
+    @startup_phase
     def webapp_shadowroot(self, shadow_root=True):
         """
         [Internal]
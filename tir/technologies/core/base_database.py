@@ -1,4 +1,6 @@
 
+import atexit
+import threading
 import pandas as pd
 import re
 from sqlalchemy import create_engine, text
@@ -7,16 +9,69 @@ from sqlalchemy.exc import SQLAlchemyError
 from tir.technologies.core.logging_config import logger
 from tir.technologies.core.config import ConfigLoader
 
+# Engines by connection string, shared by every BaseDatabase of the process.
+_engines = {}
+_engines_lock = threading.Lock()
+
+
+def cached_engine(conn_str, pool_size=5):
+    """
+    Returns the engine of the connection string, creating it on first use.
+
+    Engines keep a pool of open connections, checked with a ping before each use, so
+    consecutive queries don't pay the ODBC connection establishment again. SQL Server engines
+    send executemany batches with pyodbc fast_executemany.
+
+    :param conn_str: SQLAlchemy connection string.
+    :type conn_str: str
+    :param pool_size: Number of connections kept open. - **Default:** 5
+    :type pool_size: int
+
+    :return: The engine and whether it was created by this call.
+    :rtype: tuple
+    """
+    with _engines_lock:
+        if conn_str in _engines:
+            return _engines[conn_str], False
+
+        if conn_str.startswith("sqlite"):
+            engine = create_engine(conn_str)
+        else:
+            options = {"fast_executemany": True} if conn_str.startswith("mssql+pyodbc") else {}
+            engine = create_engine(conn_str, pool_size=pool_size, max_overflow=pool_size, pool_pre_ping=True, pool_recycle=1800, **options)
+        _engines[conn_str] = engine
+        return engine, True
+
+
+def dispose_engines():
+    """
+    Closes the connections of every cached engine.
+    """
+    with _engines_lock:
+        engines = list(_engines.values())
+        _engines.clear()
+
+    for engine in engines:
+        engine.dispose()
+
+    if engines:
+        logger().info(f'{len(engines)} DataBase connection pool(s) stopped')
+
+
+atexit.register(dispose_engines)
+
 
 class BaseDatabase:
 
-    def __init__(self):
-        self.config = ConfigLoader()
+    def __init__(self, config=None):
+        self.config = config or ConfigLoader()
 
 
     def sqlalchemy_engine(self, database_driver="", dbq_oracle_server="", database_server="", database_port=1433, database_name="", database_user="", database_password="") -> Engine:
         """
         Cria e retorna um SQLAlchemy Engine para ODBC (SQL Server, Oracle, etc).
+
+        Engines are cached by connection string and reused by the next calls.
         """
         database_driver = self.config.database_driver if not database_driver else database_driver
         database_server = self.config.database_server if not database_server else database_server
@@ -32,7 +87,7 @@ class BaseDatabase:
                 f"mssql+pyodbc://{database_user}:{database_password}@{database_server}:{database_port}/{database_name}"
                 f"?driver={database_driver.replace(' ', '+')}"
             )
-            return create_engine(conn_str)
+            return self.cached_engine(conn_str)
 
         # Oracle ODBC (usando oracledb)
         elif "oracle" in database_driver.lower():
@@ -47,12 +102,31 @@ class BaseDatabase:
                 conn_str = (
                     f"oracle+oracledb://{database_user}:{database_password}@{host}:{database_port}/?service_name={service_name}"
                 )
-            return create_engine(conn_str)
+            return self.cached_engine(conn_str)
+
+        # SQLite (DBName com o caminho do arquivo), usado nos testes offline
+        elif database_driver.lower() == "sqlite":
+            return self.cached_engine(f"sqlite:///{database_name}")
 
         else:
             raise ValueError("Database driver não suportado para SQLAlchemy.")
 
 
+    def cached_engine(self, conn_str) -> Engine:
+        """
+        [Internal]
+
+        Returns the cached engine, testing the connection only when it is created.
+        """
+        engine, created = cached_engine(conn_str, self.config.database_pool_size)
+        if created:
+            if self.test_sqlalchemy_connection(engine):
+                logger().info('DataBase connection started')
+            else:
+                logger().info('DataBase connection is stopped')
+        return engine
+
+
     def test_sqlalchemy_connection(self, engine: Engine):
         """
         Testa se a conexão está ativa.
@@ -66,32 +140,39 @@ class BaseDatabase:
 
 
     def connect_database(self, query="", database_driver="", dbq_oracle_server="", database_server="", database_port=1521, database_name="", database_user="", database_password=""):
-        engine = self.sqlalchemy_engine(database_driver, dbq_oracle_server, database_server, database_port, database_name, database_user, database_password)
-        if self.test_sqlalchemy_connection(engine):
-            logger().info('DataBase connection started')
-        else:
-            logger().info('DataBase connection is stopped')
-        return engine
+        return self.sqlalchemy_engine(database_driver, dbq_oracle_server, database_server, database_port, database_name, database_user, database_password)
 
 
-    def disconnect_database(self, engine: Engine):
-        if engine:
+    def disconnect_database(self, engine: Engine = None):
+        """
+        Closes the connections of the engine, or of every cached engine when no engine is given.
+        """
+        if engine is None:
+            dispose_engines()
+        elif engine:
+            with _engines_lock:
+                for conn_str in [key for key, value in _engines.items() if value is engine]:
+                    del _engines[conn_str]
             engine.dispose()
             logger().info('DataBase connection stopped')
         else:
             logger().info('DataBase connection already stopped')
             
 
-    def query_execute(self, query, database_driver, dbq_oracle_server, database_server, database_port, database_name, database_user, database_password):
+    def query_execute(self, query, database_driver, dbq_oracle_server, database_server, database_port, database_name, database_user, database_password, result_format="dict"):
         """
-        Executa uma query usando SQLAlchemy. Retorna um dicionário se SELECT, senão retorna número de linhas afetadas.
+        Executa uma query usando SQLAlchemy. Retorna o resultado no result_format se SELECT, senão retorna número de linhas afetadas.
+
+        :param result_format: Format of the SELECT result: "dict" (column dict of dicts, as DataFrame.to_dict),
+        "records" (list of dicts), "tuples" (list of tuples), "dataframe" or "arrow" (pyarrow.Table). - **Default:** "dict"
+        :type result_format: str
         """
         engine = self.connect_database(query, database_driver, dbq_oracle_server, database_server, database_port, database_name, database_user, database_password)
         try:
             with engine.connect() as conn:
                 if query.strip().upper().startswith('SELECT'):
-                    df = pd.read_sql_query(sql=text(query), con=conn)
-                    return df.to_dict()
+                    result = conn.execute(text(query))
+                    return format_rows(list(result.keys()), result.fetchall(), result_format)
                 else:
                     result = conn.execute(text(query))
                     conn.commit()
@@ -100,3 +181,95 @@ class BaseDatabase:
         except SQLAlchemyError as e:
             logger().error(f'Erro ao executar query: {e}')
             return None
+
+
+    def query_stream(self, query, database_driver="", dbq_oracle_server="", database_server="", database_port=1433, database_name="", database_user="", database_password="", chunksize=10000, result_format="dataframe"):
+        """
+        Executes a SELECT with a server-side cursor and yields its rows in chunks, so only
+        chunksize rows are held in memory at a time.
+
+        :param chunksize: Number of rows of each chunk. - **Default:** 10000
+        :type chunksize: int
+        :param result_format: Format of each chunk: "dataframe", "records", "tuples", "dict" or "arrow". - **Default:** "dataframe"
+        :type result_format: str
+
+        Usage:
+
+        >>> # Calling the method:
+        >>> for chunk in self.query_stream("SELECT D2_DOC, D2_TOTAL FROM SD2T10", chunksize=5000):
+        >>>     total += chunk["D2_TOTAL"].sum()
+        """
+        engine = self.connect_database(query, database_driver, dbq_oracle_server, database_server, database_port, database_name, database_user, database_password)
+        with engine.connect() as conn:
+            result = conn.execution_options(stream_results=True, max_row_buffer=chunksize).execute(text(query))
+            columns = list(result.keys())
+            for rows in result.partitions(chunksize):
+                yield format_rows(columns, rows, result_format)
+
+
+    def execute_many(self, statements, database_driver="", dbq_oracle_server="", database_server="", database_port=1433, database_name="", database_user="", database_password="", batch_size=1000):
+        """
+        Executes parameter-bound statements in a single transaction, committed only when every
+        statement succeeds.
+
+        Each statement is a SQL string with :name placeholders, or a tuple with the SQL and its
+        parameters: a dict for one execution or a list of dicts executed in batches of batch_size
+        rows with executemany (fast_executemany on SQL Server, array binding on Oracle).
+
+        :param statements: SQL strings or (SQL, parameters) tuples.
+        :type statements: list
+        :param batch_size: Number of parameter rows sent by each executemany. - **Default:** 1000
+        :type batch_size: int
+
+        :return: Number of rows affected by the statements.
+        :rtype: int
+
+        Usage:
+
+        >>> # Calling the method:
+        >>> self.execute_many([("INSERT INTO SB1T10 (B1_FILIAL, B1_COD, B1_DESC) VALUES (:filial, :cod, :desc)", rows),
+        >>>                    ("UPDATE SB1T10 SET B1_MSBLQL = :blq WHERE B1_COD = :cod", {"blq": "2", "cod": "TIR001"})])
+        """
+        engine = self.connect_database("", database_driver, dbq_oracle_server, database_server, database_port, database_name, database_user, database_password)
+        affected = 0
+        with engine.begin() as conn:
+            for statement in statements:
+                sql, parameters = statement if isinstance(statement, tuple) else (statement, None)
+                if isinstance(parameters, (list, tuple)):
+                    for start in range(0, len(parameters), max(1, batch_size)):
+                        batch = list(parameters[start:start + max(1, batch_size)])
+                        result = conn.execute(text(sql), batch)
+                        affected += result.rowcount if result.rowcount >= 0 else len(batch)
+                else:
+                    result = conn.execute(text(sql), parameters or {})
+                    affected += max(result.rowcount, 0)
+
+        logger().info(f'{affected} row(s) affected')
+        return affected
+
+
+def format_rows(columns, rows, result_format="dict"):
+    """
+    [Internal]
+
+    Converts the rows of a result into the requested format.
+    """
+    if result_format == "tuples":
+        return [tuple(row) for row in rows]
+    elif result_format == "records":
+        return [dict(zip(columns, row)) for row in rows]
+    elif result_format == "arrow":
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError('result_format="arrow" requires the pyarrow package: pip install pyarrow')
+        return pyarrow.Table.from_pydict({column: [row[index] for row in rows] for index, column in enumerate(columns)})
+
+    # Decimal values (SQL Server and Oracle NUMERIC columns) are converted to float, as read_sql_query does.
+    df = pd.DataFrame.from_records([tuple(row) for row in rows], columns=columns, coerce_float=True)
+    if result_format == "dataframe":
+        return df
+    elif result_format == "dict":
+        return df.to_dict()
+    else:
+        raise ValueError(f'Unknown result_format: {result_format}. Use "dict", "records", "tuples", "dataframe" or "arrow".')
@@ -0,0 +1,293 @@
+import asyncio
+import base64
+import itertools
+import json
+import threading
+from tir.technologies.core.http_session import http_session
+from tir.technologies.core.logging_config import logger
+
+"""
+Optional asyncio transport to the Chrome DevTools Protocol (CDP) over websockets.
+
+Every CdpSession is connected to the page of one Chrome driver and runs on a single event loop
+shared by the process, so the commands of many sessions are multiplexed on it instead of each
+one waiting on a blocking WebDriver HTTP request. Coroutines can be awaited from the loop, or
+called from the synchronous TIR code with the blocking wrappers of CdpTransport.
+
+Requires the websockets package (pip install websockets).
+"""
+
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def transport_loop():
+    """
+    Returns the event loop shared by every CDP session, running in a daemon thread.
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="tir-cdp-transport", daemon=True).start()
+        return _loop
+
+
+def run(coroutine, timeout=None):
+    """
+    Runs the coroutine in the transport loop and waits for its result.
+
+    :param coroutine: The coroutine to be executed.
+    :param timeout: Maximum time in seconds to wait. - **Default:** None
+    :type timeout: float
+    """
+    return asyncio.run_coroutine_threadsafe(coroutine, transport_loop()).result(timeout)
+
+
+class CdpSession:
+    """
+    Asynchronous CDP connection to a page target.
+
+    Commands are sent as JSON messages with an id and their responses are matched by a reader
+    task, so any number of commands and sessions can be in flight on the same loop. Events are
+    delivered to the callbacks registered with subscribe.
+
+    :param websocket_url: The webSocketDebuggerUrl of the page.
+    :type websocket_url: str
+
+    Usage:
+
+    >>> # Calling the method:
+    >>> session = await CdpSession(websocket_url).connect()
+    >>> html = await session.snapshot()
+    """
+
+    def __init__(self, websocket_url):
+        self.websocket_url = websocket_url
+        self.websocket = None
+        self.reader = None
+        self.ids = itertools.count(1)
+        self.pending = {}
+        self.listeners = {}
+
+    async def connect(self):
+        """
+        Opens the websocket and starts the reader task.
+        """
+        try:
+            import websockets
+        except ImportError:
+            raise ImportError("AsyncTransport requires the websockets package: pip install websockets")
+
+        self.websocket = await websockets.connect(self.websocket_url, max_size=None)
+        self.reader = asyncio.ensure_future(self.read())
+        return self
+
+    async def read(self):
+        """
+        [Internal]
+
+        Resolves the pending commands and dispatches the events received from the websocket.
+        """
+        try:
+            async for raw in self.websocket:
+                message = json.loads(raw)
+                if "id" in message:
+                    future = self.pending.pop(message["id"], None)
+                    if future and not future.done():
+                        if "error" in message:
+                            future.set_exception(RuntimeError(f"{message['error'].get('message')}: {message['error'].get('data', '')}"))
+                        else:
+                            future.set_result(message.get("result", {}))
+                else:
+                    for callback in self.listeners.get(message.get("method"), []):
+                        try:
+                            callback(message.get("params", {}))
+                        except Exception as e:
+                            logger().debug(f"[CdpTransport]: Event callback error: {e}")
+        except Exception as e:
+            logger().debug(f"[CdpTransport]: Connection closed: {e}")
+        finally:
+            for future in self.pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("CDP connection closed"))
+            self.pending.clear()
+
+    async def send(self, method, params=None):
+        """
+        Sends a CDP command and returns its result.
+
+        :param method: CDP method, for example "Runtime.evaluate".
+        :type method: str
+        :param params: Parameters of the method. - **Default:** None
+        :type params: dict
+        """
+        message_id = next(self.ids)
+        future = asyncio.get_running_loop().create_future()
+        self.pending[message_id] = future
+        await self.websocket.send(json.dumps({"id": message_id, "method": method, "params": params or {}}))
+        return await future
+
+    async def execute_script(self, script, *args):
+        """
+        Executes a function body with the given JSON arguments, like driver.execute_script.
+
+        :return: The value returned by the script.
+        """
+        expression = f"(function(){{{script}\n}}).apply(null, {json.dumps(list(args))})"
+        result = await self.send("Runtime.evaluate", {"expression": expression, "returnByValue": True, "awaitPromise": True})
+        if "exceptionDetails" in result:
+            raise RuntimeError(result["exceptionDetails"].get("text", "Script error"))
+        return result.get("result", {}).get("value")
+
+    async def snapshot(self):
+        """
+        Returns the HTML of the top document, like driver.page_source.
+        """
+        return await self.execute_script("return document.documentElement.outerHTML")
+
+    async def screenshot(self, format="png", quality=None):
+        """
+        Returns a screenshot of the page as bytes.
+        """
+        params = {"format": format}
+        if quality is not None and format != "png":
+            params["quality"] = quality
+        return base64.b64decode((await self.send("Page.captureScreenshot", params))["data"])
+
+    async def click(self, x, y, button="left", click_count=1):
+        """
+        Clicks on the page coordinates.
+        """
+        for event_type in ("mousePressed", "mouseReleased"):
+            await self.send("Input.dispatchMouseEvent", {"type": event_type, "x": x, "y": y, "button": button, "clickCount": click_count})
+
+    async def click_element(self, xpath, frames=()):
+        """
+        Scrolls to the element of the xpath and clicks on its center.
+
+        :param xpath: Xpath of the element in the document of the last frame.
+        :type xpath: str
+        :param frames: Xpaths of the iframes, from the top document, that contain the element. - **Default:** ()
+        :type frames: list
+
+        :return: False if the element was not found.
+        :rtype: bool
+        """
+        rect = await self.execute_script(
+            "var find = (d, x) => d.evaluate(x, d, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;"
+            "var doc = document, path = [];"
+            "for (var x of arguments[1]) { var f = find(doc, x); if (!f || !f.contentDocument) return null; path.push(f); doc = f.contentDocument; }"
+            "var e = find(doc, arguments[0]); if (!e) return null; e.scrollIntoView({block: 'center'});"
+            "var r = e.getBoundingClientRect(), left = r.left + r.width / 2, top = r.top + r.height / 2;"
+            "for (var f of path) { var b = f.getBoundingClientRect(); left += b.left + f.clientLeft; top += b.top + f.clientTop; }"
+            "return {x: left, y: top};", xpath, list(frames))
+        if not rect:
+            return False
+        await self.click(rect["x"], rect["y"])
+        return True
+
+    async def insert_text(self, text):
+        """
+        Types the text in the focused element.
+        """
+        await self.send("Input.insertText", {"text": text})
+
+    async def press_key(self, key, code="", key_code=0):
+        """
+        Presses and releases a key, for example press_key("Enter", "Enter", 13).
+        """
+        for event_type in ("keyDown", "keyUp"):
+            await self.send("Input.dispatchKeyEvent", {"type": event_type, "key": key, "code": code or key,
+                                                       "windowsVirtualKeyCode": key_code})
+
+    async def subscribe(self, event, callback):
+        """
+        Calls the callback with the parameters of every event, enabling its CDP domain.
+
+        :param event: CDP event, for example "Page.loadEventFired".
+        :type event: str
+        :param callback: Callable receiving the event parameters.
+        :type callback: callable
+        """
+        if not any(name.split(".")[0] == event.split(".")[0] for name in self.listeners):
+            await self.send(f"{event.split('.')[0]}.enable")
+        self.listeners.setdefault(event, []).append(callback)
+
+    async def close(self):
+        """
+        Closes the websocket.
+        """
+        if self.websocket:
+            await self.websocket.close()
+        if self.reader:
+            await asyncio.gather(self.reader, return_exceptions=True)
+
+
+class CdpTransport:
+    """
+    Blocking facade over a CdpSession for the synchronous TIR code.
+
+    The session is connected to the page of a local Chrome driver found through its debuggerAddress.
+
+    :param driver: The Chrome WebDriver.
+    :type driver: selenium.webdriver.Chrome
+    :param timeout: Maximum time in seconds of each command. - **Default:** 60
+    :type timeout: float
+
+    Usage:
+
+    >>> # Calling the method:
+    >>> transport = CdpTransport(self.driver)
+    >>> soup = BeautifulSoup(transport.snapshot(), "html.parser")
+    """
+
+    def __init__(self, driver, timeout=60):
+        self.driver = driver
+        self.timeout = timeout
+        self.session = run(CdpSession(self.page_websocket_url(driver)).connect(), timeout)
+
+    @staticmethod
+    def page_websocket_url(driver):
+        """
+        [Internal]
+
+        Returns the webSocketDebuggerUrl of the page shown by the driver.
+        """
+        address = driver.capabilities.get("goog:chromeOptions", {}).get("debuggerAddress")
+        if not address:
+            raise RuntimeError("The driver doesn't expose a Chrome debuggerAddress")
+
+        pages = [target for target in http_session().get(f"http://{address}/json/list", timeout=10).json() if target.get("type") == "page"]
+        current_url = driver.current_url
+        page = next((target for target in pages if target.get("url") == current_url), next(iter(pages), None))
+        if not page:
+            raise RuntimeError(f"No page target found in {address}")
+        return page["webSocketDebuggerUrl"]
+
+    def execute_script(self, script, *args):
+        return run(self.session.execute_script(script, *args), self.timeout)
+
+    def snapshot(self):
+        return run(self.session.snapshot(), self.timeout)
+
+    def screenshot(self, format="png", quality=None):
+        return run(self.session.screenshot(format, quality), self.timeout)
+
+    def click_element(self, xpath, frames=()):
+        return run(self.session.click_element(xpath, frames), self.timeout)
+
+    def insert_text(self, text):
+        return run(self.session.insert_text(text), self.timeout)
+
+    def press_key(self, key, code="", key_code=0):
+        return run(self.session.press_key(key, code, key_code), self.timeout)
+
+    def subscribe(self, event, callback):
+        return run(self.session.subscribe(event, callback), self.timeout)
+
+    def close(self):
+        try:
+            run(self.session.close(), self.timeout)
+        except Exception as e:
+            logger().debug(f"[CdpTransport]: Error closing transport: {e}")
@@ -2,16 +2,28 @@ import json
 import os
 from datetime import datetime
 import sys
+from tir.technologies.core.session import current_session
+
+# Environment variable with a JSON object of keys that override config.json (used by the suite runner workers).
+OVERRIDES_ENV = "TIR_CONFIG_OVERRIDES"
 
 class ConfigLoader:
     """
     This class is instantiated to contain all config information used throughout the execution of the methods.
+
+    config.json is loaded once per process. ConfigLoader() returns the config of the current session
+    when it has its own (see derive), otherwise the process config, so the changes made at runtime
+    (SetTIRConfig, routine...) stay in the session that made them.
     """
 
     _instance = None
     _json_data = None
 
     def __new__(cls, path="config.json"):
+        session_config = current_session().config
+        if isinstance(session_config, ConfigLoader):
+            return session_config
+
         if cls._instance is None:
             cls._instance = super(ConfigLoader, cls).__new__(cls)
             cls._instance._initialize(path)
@@ -28,6 +40,7 @@ class ConfigLoader:
             try:
                 with open(path, 'r', encoding='utf-8') as json_data_file:
                     data = json.load(json_data_file)
+                    data.update(json.loads(os.environ.get(OVERRIDES_ENV) or "{}"))
 
                     bypass_check_keys = data.get('SmartTest', False)
                     key_validation_result = None  # Initialize to a default value
@@ -46,92 +59,154 @@ class ConfigLoader:
                 raise RuntimeError(f"Unexpected problem loading configuration file: {e}. \n* Please check your config.json *")
 
         if ConfigLoader._json_data:
-            for key, value in ConfigLoader._json_data.items():
-                setattr(self, key, value)
-
-            data = ConfigLoader._json_data
-
-            today = datetime.today()
-            self.json_data = data
-            self.autostart = True
-            self.ipExec = str(data["ipExec"]) if "ipExec" in data else ""
-            self.url_set_start_exec = str(data["UrlSetStartExec"]) if "UrlSetStartExec" in data else ""
-            self.url_set_end_exec = str(data["UrlSetEndExec"]) if "UrlSetEndExec" in data else ""
-            self.screenshot = bool(data["ScreenShot"]) if "ScreenShot" in data else True
-            self.country = str(data["Country"]) if "Country" in data else "BRA"
-            self.execution_id = str(data["ExecId"]) if "ExecId" in data else today.strftime('%Y%m%d')
-            self.num_exec = str(data["NumExec"]) if "NumExec" in data else ""
-            self.issue = str(data["MotExec"]) if "MotExec" in data else ""
-            self.url = str(data["Url"]) if "Url" in data else ""
-            self.browser = str(data["Browser"]) if "Browser" in data else ""
-            self.environment = str(data["Environment"])  if "Environment" in data else ""
-            self.user = str(data["User"]) if "User" in data else ""
-            self.password = str(data["Password"]) if "Password" in data else ""
-            self.language = str(data["Language"]) if "Language" in data else ""
-            self.skip_environment = ("SkipEnvironment" in data and bool(data["SkipEnvironment"]))
-            self.headless = ("Headless" in data and bool(data["Headless"]))
-            self.log_folder = str(data["LogFolder"]) if "LogFolder" in data else ""
-            self.log_file = ("LogFile" in data and bool(data["LogFile"]))
-            self.debug_log = ("DebugLog" in data and bool(data["DebugLog"]))
-            self.time_out = int(data["TimeOut"]) if "TimeOut" in data else 90
-            self.parameter_menu = str(data["ParameterMenu"]) if "ParameterMenu" in data else ""
-            self.screenshot_folder = str(data["ScreenshotFolder"]) if "ScreenshotFolder" in data else ""
-            self.coverage = ("Coverage" in data  and bool(data["Coverage"]))
-            self.skip_restart = ("SkipRestart" in data and bool(data["SkipRestart"]))
-            self.smart_test = ("SmartTest" in data and bool(data["SmartTest"]))
-            self.smart_erp = ("SmartERP" in data and bool(data["SmartERP"]))
-            self.user_cfg = str(data["UserCfg"]) if "UserCfg" in data else ""
-            self.password_cfg = str(data["PasswordCfg"]) if "PasswordCfg" in data else ""
-            self.electron_binary_path = (str(data["BinPath"]) if "BinPath" in data else "")
-            self.csv_path = (str(data["CSVPath"]) if "CSVPath" in data else "")
-            self.database_driver = str(data["DBDriver"]) if "DBDriver" in data else ""
-            self.database_server = str(data["DBServer"]) if "DBServer" in data else ""
-            self.database_port = str(data["DBPort"]) if "DBPort" in data else ""
-            self.database_name = str(data["DBName"]) if "DBName" in data else ""
-            self.database_user = str(data["DBUser"]) if "DBUser" in data else ""
-            self.database_password = str(data["DBPassword"]) if "DBPassword" in data else ""
-            self.dbq_oracle_server = str(data["DBQOracleServer"]) if "DBQOracleServer" in data else ""
-            self.url_tss = str(data["URL_TSS"]) if "URL_TSS" in data else ""
-            self.start_program = str(data["StartProgram"]) if "StartProgram" in data else ""
-            self.new_log = ("NewLog" in data  and bool(data["NewLog"]))
-            self.logurl1 = str(data["LogUrl1"]) if "LogUrl1" in data else ""
-            self.logurl2 = str(data["LogUrl2"]) if "LogUrl2" in data else ""
-            self.parameter_url = bool(data["ParameterUrl"]) if "ParameterUrl" in data else False
-            self.log_http = str(data["LogHttp"]) if "LogHttp" in data else ""
-            self.baseline_spool = str(data["BaseLine_Spool"]) if "BaseLine_Spool" in data else ""
-            self.check_value = (bool(data["CheckValue"]) if "CheckValue" in data else None)
-            self.poui_login = bool(data["POUILogin"]) if "POUILogin" in data else False
-            self.poui = bool(data["POUI"]) if "POUI" in data else False
-            self.log_info_config = bool(data["LogInfoConfig"]) if "LogInfoConfig" in data else False
-            self.release = str(data["Release"]) if "Release" in data else "12.1.2210"
-            self.top_database = str(data["TopDataBase"]) if "TopDataBase" in data else "MSSQL"
-            self.lib_version = str(data["Lib"]) if "Lib" in data else "lib_version"
-            self.build_version = str(data["Build"]) if "Build" in data else "build_version"
-            self.appserver_folder = str(data["AppServerFolder"]) if "AppServerFolder" in data else ""
-            self.destination_folder = str(data["DestinationFolder"]) if "DestinationFolder" in data else ""
-            self.appserver_service = str(data["AppServerService"]) if "AppServerService" in data else ""
-            self.check_dump = ("CheckDump" in data and bool(data["CheckDump"]))
-            self.chromedriver_auto_install = ("ChromeDriverAutoInstall" in data and bool(data["ChromeDriverAutoInstall"]))
-            self.ssl_chrome_auto_install_disable = (
-                        "SSLChromeInstallDisable" in data and bool(data["SSLChromeInstallDisable"]))
-            self.data_delimiter = str(data["DataDelimiter"]) if "DataDelimiter" in data else "/"
-            self.procedure_menu = str(data["ProcedureMenu"]) if "ProcedureMenu" in data else ""
-            self.valid_language = self.language != ""
-            self.initial_program = ""
-            self.routine = ""
-            self.date = ""
-            self.group = ""
-            self.branch = ""
-            self.module = ""
-            self.routine_type = ""
-            self.api_url = str(data["APIURL"]) if "APIURL" in data else ""
-            self.api_url_ip = str(data["APIURLIP"]) if "APIURLIP" in data else ""
-            self.api_json_path = str(data["APIJSONPATH"]) if "APIJSONPATH" in data else os.path.join(os.getcwd())
-            self.server_mock  = str(data["ServerMock"]) if "ServerMock" in data else ""
-            self.sso_login = ("SSOLogin" in data and bool(data["SSOLogin"]))
-            self.new_home = ("NewHome" in data and bool(data["NewHome"]))
-            self._flag_is_new_browse = None
-            self.routine_module = ""
+            self._apply(ConfigLoader._json_data)
+
+
+    def derive(self, overrides=None):
+        """
+        Returns a new config with the config.json keys of this config replaced by the overrides.
+
+        The config.json data is shared with this config and only the override keys are copied, so
+        a config per worker or environment is cheap to create. Changes made at runtime to the new
+        config don't affect this one.
+
+        :param overrides: config.json keys and values. - **Default:** None
+        :type overrides: dict
+
+        :return: The new config.
+        :rtype: ConfigLoader
+
+        Usage:
+
+        >>> # Calling the method:
+        >>> config = ConfigLoader().derive({"Environment": "SPED", "User": "tir02"})
+        >>> with use_session(Session("sped", config=config)):
+        >>>     oHelper = Webapp()
+        """
+        overrides = dict(overrides or {})
+
+        if not self.json_data.get('SmartTest', False):
+            key_validation_result = self.check_keys(overrides)
+            if key_validation_result:
+                raise ValueError(f"Configuration validation error: {key_validation_result}")
+
+        config = object.__new__(type(self))
+        config._apply({**self.json_data, **overrides})
+        return config
+
+
+    def _apply(self, data):
+        """
+        [Internal]
+
+        Sets the attributes of the config from the config.json keys.
+        """
+        for key, value in data.items():
+            setattr(self, key, value)
+
+        today = datetime.today()
+        self.json_data = data
+        self.autostart = True
+        self.ipExec = str(data["ipExec"]) if "ipExec" in data else ""
+        self.url_set_start_exec = str(data["UrlSetStartExec"]) if "UrlSetStartExec" in data else ""
+        self.url_set_end_exec = str(data["UrlSetEndExec"]) if "UrlSetEndExec" in data else ""
+        self.screenshot = bool(data["ScreenShot"]) if "ScreenShot" in data else True
+        self.country = str(data["Country"]) if "Country" in data else "BRA"
+        self.execution_id = str(data["ExecId"]) if "ExecId" in data else today.strftime('%Y%m%d')
+        self.num_exec = str(data["NumExec"]) if "NumExec" in data else ""
+        self.issue = str(data["MotExec"]) if "MotExec" in data else ""
+        self.url = str(data["Url"]) if "Url" in data else ""
+        self.browser = str(data["Browser"]) if "Browser" in data else ""
+        self.environment = str(data["Environment"])  if "Environment" in data else ""
+        self.user = str(data["User"]) if "User" in data else ""
+        self.password = str(data["Password"]) if "Password" in data else ""
+        self.language = str(data["Language"]) if "Language" in data else ""
+        self.skip_environment = ("SkipEnvironment" in data and bool(data["SkipEnvironment"]))
+        self.headless = ("Headless" in data and bool(data["Headless"]))
+        self.log_folder = str(data["LogFolder"]) if "LogFolder" in data else ""
+        self.log_file = ("LogFile" in data and bool(data["LogFile"]))
+        self.debug_log = ("DebugLog" in data and bool(data["DebugLog"]))
+        self.time_out = int(data["TimeOut"]) if "TimeOut" in data else 90
+        self.parameter_menu = str(data["ParameterMenu"]) if "ParameterMenu" in data else ""
+        self.screenshot_folder = str(data["ScreenshotFolder"]) if "ScreenshotFolder" in data else ""
+        self.coverage = ("Coverage" in data  and bool(data["Coverage"]))
+        self.skip_restart = ("SkipRestart" in data and bool(data["SkipRestart"]))
+        self.smart_test = ("SmartTest" in data and bool(data["SmartTest"]))
+        self.smart_erp = ("SmartERP" in data and bool(data["SmartERP"]))
+        self.user_cfg = str(data["UserCfg"]) if "UserCfg" in data else ""
+        self.password_cfg = str(data["PasswordCfg"]) if "PasswordCfg" in data else ""
+        self.electron_binary_path = (str(data["BinPath"]) if "BinPath" in data else "")
+        self.csv_path = (str(data["CSVPath"]) if "CSVPath" in data else "")
+        self.database_driver = str(data["DBDriver"]) if "DBDriver" in data else ""
+        self.database_server = str(data["DBServer"]) if "DBServer" in data else ""
+        self.database_port = str(data["DBPort"]) if "DBPort" in data else ""
+        self.database_name = str(data["DBName"]) if "DBName" in data else ""
+        self.database_user = str(data["DBUser"]) if "DBUser" in data else ""
+        self.database_password = str(data["DBPassword"]) if "DBPassword" in data else ""
+        self.dbq_oracle_server = str(data["DBQOracleServer"]) if "DBQOracleServer" in data else ""
+        self.database_pool_size = int(data["DBPoolSize"]) if "DBPoolSize" in data else 5
+        self.url_tss = str(data["URL_TSS"]) if "URL_TSS" in data else ""
+        self.start_program = str(data["StartProgram"]) if "StartProgram" in data else ""
+        self.new_log = ("NewLog" in data  and bool(data["NewLog"]))
+        self.logurl1 = str(data["LogUrl1"]) if "LogUrl1" in data else ""
+        self.logurl2 = str(data["LogUrl2"]) if "LogUrl2" in data else ""
+        self.parameter_url = bool(data["ParameterUrl"]) if "ParameterUrl" in data else False
+        self.log_http = str(data["LogHttp"]) if "LogHttp" in data else ""
+        self.baseline_spool = str(data["BaseLine_Spool"]) if "BaseLine_Spool" in data else ""
+        self.check_value = (bool(data["CheckValue"]) if "CheckValue" in data else None)
+        self.poui_login = bool(data["POUILogin"]) if "POUILogin" in data else False
+        self.poui = bool(data["POUI"]) if "POUI" in data else False
+        self.log_info_config = bool(data["LogInfoConfig"]) if "LogInfoConfig" in data else False
+        self.release = str(data["Release"]) if "Release" in data else "12.1.2210"
+        self.top_database = str(data["TopDataBase"]) if "TopDataBase" in data else "MSSQL"
+        self.lib_version = str(data["Lib"]) if "Lib" in data else "lib_version"
+        self.build_version = str(data["Build"]) if "Build" in data else "build_version"
+        self.appserver_folder = str(data["AppServerFolder"]) if "AppServerFolder" in data else ""
+        self.destination_folder = str(data["DestinationFolder"]) if "DestinationFolder" in data else ""
+        self.appserver_service = str(data["AppServerService"]) if "AppServerService" in data else ""
+        self.check_dump = ("CheckDump" in data and bool(data["CheckDump"]))
+        self.chromedriver_auto_install = ("ChromeDriverAutoInstall" in data and bool(data["ChromeDriverAutoInstall"]))
+        self.ssl_chrome_auto_install_disable = (
+                    "SSLChromeInstallDisable" in data and bool(data["SSLChromeInstallDisable"]))
+        self.data_delimiter = str(data["DataDelimiter"]) if "DataDelimiter" in data else "/"
+        self.procedure_menu = str(data["ProcedureMenu"]) if "ProcedureMenu" in data else ""
+        self.valid_language = self.language != ""
+        self.initial_program = ""
+        self.routine = ""
+        self.date = ""
+        self.group = ""
+        self.branch = ""
+        self.module = ""
+        self.routine_type = ""
+        self.api_url = str(data["APIURL"]) if "APIURL" in data else ""
+        self.api_url_ip = str(data["APIURLIP"]) if "APIURLIP" in data else ""
+        self.api_json_path = str(data["APIJSONPATH"]) if "APIJSONPATH" in data else os.path.join(os.getcwd())
+        self.server_mock  = str(data["ServerMock"]) if "ServerMock" in data else ""
+        self.sso_login = ("SSOLogin" in data and bool(data["SSOLogin"]))
+        self.new_home = ("NewHome" in data and bool(data["NewHome"]))
+        self.async_log = bool(data["AsyncLog"]) if "AsyncLog" in data else True
+        self.log_queue_size = int(data["LogQueueSize"]) if "LogQueueSize" in data else 1000
+        self.screenshot_format = str(data["ScreenshotFormat"]) if "ScreenshotFormat" in data else "png"
+        self.screenshot_quality = int(data["ScreenshotQuality"]) if "ScreenshotQuality" in data else 80
+        self.results_store = ("ResultsStore" in data and bool(data["ResultsStore"]))
+        self.log_json = ("LogJson" in data and bool(data["LogJson"]))
+        self.log_flush_interval = float(data["LogFlushInterval"]) if "LogFlushInterval" in data else 5
+        self.log_max_size = int(data["LogMaxSize"]) if "LogMaxSize" in data else 50
+        self.log_max_age = int(data["LogMaxAge"]) if "LogMaxAge" in data else 0
+        self.log_folder_quota = int(data["LogFolderQuota"]) if "LogFolderQuota" in data else 0
+        self.log_record_queue_size = int(data["LogRecordQueueSize"]) if "LogRecordQueueSize" in data else 10000
+        self.history_path = str(data["HistoryPath"]) if "HistoryPath" in data else ""
+        self.session_pool = ("SessionPool" in data and bool(data["SessionPool"]))
+        self.session_pool_max_uses = int(data["SessionPoolMaxUses"]) if "SessionPoolMaxUses" in data else 20
+        self.soft_recovery = bool(data["SoftRecovery"]) if "SoftRecovery" in data else True
+        self.driver_cache_path = str(data["DriverCachePath"]) if "DriverCachePath" in data else ""
+        self.driver_cache_offline = ("DriverCacheOffline" in data and bool(data["DriverCacheOffline"]))
+        self.chromedriver_version = str(data["ChromeDriverVersion"]) if "ChromeDriverVersion" in data else ""
+        self.async_transport = ("AsyncTransport" in data and bool(data["AsyncTransport"]))
+        self.startup_profile = ("StartupProfile" in data and bool(data["StartupProfile"]))
+        self.startup_trace = ("StartupTrace" in data and bool(data["StartupTrace"]))
+        self._flag_is_new_browse = None
+        self.routine_module = ""
 
 
     def check_keys(self, json_data):
@@ -173,6 +248,7 @@ class ConfigLoader:
         "DBUser",
         "DBPassword",
         "DBQOracleServer",
+        "DBPoolSize",
         "URL_TSS",
         "StartProgram",
         "NewLog",
@@ -202,7 +278,28 @@ class ConfigLoader:
         "APIJSONPATH",
         "ServerMock",
         "SSOLogin",
-        "NewHome"
+        "NewHome",
+        "AsyncLog",
+        "LogQueueSize",
+        "ScreenshotFormat",
+        "ScreenshotQuality",
+        "ResultsStore",
+        "LogJson",
+        "LogFlushInterval",
+        "LogMaxSize",
+        "LogMaxAge",
+        "LogFolderQuota",
+        "LogRecordQueueSize",
+        "HistoryPath",
+        "SessionPool",
+        "SessionPoolMaxUses",
+        "SoftRecovery",
+        "DriverCachePath",
+        "DriverCacheOffline",
+        "ChromeDriverVersion",
+        "AsyncTransport",
+        "StartupProfile",
+        "StartupTrace"
     ]
         keys_json = set(json_data.keys())
         wrong_keys = keys_json - set(valid_keys)
@@ -0,0 +1,131 @@
+import os
+import threading
+from collections import OrderedDict
+
+"""
+OpenCSV data provider: keeps the files read from CSVPath in a process-wide cache, so the test
+methods of a data-driven suite read each file once, and indexes the filter columns so each
+filter_column/filter_value lookup is a dict lookup instead of a scan of the whole file.
+
+Entries are keyed by path, delimiter, header and the modification time and size of the file,
+so an edited file is read again.
+"""
+
+MAX_FILES = 32
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+class CsvData:
+    """
+    DataFrame of a CSV file (every value as str, without empty columns) with its filter indexes.
+
+    :param df: The DataFrame read from the file.
+    :type df: pandas.DataFrame
+    """
+
+    def __init__(self, df):
+        self.df = df
+        self.indexes = {}
+        self.lock = threading.Lock()
+
+    def index(self, column):
+        """
+        Returns the row positions of each value of the column, built on the first filter by it.
+
+        :rtype: dict
+        """
+        index = self.indexes.get(column)
+        if index is None:
+            with self.lock:
+                index = self.indexes.get(column)
+                if index is None:
+                    index = {}
+                    for position, value in enumerate(self.df[column].tolist()):
+                        index.setdefault(value, []).append(position)
+                    self.indexes[column] = index
+        return index
+
+    def filter(self, column, value):
+        """
+        Returns the rows whose column is equal to value, keeping their original index.
+
+        :rtype: pandas.DataFrame
+        """
+        return self.df.iloc[self.index(column).get(value, [])]
+
+
+def read_csv(path, delimiter=";", header=None, on_bad_lines="error"):
+    """
+    Returns the CsvData of the file, reading it only when it isn't cached or was changed.
+
+    :param path: Path of the CSV file.
+    :type path: str
+    :param delimiter: Delimiter of the file. - **Default:** ";"
+    :type delimiter: str
+    :param header: 'infer' when the first line is the header, None otherwise. - **Default:** None
+    :type header: str
+    :param on_bad_lines: What pandas does with lines with too many fields ("error" or "skip"). - **Default:** "error"
+    :type on_bad_lines: str
+
+    :rtype: CsvData
+
+    Usage:
+
+    >>> # Calling the method:
+    >>> data = read_csv(path, delimiter=";", header="infer")
+    >>> df = data.filter("CAMPO", "A00_FILIAL")
+    """
+    stat = os.stat(path)
+    key = (os.path.abspath(path), delimiter, header, on_bad_lines, stat.st_mtime_ns, stat.st_size)
+
+    with _cache_lock:
+        data = _cache.get(key)
+        if data is not None:
+            _cache.move_to_end(key)
+            return data
+
+    import pandas as pd
+
+    df = pd.read_csv(path, sep=delimiter, encoding='latin-1', on_bad_lines=on_bad_lines, header=header, index_col=False, dtype=str)
+    data = CsvData(df.dropna(axis=1, how='all'))
+
+    with _cache_lock:
+        for cached_key in [cached_key for cached_key in _cache if cached_key[:4] == key[:4]]:
+            del _cache[cached_key]
+        _cache[key] = data
+        while len(_cache) > MAX_FILES:
+            _cache.popitem(last=False)
+
+    return data
+
+
+def iter_csv(path, delimiter=";", header=None, chunksize=10000, filter_column=None, filter_value="", on_bad_lines="error"):
+    """
+    Reads a very large file in chunks of chunksize rows without caching it, yielding the rows of
+    each chunk (filtered by filter_column and filter_value when they are given). Empty columns
+    are kept, since a chunk doesn't know whether the column is empty in the whole file.
+
+    :param chunksize: Number of rows read at a time. - **Default:** 10000
+    :type chunksize: int
+
+    :return: Generator of DataFrames.
+    """
+    import pandas as pd
+
+    with pd.read_csv(path, sep=delimiter, encoding='latin-1', on_bad_lines=on_bad_lines, header=header, index_col=False,
+                     dtype=str, chunksize=chunksize) as reader:
+        for chunk in reader:
+            if filter_column is not None and filter_value:
+                chunk = chunk[chunk[filter_column] == filter_value]
+            if not chunk.empty:
+                yield chunk
+
+
+def clear_cache():
+    """
+    Removes every file from the cache.
+    """
+    with _cache_lock:
+        _cache.clear()
@@ -0,0 +1,199 @@
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from tir.technologies.core.config import ConfigLoader
+from tir.technologies.core.logging_config import logger
+
+"""
+Local chromedriver cache: keeps one chromedriver per installed Chrome major version (or pinned
+ChromeDriverVersion) in DriverCachePath, shared by every process and restart of the machine,
+so ChromeDriverManager only reaches the network the first time a version is needed.
+webdriver_manager itself is imported only when the cache can't answer.
+
+With DriverCacheOffline the network is never used: the driver must have been downloaded
+before, for example by the prefetch command in an image build:
+
+    python -m tir.technologies.core.driver_cache --prefetch
+"""
+
+INDEX_FOLDER = "index"
+DEFAULT_CACHE_PATH = Path(Path.home(), ".tir", "drivers")
+
+_resolved = {}
+_resolved_lock = threading.Lock()
+
+
+def cache_folder(path=""):
+    """
+    [Internal]
+    """
+    return Path(path) if path else DEFAULT_CACHE_PATH
+
+
+def browser_major_version():
+    """
+    Returns the major version of the installed Google Chrome, read from the operating system.
+
+    :return: The major version, or "" when Chrome was not found.
+    :rtype: str
+    """
+    from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+
+    version = OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+    return version.split(".")[0] if version else ""
+
+
+def cache_key(major_version="", driver_version=""):
+    """
+    [Internal]
+    """
+    version = f"pinned-{driver_version}" if driver_version else major_version
+    return f"{sys.platform}-chrome-{version}"
+
+
+def read_index(folder):
+    """
+    [Internal]
+
+    Returns every driver of the cache by key, from the index folder, where each key has its own file.
+    """
+    index = {}
+    for path in sorted(Path(folder, INDEX_FOLDER).glob("*.json")):
+        entry = read_entry(path)
+        if entry:
+            index[path.stem] = entry
+    return index
+
+
+def read_entry(path):
+    """
+    [Internal]
+    """
+    try:
+        with open(path, encoding="utf-8") as entry_file:
+            return json.load(entry_file)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def write_index(folder, key, driver_path):
+    """
+    [Internal]
+
+    Adds the driver to the index. Each key is written to its own file, replaced atomically, so
+    concurrent processes never read a partial entry nor overwrite the entries of other keys.
+    """
+    index_folder = Path(folder, INDEX_FOLDER)
+    index_folder.mkdir(parents=True, exist_ok=True)
+
+    temp_path = Path(index_folder, f"{key}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(temp_path, mode="w", encoding="utf-8") as entry_file:
+        json.dump({"path": str(driver_path), "time": time.strftime("%Y-%m-%d %H:%M:%S")}, entry_file, indent=2)
+    os.replace(temp_path, Path(index_folder, f"{key}.json"))
+
+
+def cached_driver(folder, key):
+    """
+    [Internal]
+
+    Returns the driver path of the key when it is in the index and the file still exists.
+    """
+    entry = read_entry(Path(folder, INDEX_FOLDER, f"{key}.json"))
+    if entry and os.path.isfile(entry["path"]):
+        return entry["path"]
+    return None
+
+
+def download_driver(folder, key, driver_version="", retries=2, retry_delay=30):
+    """
+    [Internal]
+
+    Downloads the driver with ChromeDriverManager into the cache folder and adds it to the index.
+    """
+    from webdriver_manager.chrome import ChromeDriverManager
+    from webdriver_manager.core.driver_cache import DriverCacheManager
+
+    Path(folder).mkdir(parents=True, exist_ok=True)
+
+    for attempt in range(1, retries + 1):
+        try:
+            driver_path = ChromeDriverManager(driver_version=driver_version or None,
+                                              cache_manager=DriverCacheManager(root_dir=str(folder))).install()
+            write_index(folder, key, driver_path)
+            return driver_path
+        except Exception as e:
+            logger().info(f"Trying get driver_path from ChromeDriverManager().Install: {e}")
+            if attempt == retries:
+                raise
+            time.sleep(retry_delay)
+
+
+def resolve_chromedriver(config=None):
+    """
+    Returns the chromedriver path for the installed Chrome, resolving it only once per process
+    and machine.
+
+    The driver is searched in this process, then in the DriverCachePath index by Chrome major
+    version (or ChromeDriverVersion when pinned), and only then downloaded. With DriverCacheOffline
+    the download is never attempted.
+
+    :param config: The config with DriverCachePath, DriverCacheOffline and ChromeDriverVersion. - **Default:** ConfigLoader()
+    :type config: ConfigLoader
+
+    :return: The chromedriver path.
+    :rtype: str
+
+    Usage:
+
+    >>> # Calling the method:
+    >>> driver_path = resolve_chromedriver(self.config)
+    """
+    config = config or ConfigLoader()
+    folder = cache_folder(config.driver_cache_path)
+
+    with _resolved_lock:
+        if (str(folder), config.chromedriver_version) in _resolved:
+            return _resolved[(str(folder), config.chromedriver_version)]
+
+        major_version = "" if config.chromedriver_version else browser_major_version()
+        if not major_version and not config.chromedriver_version:
+            raise FileNotFoundError("Google Chrome was not found. Install it or pin the driver with ChromeDriverVersion.")
+
+        key = cache_key(major_version, config.chromedriver_version)
+        driver_path = cached_driver(folder, key)
+
+        if not driver_path:
+            if config.driver_cache_offline:
+                raise FileNotFoundError(f"Chromedriver {key} not found in {folder} and DriverCacheOffline is enabled. "
+                                        f"Run: python -m tir.technologies.core.driver_cache --prefetch")
+            if config.ssl_chrome_auto_install_disable:
+                os.environ['WDM_SSL_VERIFY'] = '0'
+            logger().info(f"Downloading chromedriver {key} to {folder}")
+            driver_path = download_driver(folder, key, config.chromedriver_version)
+
+        logger().debug(f"Chromedriver {key}: {driver_path}")
+        _resolved[(str(folder), config.chromedriver_version)] = driver_path
+        return driver_path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Manages the TIR chromedriver cache.")
+    parser.add_argument("--prefetch", action="store_true", help="Downloads the driver of the installed Chrome (or --version)")
+    parser.add_argument("--version", default="", help="Chromedriver version to be pinned")
+    parser.add_argument("--path", default="", help=f"Cache folder. Default: {DEFAULT_CACHE_PATH}")
+    args = parser.parse_args()
+
+    folder = cache_folder(args.path)
+
+    if args.prefetch:
+        key = cache_key("" if args.version else browser_major_version(), args.version)
+        if not args.version and key.endswith("-"):
+            parser.error("Google Chrome was not found, use --version")
+        print(f"{key}: {cached_driver(folder, key) or download_driver(folder, key, args.version)}")
+    else:
+        for key, entry in sorted(read_index(folder).items()):
+            print(f"{key}: {entry['path']} ({entry['time']})")
@@ -1,4 +1,5 @@
 from typing import Callable, Dict, List, Any
+from tir.technologies.core.session import current_session
 
 """
     Event bus for temporary decoupling during WebApp → POUI migration.
@@ -8,16 +9,18 @@ from typing import Callable, Dict, List, Any
 
     Design Patterns:
     - **Observer**: Loose coupling via publish-subscribe for temporary migration needs
-    """
 
-_subscribers: Dict[str, List[Callable[..., Any]]] = {}
+    Handlers are registered in the current Session, so each browser session only
+    receives its own events.
+    """
 
 def subscribe(event_name: str, handler: Callable[..., Any]) -> None:
     """Registra um handler para um evento específico."""
-    _subscribers.setdefault(event_name, []).append(handler)
+    subscribers: Dict[str, List[Callable[..., Any]]] = current_session().subscribers
+    subscribers.setdefault(event_name, []).append(handler)
 
 
 def emit(event_name: str, *args, **kwargs) -> None:
     """Emite um evento, chamando todos os handlers registrados."""
-    for handler in _subscribers.get(event_name, []):
+    for handler in current_session().subscribers.get(event_name, []):
         handler(*args, **kwargs)
@@ -0,0 +1,180 @@
+import argparse
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+
+"""
+Local execution history: keeps every test case result (duration, pass/fail, failure message
+and program) in a sqlite file and reports the slowest tests, duration regressions against a
+rolling baseline and flaky tests, without depending on the remote log dashboard.
+"""
+
+
+class ExecutionHistory:
+    """
+    Stores test case results in a local sqlite file and computes duration and flakiness analytics.
+
+    :param path: Path of the sqlite file.
+    :type path: str
+
+    Usage:
+
+    >>> # Calling the method:
+    >>> history = ExecutionHistory(self.config.history_path)
+    >>> history.record("MATA010TESTSUITE", "test_MATA010_001", "MATA010", 35.2, True)
+    >>> history.slowest(limit=10)
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        self.created = False
+
+    def connect(self):
+        """
+        [Internal]
+        """
+        connection = sqlite3.connect(str(self.path))
+
+        if not self.created:
+            connection.execute("CREATE TABLE IF NOT EXISTS executions (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                               "exec_time TEXT, testsuite TEXT, testcase TEXT, program TEXT, seconds REAL, "
+                               "passed INTEGER, message TEXT, execution_id TEXT, station TEXT, release TEXT)")
+            connection.execute("CREATE INDEX IF NOT EXISTS idx_executions_test ON executions (testsuite, testcase, id)")
+            self.created = True
+
+        return connection
+
+    def record(self, testsuite, testcase, program, seconds, passed, message="", execution_id="", station="", release=""):
+        """
+        Records the result of a test case.
+
+        :param testsuite: Test suite name.
+        :type testsuite: str
+        :param testcase: Test case method name.
+        :type testcase: str
+        :param program: Protheus program.
+        :type program: str
+        :param seconds: Duration of the test case.
+        :type seconds: float
+        :param passed: Whether the test case passed.
+        :type passed: bool
+        :param message: Failure message. - **Default:** "" (empty string)
+        :type message: str
+        """
+        with self.lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = self.connect()
+            try:
+                with connection:
+                    connection.execute("INSERT INTO executions (exec_time, testsuite, testcase, program, seconds, passed, "
+                                       "message, execution_id, station, release) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                       (datetime.today().strftime('%Y-%m-%d %H:%M:%S'), testsuite, testcase, program,
+                                        float(seconds or 0), int(bool(passed)), message, execution_id, station, release))
+            finally:
+                connection.close()
+
+    def runs(self):
+        """
+        [Internal]
+
+        Returns the results grouped by (testsuite, testcase), oldest first.
+        """
+        grouped = {}
+        with self.lock:
+            connection = self.connect()
+            try:
+                for testsuite, testcase, program, seconds, passed in connection.execute(
+                        "SELECT testsuite, testcase, program, seconds, passed FROM executions ORDER BY id"):
+                    grouped.setdefault((testsuite, testcase), []).append((program, seconds, bool(passed)))
+            finally:
+                connection.close()
+        return grouped
+
+    def slowest(self, limit=10):
+        """
+        Returns the tests with the highest average duration.
+
+        :return: List of dicts with testsuite, testcase, program, runs, average and maximum seconds.
+        :rtype: list
+        """
+        result = []
+        for (testsuite, testcase), runs in self.runs().items():
+            durations = [seconds for _, seconds, _ in runs]
+            result.append({"testsuite": testsuite, "testcase": testcase, "program": runs[-1][0], "runs": len(runs),
+                           "average": round(sum(durations) / len(durations), 2), "maximum": max(durations)})
+
+        return sorted(result, key=lambda x: x["average"], reverse=True)[:limit]
+
+    def regressions(self, window=10, threshold=0.5, min_runs=3):
+        """
+        Returns the tests whose last duration exceeds the average of the previous runs by more than threshold.
+
+        :param window: Number of previous runs used as baseline. - **Default:** 10
+        :type window: int
+        :param threshold: Relative increase considered a regression (0.5 = 50%). - **Default:** 0.5
+        :type threshold: float
+        :param min_runs: Minimum number of baseline runs. - **Default:** 3
+        :type min_runs: int
+        """
+        result = []
+        for (testsuite, testcase), runs in self.runs().items():
+            baseline_runs = [seconds for _, seconds, passed in runs[:-1] if passed][-window:]
+            last = runs[-1][1]
+            if len(baseline_runs) < min_runs:
+                continue
+            baseline = sum(baseline_runs) / len(baseline_runs)
+            if baseline and last > baseline * (1 + threshold):
+                result.append({"testsuite": testsuite, "testcase": testcase, "program": runs[-1][0],
+                               "baseline": round(baseline, 2), "last": last, "increase": round(last / baseline - 1, 2)})
+
+        return sorted(result, key=lambda x: x["increase"], reverse=True)
+
+    def flaky(self, window=10, min_runs=3):
+        """
+        Returns the tests that both passed and failed in their last runs, ordered by the
+        number of result changes (flips) divided by the number of runs.
+
+        :param window: Number of last runs analysed. - **Default:** 10
+        :type window: int
+        """
+        result = []
+        for (testsuite, testcase), runs in self.runs().items():
+            results = [passed for _, _, passed in runs][-window:]
+            if len(results) < min_runs or all(results) or not any(results):
+                continue
+            flips = sum(1 for previous, current in zip(results, results[1:]) if previous != current)
+            result.append({"testsuite": testsuite, "testcase": testcase, "program": runs[-1][0], "runs": len(results),
+                           "failures": results.count(False), "flakiness": round(flips / (len(results) - 1), 2)})
+
+        return sorted(result, key=lambda x: x["flakiness"], reverse=True)
+
+
+def print_report(title, rows):
+    """
+    [Internal]
+    """
+    print(f"\n{title}")
+    if not rows:
+        print("  (none)")
+        return
+    columns = list(rows[0].keys())
+    widths = [max(len(str(column)), *(len(str(row[column])) for row in rows)) for column in columns]
+    print("  " + "  ".join(str(column).ljust(width) for column, width in zip(columns, widths)))
+    for row in rows:
+        print("  " + "  ".join(str(row[column]).ljust(width) for column, width in zip(columns, widths)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Reports slowest, regressed and flaky tests from the TIR execution history.")
+    parser.add_argument("path", help="Path of the history sqlite file (HistoryPath)")
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--window", type=int, default=10)
+    parser.add_argument("--threshold", type=float, default=0.5)
+    args = parser.parse_args()
+
+    history = ExecutionHistory(args.path)
+    print_report("Slowest tests", history.slowest(args.limit))
+    print_report("Duration regressions", history.regressions(args.window, args.threshold)[:args.limit])
+    print_report("Flaky tests", history.flaky(args.window)[:args.limit])
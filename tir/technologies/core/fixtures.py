@@ -0,0 +1,204 @@
+import csv
+import json
+import re
+from pathlib import Path
+from sqlalchemy import text
+from tir.technologies.core.logging_config import logger
+
+"""
+Test data fixtures: loads declarative datasets (one CSV or JSON file per Protheus table) in bulk
+through a BaseDatabase engine, and restores the tables after the suite.
+
+Before the rows are inserted, the rows of the table with the same keys are saved and deleted,
+so restore deletes the fixture rows and inserts the saved rows back, leaving the table as it
+was before the load. Protheus tables require unique R_E_C_N_O_ values, so the datasets of
+Protheus tables must have this column.
+
+    SB1T10.csv  -> B1_FILIAL;B1_COD;B1_DESC;B1_TIPO;B1_UM
+    SA1T10.json -> [{"A1_FILIAL": "01", "A1_COD": "TIR001", ...}]
+    data.json   -> {"SB1T10": [...], "SA1T10": [...]}
+"""
+
+IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+# Bind parameters of each batched SELECT, below the limits of Oracle IN lists and SQL Server.
+MAX_PARAMETERS = 1000
+
+
+def identifier(name):
+    """
+    [Internal]
+
+    Returns the table or column name, rejecting anything that is not a plain SQL identifier.
+    """
+    if not IDENTIFIER.match(str(name)):
+        raise ValueError(f"Invalid table or column name in fixture: {name}")
+    return name
+
+
+def read_datasets(paths, delimiter=";"):
+    """
+    Reads the datasets of the files, or of the *.csv and *.json files of the folders.
+
+    The table of a CSV file or of a JSON list is the file name (SB1T10.csv). A JSON object
+    maps table names to their rows.
+
+    :param paths: Dataset files or folders.
+    :type paths: list
+    :param delimiter: Delimiter of the CSV files. - **Default:** ";"
+    :type delimiter: str
+
+    :return: Rows (dicts) by table, in the order of the files.
+    :rtype: dict
+    """
+    datasets = {}
+    for path in map(Path, [paths] if isinstance(paths, (str, Path)) else paths):
+        files = sorted(file for file in path.glob("*") if file.suffix.lower() in (".csv", ".json")) if path.is_dir() else [path]
+        for file in files:
+            if file.suffix.lower() == ".json":
+                with open(file, encoding="utf-8") as json_file:
+                    data = json.load(json_file)
+                tables = data if isinstance(data, dict) else {file.stem: data}
+            else:
+                with open(file, newline="", encoding="utf-8-sig") as csv_file:
+                    tables = {file.stem: list(csv.DictReader(csv_file, delimiter=delimiter))}
+
+            for table, rows in tables.items():
+                datasets.setdefault(identifier(table.upper()), []).extend(rows)
+
+    return datasets
+
+
+class Fixture:
+    """
+    Loads datasets into the database and restores the tables afterwards.
+
+    :param datasets: Rows by table, as returned by read_datasets.
+    :type datasets: dict
+    :param engine: SQLAlchemy engine of the database, for example BaseDatabase().connect_database().
+    :type engine: sqlalchemy.engine.Engine
+    :param keys: Key columns by table, used to save, delete and restore the rows. - **Default:** None (every column of the dataset)
+    :type keys: dict
+    :param batch_size: Number of rows sent by each executemany. - **Default:** 1000
+    :type batch_size: int
+
+    Usage:
+
+    >>> # Calling the method:
+    >>> fixture = Fixture(read_datasets(["fixtures/"]), engine, keys={"SB1T10": ["B1_FILIAL", "B1_COD"]}).load()
+    >>> fixture.restore()
+    """
+
+    def __init__(self, datasets, engine, keys=None, batch_size=1000):
+        self.datasets = datasets
+        self.engine = engine
+        self.keys = {table.upper(): columns for table, columns in (keys or {}).items()}
+        self.batch_size = max(1, batch_size)
+        self.saved = {}
+        self.loaded = {}
+
+    def key_columns(self, table, rows):
+        """
+        [Internal]
+        """
+        return [identifier(column) for column in self.keys.get(table, list(rows[0].keys()))]
+
+    def columns(self, table, rows):
+        """
+        [Internal]
+
+        Returns the columns of the dataset, raising ValueError when a row has other columns than the
+        first one, or when a key column is not in the dataset.
+        """
+        columns = [identifier(column) for column in rows[0].keys()]
+        for index, row in enumerate(rows[1:], start=2):
+            if set(row.keys()) != set(columns):
+                raise ValueError(f"Row {index} of the {table} fixture has the columns {sorted(map(str, row.keys()))}, "
+                                 f"expected {sorted(columns)}")
+
+        missing = [column for column in self.key_columns(table, rows) if column not in columns]
+        if missing:
+            raise ValueError(f"Key columns {missing} are not in the {table} fixture")
+        return columns
+
+    def select_keys(self, conn, table, keys, key_values):
+        """
+        [Internal]
+
+        Returns the rows of the table with the key values, selected in batches of up to
+        MAX_PARAMETERS bind parameters.
+        """
+        rows = []
+        size = max(1, MAX_PARAMETERS // len(keys))
+        for start in range(0, len(key_values), size):
+            batch = key_values[start:start + size]
+            parameters = {f"{column}_{index}": value for index, values in enumerate(batch) for column, value in zip(keys, values)}
+            if len(keys) == 1:
+                where = f"{keys[0]} IN ({', '.join(f':{keys[0]}_{index}' for index in range(len(batch)))})"
+            else:
+                where = " OR ".join(f"({' AND '.join(f'{column} = :{column}_{index}' for column in keys)})" for index in range(len(batch)))
+            rows.extend(dict(row) for row in conn.execute(text(f"SELECT * FROM {table} WHERE {where}"), parameters).mappings())
+        return rows
+
+    def load(self):
+        """
+        Saves and deletes the rows with the keys of the datasets and inserts the datasets,
+        in a single transaction.
+
+        Every row of a dataset must have the same columns, otherwise ValueError is raised before
+        the database is changed.
+
+        :return: The fixture itself.
+        :rtype: Fixture
+        """
+        columns = {table: self.columns(table, rows) for table, rows in self.datasets.items() if rows}
+
+        with self.engine.begin() as conn:
+            for table, rows in self.datasets.items():
+                if not rows:
+                    continue
+                keys = self.key_columns(table, rows)
+                key_values = list({tuple(row[column] for column in keys): None for row in rows})
+                where = " AND ".join(f"{column} = :{column}" for column in keys)
+
+                saved = self.select_keys(conn, table, keys, key_values)
+                self.saved[table] = saved
+
+                self.execute(conn, f"DELETE FROM {table} WHERE {where}", [dict(zip(keys, values)) for values in key_values])
+
+                self.execute(conn, f"INSERT INTO {table} ({', '.join(columns[table])}) VALUES ({', '.join(f':{column}' for column in columns[table])})",
+                             [{column: row[column] for column in columns[table]} for row in rows])
+                self.loaded[table] = key_values
+
+                logger().info(f"[Fixture]: {len(rows)} row(s) loaded in {table} ({len(saved)} row(s) saved)")
+
+        return self
+
+    def restore(self):
+        """
+        Deletes the rows loaded by the fixture and inserts back the saved rows, in a single transaction.
+        """
+        with self.engine.begin() as conn:
+            for table in reversed(list(self.loaded)):
+                keys = self.key_columns(table, self.datasets[table])
+                where = " AND ".join(f"{column} = :{column}" for column in keys)
+                self.execute(conn, f"DELETE FROM {table} WHERE {where}", [dict(zip(keys, values)) for values in self.loaded[table]])
+
+                saved = self.saved.get(table, [])
+                if saved:
+                    columns = [identifier(column) for column in saved[0].keys()]
+                    self.execute(conn, f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(f':{column}' for column in columns)})", saved)
+
+                logger().info(f"[Fixture]: {table} restored ({len(saved)} row(s))")
+
+        self.loaded = {}
+        self.saved = {}
+
+    def execute(self, conn, statement, parameters):
+        """
+        [Internal]
+
+        Executes the statement with executemany in batches of batch_size rows.
+        """
+        for start in range(0, len(parameters), self.batch_size):
+            conn.execute(text(statement), parameters[start:start + self.batch_size])
@@ -0,0 +1,118 @@
+import atexit
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from tir.technologies.core.logging_config import logger
+
+"""
+Shared keep-alive HTTP session for every outbound call made by TIR (log APIs, NumExec and
+execution control endpoints), so each request reuses pooled TCP/TLS connections instead of
+opening a new one.
+
+Each endpoint has its own (connect, read) timeout and its calls are counted in the metrics
+returned by http_metrics().
+"""
+
+ENDPOINT_TIMEOUTS = {
+    "logurl": (10, 120),
+    "createlog": (10, 600),
+    "createlog_ip": (10, 1200),
+    "numexec": (10, 120),
+    "spool": (10, 60),
+}
+
+DEFAULT_TIMEOUT = (10, 120)
+
+_session = None
+_session_lock = threading.Lock()
+_metrics = {}
+_metrics_lock = threading.Lock()
+
+
+def http_session():
+    """
+    Returns the process-wide requests.Session, creating it on first use.
+
+    Connection errors are retried by the adapter, since no data was sent yet. Read errors
+    are not, because the APIs are not idempotent.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            retries = Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.5, allowed_methods=None)
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=retries)
+            _session = requests.Session()
+            _session.mount("http://", adapter)
+            _session.mount("https://", adapter)
+        return _session
+
+
+def post(endpoint, url, **kwargs):
+    """
+    Posts to url using the shared session and the endpoint timeout.
+
+    :param endpoint: Endpoint name, used for the timeout and the metrics.
+    :type endpoint: str
+    :param url: The URL of the request.
+    :type url: str
+
+    :return: The response of the request.
+    :rtype: requests.Response
+
+    Usage:
+
+    >>> # Calling the method:
+    >>> response = post("logurl", server_address, data=json_data, headers=headers)
+    """
+    kwargs.setdefault("timeout", ENDPOINT_TIMEOUTS.get(endpoint, DEFAULT_TIMEOUT))
+    starttime = time.time()
+    error = False
+
+    try:
+        return http_session().post(url, **kwargs)
+    except requests.RequestException:
+        error = True
+        raise
+    finally:
+        record_metric(endpoint, time.time() - starttime, error)
+
+
+def record_metric(endpoint, seconds, error=False):
+    """
+    [Internal]
+    """
+    with _metrics_lock:
+        metric = _metrics.setdefault(endpoint, {"requests": 0, "errors": 0, "seconds": 0.0})
+        metric["requests"] += 1
+        metric["errors"] += 1 if error else 0
+        metric["seconds"] += seconds
+
+
+def http_metrics():
+    """
+    Returns a copy of the request metrics per endpoint: requests, errors and total seconds.
+    """
+    with _metrics_lock:
+        return {endpoint: dict(metric) for endpoint, metric in _metrics.items()}
+
+
+def close_session():
+    """
+    Logs the request metrics and closes the shared session.
+    """
+    global _session
+    try:
+        for endpoint, metric in http_metrics().items():
+            logger().debug(f"[HttpSession]: {endpoint}: {metric['requests']} request(s), {metric['errors']} error(s), {round(metric['seconds'], 2)}s")
+    except Exception:
+        pass
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+atexit.register(close_session)
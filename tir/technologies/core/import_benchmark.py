@@ -0,0 +1,95 @@
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+"""
+Import-time benchmark: measures, in new interpreters, the time to import a TIR module and the
+heavy third-party modules it loads, and checks them against a budget.
+
+    python -m tir.technologies.core.import_benchmark --module tir --budget 0.5
+"""
+
+HEAVY_MODULES = ("cv2", "numpy", "pandas", "sqlalchemy", "webdriver_manager", "psutil", "selenium", "bs4")
+
+# Heavy modules each entry point may load when it is imported.
+ALLOWED_MODULES = {
+    "tir": (),
+    "tir.technologies.webapp_internal": ("selenium", "bs4"),
+    "tir.technologies.poui_internal": ("selenium", "bs4"),
+}
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+print(json.dumps({{"seconds": seconds, "modules": sorted(name for name in {heavy} if name in sys.modules)}}))
+"""
+
+
+def measure(module="tir", runs=5):
+    """
+    Imports the module in runs new interpreters.
+
+    :param module: Module to be imported. - **Default:** "tir"
+    :type module: str
+    :param runs: Number of interpreters. - **Default:** 5
+    :type runs: int
+
+    :return: Dict with the median and max seconds of the import and the heavy modules loaded by it.
+    :rtype: dict
+
+    Usage:
+
+    >>> # Calling the method:
+    >>> result = measure("tir.technologies.webapp_internal")
+    """
+    samples = []
+    modules = []
+    for _ in range(max(1, runs)):
+        output = subprocess.run([sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY_MODULES)],
+                                capture_output=True, text=True, check=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        samples.append(result["seconds"])
+        modules = result["modules"]
+
+    return {"module": module, "median": round(statistics.median(samples), 3), "max": round(max(samples), 3),
+            "modules": modules}
+
+
+def check(result, budget):
+    """
+    Returns the budget violations of a measure result: a median over budget seconds or heavy
+    modules not allowed for the module.
+
+    :rtype: list
+    """
+    errors = []
+    if budget and result["median"] > budget:
+        errors.append(f"import {result['module']} took {result['median']}s (budget {budget}s)")
+
+    unexpected = set(result["modules"]) - set(ALLOWED_MODULES.get(result["module"], HEAVY_MODULES))
+    if unexpected:
+        errors.append(f"import {result['module']} loaded {', '.join(sorted(unexpected))}")
+
+    return errors
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measures the import time of TIR modules.")
+    parser.add_argument("--module", action="append", help=f"Module to be imported. Default: {', '.join(ALLOWED_MODULES)}")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=0, help="Maximum median seconds of each import")
+    args = parser.parse_args()
+
+    errors = []
+    for module in args.module or ALLOWED_MODULES:
+        result = measure(module, args.runs)
+        print(f"{module}: median {result['median']}s, max {result['max']}s, heavy modules: {', '.join(result['modules']) or '-'}")
+        errors.extend(check(result, args.budget))
+
+    for error in errors:
+        print(f"FAILED: {error}")
+    sys.exit(1 if errors else 0)
@@ -1,3 +1,54 @@
+import re
+import threading
+from functools import lru_cache
+from types import MappingProxyType
+
+"""
+Translation of the terms of each supported language.
+
+The tables are built on first use of each language and shared, read-only, by every LanguagePack
+of the process.
+"""
+
+CAPTION_MARKUP = re.compile(r"<[^>]*>")
+
+_tables = {}
+_tables_lock = threading.Lock()
+
+
+def language_table(language):
+    """
+    Returns the read-only table of terms of the language (pt-BR when the language is not supported).
+
+    :param language: Language code, e.g. "pt-BR", "en-US", "es-ES" or "ru-RU".
+    :type language: str
+    :rtype: MappingProxyType
+    """
+    key = language.lower() if language.lower() in _builders else "pt-br"
+    table = _tables.get(key)
+    if table is None:
+        with _tables_lock:
+            table = _tables.get(key)
+            if table is None:
+                table = _tables[key] = MappingProxyType(_builders[key]())
+    return table
+
+
+@lru_cache(maxsize=4096)
+def normalize_caption(caption):
+    """
+    Returns the caption of a button or menu item without markup (e.g. the <u> of the shortcut
+    letter), in lower case, so it can be compared with a term normalized the same way.
+
+    Usage:
+
+    >>> # Calling the method:
+    >>> term = normalize_caption(button)
+    >>> buttons = [x for x in soup_objects if term in normalize_caption(x['caption'])]
+    """
+    return CAPTION_MARKUP.sub("", caption).lower()
+
+
 class LanguagePack:
     '''
     This class is instantiated to contain the translation of terms of each supported language.
@@ -114,476 +165,500 @@ class LanguagePack:
         self.messages = Messages(languagepack)
 
     def get_language_pack(self, language):
+        """
+        Returns the terms of the language, shared by every LanguagePack.
+        """
+        return language_table(language)
 
-        english = {
-            "User": "User",
-            "Password": "Password",
-            "Database": "Basedata",
-            "Group": "Group",
-            "Branch": "Branch",
-            "Environment": "Environment",
-            "Add": "Add",
-            "Delete": "Delete",
-            "Edit": "Edit",
-            "Editar": "Edit", #usado num elemento especifico por conta do ambiente russo
-            "Cancel": "Cancel",
-            "View": "View",
-            "Visualizar": "View", #usado num elemento especifico por conta do ambiente russo
-            "Other Actions": "Other Actions",
-            "Confirm": "Confirm",
-            "Save": "Save",
-            "Close": "Close",
-            "Exit": "Exit",
-            "Leave Page": "Exit page",
-            "Enter": "Enter",
-            "Finish": "Finish",
-            "Details": "Details",
-            "Search": "Search",
-            "Ok": "Ok",
-            "Copy": "Copy",
-            "Cut": "Cut",
-            "Paste": "Paste",
-            "Calculator": "Calculator",
-            "Spool": "Spool",
-            "Folders": 'Folders',
-            "Generate Differential File": "Generate Differential File",
-            "Include": "Insert",
-            "Filter": "Filter",
+
+def english():
+    """
+    [Internal]
+    """
+    return {
+        "User": "User",
+        "Password": "Password",
+        "Database": "Basedata",
+        "Group": "Group",
+        "Branch": "Branch",
+        "Environment": "Environment",
+        "Add": "Add",
+        "Delete": "Delete",
+        "Edit": "Edit",
+        "Editar": "Edit", #usado num elemento especifico por conta do ambiente russo
+        "Cancel": "Cancel",
+        "View": "View",
+        "Visualizar": "View", #usado num elemento especifico por conta do ambiente russo
+        "Other Actions": "Other Actions",
+        "Confirm": "Confirm",
+        "Save": "Save",
+        "Close": "Close",
+        "Exit": "Exit",
+        "Leave Page": "Exit page",
+        "Enter": "Enter",
+        "Finish": "Finish",
+        "Details": "Details",
+        "Search": "Search",
+        "Ok": "Ok",
+        "Copy": "Copy",
+        "Cut": "Cut",
+        "Paste": "Paste",
+        "Calculator": "Calculator",
+        "Spool": "Spool",
+        "Folders": 'Folders',
+        "Generate Differential File": "Generate Differential File",
+        "Include": "Insert",
+        "Filter": "Filter",
 			"Menu About": "Help > About",
-            "Error Log": "SMARTCLIENT a problem has been found while running it and this one will be concluded. For further information click on details.",
-            "Error Log Print": "Error Log Print",
-            "Error Msg Required": "This action could not be completed. There are mandatory fields not field.",
-            "Help": "Help:",
-            "Problem": "Problem:",
-            "Solution": "Solution:",
-            "Branches": "Branches",
-            "Grid Steps Misuse": "Grid steps misuse. Be sure to only use a group of inputs or a group of checks in each Grid Block.",
-            "Grid Steps Empty": "No grid steps were found. Be sure to only use a group of inputs or a group of checks in each Grid Block.",
-            "Grid Line Error": "Line does not exist in current grid.",
-            "Grid Column Error": "Column does not exist in current grid.",
-            "Grid Number Error": "There is not that many grids on the current screen.",
-            "Text Not Found": "Text Not Found.",
-            "Help Not Found": "Help Not Found",
-            "User Not Authenticated": "User Not Authenticated",
-            "Change Environment": "Change environment",
-            "Invert Selection": "Invert Selection",
-            "Parameter Menu": "Environment > Registers > Parameters",
-            "Search 2": "Search",
-            "Search By": "Search by:",
-            "From": "From",
-            "To": "To",
-            "Coins": "Coins",
-            "Next": "Next >>",
-            "LogOff": "Log Off",
-            "Checkhelp": "Help:",
-            "Checkproblem": "Problem:",
-            "Checksolution": "Solution:",
-            "ChangePassword": "Reserved",
-            "UserLogin": "Reserved",
-            "CurrentPassword": "Reserved",
-            "NewPassword": "Reserved",
-            "ConfirmNewPassword": "Reserved",
-            "Yes": "Sim",
-            "AssertFalseMessage": "AssertFalse method used without a checkpoint, check the script.",
-            "File Name": "File Name",
-            "Open": "Open",
-            "Warning": "Warning",
-            "News": "News",
-            "Continue": "Continue",
-            "Short Confirm": "Confirm",
-            "Enter in environment screen": "Enter",
-            "Code Coverage": "Aguarde... Coletando informacoes de cobertura de codigo.",
-            "Release": "Release",
-            "Top DataBase": "Top DataBase",
-            "Lib Version": "Lib Version",
-            "Build": "Build",
-            "Issued": "Issued",
-            "Ref.Dt": "Ref.Dt",
-            "Time": "Time",
-            "End Time": "End Time",
-            "Procedure Menu": "Database > Dictionary > Stored Procedure",
-            "Code": "Code",
-            "Success": "Success",
-            "Procedure Install": "Install selected processes",
-            "Procedure Uninstall": "Remove selected processes",
-            "Schedule Menu": "Settings > Schedule > Schedule",
-            "Input Set Program": "Search and execute",
-            "New Home Menu About": "About",
-            "Filters": "Filters",
-            "Apply Filters": "Apply filters",
-            "Remove Filters": "Remove filters",
-            "Remove All Filters": "Remove all",
-
-            "Old Browse Edit":"Edit",
-            "Old Browse Delete":"Delete",
-            "Old Browse Insert":"Insert",
-            "Old Browse Other Actions":"Other Actions",
-
-            "New Browse Edit":"Edit",
-            "New Browse Delete":"Delete",
-            "New Browse Insert":"Add",
-            "New Browse Other Actions":"Line actions",
-
-            "Perform Advanced Search":"Perform Advanced Search.",
-            "Select":"Select",
-            "Module":"Module",
-            "Change Module":"Change module"
-        }
-
-        brazilian_portuguese = {
-            "User": "Usuário",
-            "Password": "Senha",
-            "Database": "Data base",
-            "Group": "Grupo",
-            "Branch": "Filial",
-            "Environment": "Ambiente",
-            "Add": "Incluir",
-            "Delete": "Excluir",
-            "Edit": "Editar",
-            "Editar": "Editar", #usado num elemento especifico por conta do ambiente russo
-            "Cancel": "Cancelar",
-            "View": "Visualizar",
-            "Visualizar": "Visualizar", #usado num elemento especifico por conta do ambiente russo
-            "Other Actions": "Outras Ações",
-            "Confirm": "Confirmar",
-            "Save": "Salvar",
-            "Close": "Fechar",
-            "Exit": "Sair",
-            "Leave Page": "Sair da página",
-            "Enter": "Entrar",
-            "Finish": "Finalizar",
-            "Details": "Detalhes",
-            "Search": "Pesquisar",
-            "Ok": "Ok",
-            "Copy": "Copiar",
-            "Cut": "Recortar",
-            "Paste": "Colar",
-            "Calculator": "Calculadora",
-            "Spool": "Spool",
-            "Folders": 'Pastas',
-            "Generate Differential File": "Gerar Arquivo Diferencial",
-            "Include": "Incluir",
-            "Filter": "Filtrar",
+        "Error Log": "SMARTCLIENT a problem has been found while running it and this one will be concluded. For further information click on details.",
+        "Error Log Print": "Error Log Print",
+        "Error Msg Required": "This action could not be completed. There are mandatory fields not field.",
+        "Help": "Help:",
+        "Problem": "Problem:",
+        "Solution": "Solution:",
+        "Branches": "Branches",
+        "Grid Steps Misuse": "Grid steps misuse. Be sure to only use a group of inputs or a group of checks in each Grid Block.",
+        "Grid Steps Empty": "No grid steps were found. Be sure to only use a group of inputs or a group of checks in each Grid Block.",
+        "Grid Line Error": "Line does not exist in current grid.",
+        "Grid Column Error": "Column does not exist in current grid.",
+        "Grid Number Error": "There is not that many grids on the current screen.",
+        "Text Not Found": "Text Not Found.",
+        "Help Not Found": "Help Not Found",
+        "User Not Authenticated": "User Not Authenticated",
+        "Change Environment": "Change environment",
+        "Invert Selection": "Invert Selection",
+        "Parameter Menu": "Environment > Registers > Parameters",
+        "Search 2": "Search",
+        "Search By": "Search by:",
+        "From": "From",
+        "To": "To",
+        "Coins": "Coins",
+        "Next": "Next >>",
+        "LogOff": "Log Off",
+        "Checkhelp": "Help:",
+        "Checkproblem": "Problem:",
+        "Checksolution": "Solution:",
+        "ChangePassword": "Reserved",
+        "UserLogin": "Reserved",
+        "CurrentPassword": "Reserved",
+        "NewPassword": "Reserved",
+        "ConfirmNewPassword": "Reserved",
+        "Yes": "Sim",
+        "AssertFalseMessage": "AssertFalse method used without a checkpoint, check the script.",
+        "File Name": "File Name",
+        "Open": "Open",
+        "Warning": "Warning",
+        "News": "News",
+        "Continue": "Continue",
+        "Short Confirm": "Confirm",
+        "Enter in environment screen": "Enter",
+        "Code Coverage": "Aguarde... Coletando informacoes de cobertura de codigo.",
+        "Release": "Release",
+        "Top DataBase": "Top DataBase",
+        "Lib Version": "Lib Version",
+        "Build": "Build",
+        "Issued": "Issued",
+        "Ref.Dt": "Ref.Dt",
+        "Time": "Time",
+        "End Time": "End Time",
+        "Procedure Menu": "Database > Dictionary > Stored Procedure",
+        "Code": "Code",
+        "Success": "Success",
+        "Procedure Install": "Install selected processes",
+        "Procedure Uninstall": "Remove selected processes",
+        "Schedule Menu": "Settings > Schedule > Schedule",
+        "Input Set Program": "Search and execute",
+        "New Home Menu About": "About",
+        "Filters": "Filters",
+        "Apply Filters": "Apply filters",
+        "Remove Filters": "Remove filters",
+        "Remove All Filters": "Remove all",
+
+        "Old Browse Edit":"Edit",
+        "Old Browse Delete":"Delete",
+        "Old Browse Insert":"Insert",
+        "Old Browse Other Actions":"Other Actions",
+
+        "New Browse Edit":"Edit",
+        "New Browse Delete":"Delete",
+        "New Browse Insert":"Add",
+        "New Browse Other Actions":"Line actions",
+
+        "Perform Advanced Search":"Perform Advanced Search.",
+        "Select":"Select",
+        "Module":"Module",
+        "Change Module":"Change module"
+    }
+
+
+def brazilian_portuguese():
+    """
+    [Internal]
+    """
+    return {
+        "User": "Usuário",
+        "Password": "Senha",
+        "Database": "Data base",
+        "Group": "Grupo",
+        "Branch": "Filial",
+        "Environment": "Ambiente",
+        "Add": "Incluir",
+        "Delete": "Excluir",
+        "Edit": "Editar",
+        "Editar": "Editar", #usado num elemento especifico por conta do ambiente russo
+        "Cancel": "Cancelar",
+        "View": "Visualizar",
+        "Visualizar": "Visualizar", #usado num elemento especifico por conta do ambiente russo
+        "Other Actions": "Outras Ações",
+        "Confirm": "Confirmar",
+        "Save": "Salvar",
+        "Close": "Fechar",
+        "Exit": "Sair",
+        "Leave Page": "Sair da página",
+        "Enter": "Entrar",
+        "Finish": "Finalizar",
+        "Details": "Detalhes",
+        "Search": "Pesquisar",
+        "Ok": "Ok",
+        "Copy": "Copiar",
+        "Cut": "Recortar",
+        "Paste": "Colar",
+        "Calculator": "Calculadora",
+        "Spool": "Spool",
+        "Folders": 'Pastas',
+        "Generate Differential File": "Gerar Arquivo Diferencial",
+        "Include": "Incluir",
+        "Filter": "Filtrar",
 			"Menu About": "Ajuda > Sobre",
-            "Error Log": "SMARTCLIENT encontrou um problema durante a execucao e sera finalizado. Para informacoes adicionais clique em detalhes",
-            "Error Log Print": "SMARTCLIENT encontrou um problema durante a execucao e sera finalizado. Para informacoes adicionais verifique print efetuado da tela",
-            "Error Msg Required": "Não é possível completar a ação. Existem campos obrigatórios não preenchidos.",
-            "Help": "Ajuda:",
-            "Problem": "Problema:",
-            "Solution": "Solução:",
-            "Branches": "Filiais",
-            "Grid Steps Misuse": "Uso de grid errado. Passe apenas um grupo de inputs ou um grupo de checks em cada bloco de grid.",
-            "Grid Steps Empty": "Nenhum passo de grid encontrado. Passe um grupo de inputs ou um grupo de checks em cada bloco de grid.",
-            "Grid Line Error": "Linha não existe na grid atual.",
-            "Grid Column Error": "Coluna não existe na grid atual.",
-            "Grid Number Error": "Não existe essa quantidade de grids na tela atual.",
-            "Text Not Found": "Texto não encontrado.",
-            "Help Not Found": "Help não encontrado.",
-            "User Not Authenticated": "Usuário não autenticado",
-            "Change Environment": "Trocar módulo",
-            "Invert Selection": "Inverte Seleção",
-            "Parameter Menu": "Ambiente > Cadastros > Parâmetros",
-            "Search 2": "Buscar",
-            "Search By": "Procurar por:",
-            "From": "De",
-            "To": "Ate",
-            "Coins": "Moedas",
-            "Next": "Avançar >>",
-            "LogOff": "Log Off",
-            "Checkhelp": "Help:",
-            "Checkproblem": "Problema:",
-            "Checksolution": "Solução:",
-            "ChangePassword": "Alterar Senha",
-            "UserLogin": "Login do usuário",
-            "CurrentPassword": "Senha atual",
-            "NewPassword": "Nova senha",
-            "ConfirmNewPassword": "Confirmar nova senha",
-            "Yes": "Sim",
-            "AssertFalseMessage": "Método AssertFalse utilizado sem um ponto de verificação, verifique o script.",
-            "File Name": "Nome do Arquivo",
+        "Error Log": "SMARTCLIENT encontrou um problema durante a execucao e sera finalizado. Para informacoes adicionais clique em detalhes",
+        "Error Log Print": "SMARTCLIENT encontrou um problema durante a execucao e sera finalizado. Para informacoes adicionais verifique print efetuado da tela",
+        "Error Msg Required": "Não é possível completar a ação. Existem campos obrigatórios não preenchidos.",
+        "Help": "Ajuda:",
+        "Problem": "Problema:",
+        "Solution": "Solução:",
+        "Branches": "Filiais",
+        "Grid Steps Misuse": "Uso de grid errado. Passe apenas um grupo de inputs ou um grupo de checks em cada bloco de grid.",
+        "Grid Steps Empty": "Nenhum passo de grid encontrado. Passe um grupo de inputs ou um grupo de checks em cada bloco de grid.",
+        "Grid Line Error": "Linha não existe na grid atual.",
+        "Grid Column Error": "Coluna não existe na grid atual.",
+        "Grid Number Error": "Não existe essa quantidade de grids na tela atual.",
+        "Text Not Found": "Texto não encontrado.",
+        "Help Not Found": "Help não encontrado.",
+        "User Not Authenticated": "Usuário não autenticado",
+        "Change Environment": "Trocar módulo",
+        "Invert Selection": "Inverte Seleção",
+        "Parameter Menu": "Ambiente > Cadastros > Parâmetros",
+        "Search 2": "Buscar",
+        "Search By": "Procurar por:",
+        "From": "De",
+        "To": "Ate",
+        "Coins": "Moedas",
+        "Next": "Avançar >>",
+        "LogOff": "Log Off",
+        "Checkhelp": "Help:",
+        "Checkproblem": "Problema:",
+        "Checksolution": "Solução:",
+        "ChangePassword": "Alterar Senha",
+        "UserLogin": "Login do usuário",
+        "CurrentPassword": "Senha atual",
+        "NewPassword": "Nova senha",
+        "ConfirmNewPassword": "Confirmar nova senha",
+        "Yes": "Sim",
+        "AssertFalseMessage": "Método AssertFalse utilizado sem um ponto de verificação, verifique o script.",
+        "File Name": "Nome do Arquivo",
 			"Open": "Abrir",
-            "Warning": "Atenção",
-            "News": "Novidades do",
-            "Continue": "Continuar",
-            "Short Confirm": "Confirmar",
-            "Enter in environment screen": "Entrar",
-            "Code Coverage": "Aguarde... Coletando informacoes de cobertura de codigo.",
-            "Release": "Release",
-            "Top DataBase": "Top DataBase",
-            "Lib Version": "Versão da lib",
-            "Build": "Build",
-            "Issued": "Emissão",
-            "Ref.Dt": "DT.Ref.",
-            "Time": "Hora",
-            "End Time": "Hora Término",
-            "Procedure Menu": "Base de Dados > Dicionário > Stored Procedure",
-            "Code": "Código",
-            "Success": "Sucessos",
-            "Procedure Install": "Instalar processos selecionados",
-            "Procedure Uninstall": "Remover processos selecionados",
-            "Schedule Menu": "Ambiente > Schedule > Schedule",
-            "Input Set Program": "Pesquisar e executar",
-            "New Home Menu About": "Sobre",
-            "Filters": "Filtros",
-            "Apply Filters": "Aplicar Filtros",
-            "Remove Filters": "Remover filtros",
-            "Remove All Filters": "Remover todos",
-
-            "Old Browse Edit":"Alterar",
-            "Old Browse Delete":"Excluir",
-            "Old Browse Insert":"Incluir",
-            "Old Browse Other Actions":"Outras Ações",
-
-            "New Browse Edit":"Editar",
-            "New Browse Delete":"Excluir",
-            "New Browse Insert":"Incluir",
-            "New Browse Other Actions":"Ações de registro",
-
-            "Perform Advanced Search":"Fazer busca avançada.",
-            "Select":"Selecionar",
-            "Module":"Módulo",
-            "Change Module":"Alterar módulo"
-        }
-        spanish = {
-            "User": "Usuário",
-            "Password": "Senha",
-            "Database": "Fecha base",
-            "Group": "Grupo",
-            "Branch": "Sucursal",
-            "Environment": "Entorno",
-            "Add": "Incluir",
-            "Delete": "Excluir",
-            "Edit": "Editar",
-            "Editar": "Editar", #usado num elemento especifico por conta do ambiente russo
-            "Cancel": "Anular",
-            "View": "Visualizar",
-            "Visualizar": "Visualizar", #usado num elemento especifico por conta do ambiente russo
-            "Other Actions": "Otras Acciones",
-            "Confirm": "Confirmar",
-            "Save": "Grabar",
-            "Close": "Finalizar",
-            "Exit": "Salir",
-            "Leave Page": "Sair da página",
-            "Enter": "Entrar",
-            "Finish": "Terminar",
-            "Details": "Detalles",
-            "Search": "Buscar",
-            "Ok": "Ok",
-            "Copy": "Copiar",
-            "Cut": "Recortar",
-            "Paste": "Colar",
-            "Calculator": "Calculadora",
-            "Spool": "Spool",
-            "Folders": 'Pastas',
-            "Generate Differential File": "Gerar Arquivo Diferencial",
-            "Include": "Incluir",
-            "Filter": "Filtrar",
+        "Warning": "Atenção",
+        "News": "Novidades do",
+        "Continue": "Continuar",
+        "Short Confirm": "Confirmar",
+        "Enter in environment screen": "Entrar",
+        "Code Coverage": "Aguarde... Coletando informacoes de cobertura de codigo.",
+        "Release": "Release",
+        "Top DataBase": "Top DataBase",
+        "Lib Version": "Versão da lib",
+        "Build": "Build",
+        "Issued": "Emissão",
+        "Ref.Dt": "DT.Ref.",
+        "Time": "Hora",
+        "End Time": "Hora Término",
+        "Procedure Menu": "Base de Dados > Dicionário > Stored Procedure",
+        "Code": "Código",
+        "Success": "Sucessos",
+        "Procedure Install": "Instalar processos selecionados",
+        "Procedure Uninstall": "Remover processos selecionados",
+        "Schedule Menu": "Ambiente > Schedule > Schedule",
+        "Input Set Program": "Pesquisar e executar",
+        "New Home Menu About": "Sobre",
+        "Filters": "Filtros",
+        "Apply Filters": "Aplicar Filtros",
+        "Remove Filters": "Remover filtros",
+        "Remove All Filters": "Remover todos",
+
+        "Old Browse Edit":"Alterar",
+        "Old Browse Delete":"Excluir",
+        "Old Browse Insert":"Incluir",
+        "Old Browse Other Actions":"Outras Ações",
+
+        "New Browse Edit":"Editar",
+        "New Browse Delete":"Excluir",
+        "New Browse Insert":"Incluir",
+        "New Browse Other Actions":"Ações de registro",
+
+        "Perform Advanced Search":"Fazer busca avançada.",
+        "Select":"Selecionar",
+        "Module":"Módulo",
+        "Change Module":"Alterar módulo"
+    }
+
+
+def spanish():
+    """
+    [Internal]
+    """
+    return {
+        "User": "Usuário",
+        "Password": "Senha",
+        "Database": "Fecha base",
+        "Group": "Grupo",
+        "Branch": "Sucursal",
+        "Environment": "Entorno",
+        "Add": "Incluir",
+        "Delete": "Excluir",
+        "Edit": "Editar",
+        "Editar": "Editar", #usado num elemento especifico por conta do ambiente russo
+        "Cancel": "Anular",
+        "View": "Visualizar",
+        "Visualizar": "Visualizar", #usado num elemento especifico por conta do ambiente russo
+        "Other Actions": "Otras Acciones",
+        "Confirm": "Confirmar",
+        "Save": "Grabar",
+        "Close": "Finalizar",
+        "Exit": "Salir",
+        "Leave Page": "Sair da página",
+        "Enter": "Entrar",
+        "Finish": "Terminar",
+        "Details": "Detalles",
+        "Search": "Buscar",
+        "Ok": "Ok",
+        "Copy": "Copiar",
+        "Cut": "Recortar",
+        "Paste": "Colar",
+        "Calculator": "Calculadora",
+        "Spool": "Spool",
+        "Folders": 'Pastas',
+        "Generate Differential File": "Gerar Arquivo Diferencial",
+        "Include": "Incluir",
+        "Filter": "Filtrar",
 			"Menu About": "Ayuda > Sobre",
-            "Error Log": "SMARTCLIENT encontrou um problema durante a execucao e sera finalizado. Para informacoes adicionais clique em detalhes",
-            "Error Log Print": "SMARTCLIENT encontrou um problema durante a execucao e sera finalizado. Para informacoes adicionais verifique print efetuado da tela",
-            "Error Msg Required": "Não é possível completar a ação. Existem campos obrigatórios não preenchidos.",
-            "Help": "Ajuda:",
-            "Problem": "Problema:",
-            "Solution": "Solução:",
-            "Branches": "Filiais",
-            "Grid Steps Misuse": "Uso de grid errado. Passe apenas um grupo de inputs ou um grupo de checks em cada bloco de grid.",
-            "Grid Steps Empty": "Nenhum passo de grid encontrado. Passe um grupo de inputs ou um grupo de checks em cada bloco de grid.",
-            "Grid Line Error": "Linha não existe na grid atual.",
-            "Grid Column Error": "Coluna não existe na grid atual.",
-            "Grid Number Error": "Não existe essa quantidade de grids na tela atual.",
-            "Text Not Found": "Texto não encontrado.",
-            "Help Not Found": "Help não encontrado.",
-            "User Not Authenticated": "Usuário não autenticado",
-            "Change Environment": "Trocar módulo",
-            "Invert Selection": "Inverte Seleção",
-            "Parameter Menu": "Entorno > Archivos > Parametros",
-            "Search 2": "Buscar",
-            "Search By": "Buscar:",
-            "From": "De",
-            "To": "Ate",
-            "Coins": "Monedas",
-            "Next": "Avançar >>",
-            "LogOff": "Log Off",
-            "Checkhelp": "Help:",
-            "Checkproblem": "Problema:",
-            "Checksolution": "Solucion:",
-            "ChangePassword": "Reserved",
-            "UserLogin": "Login del usuario*",
-            "CurrentPassword": "Contrasena actual*",
-            "NewPassword": "Nueva contrasena*",
-            "ConfirmNewPassword": "Confirmar nueva contrasena*",
-            "Yes":"Reserved",
-            "AssertFalseMessage": "Método AssertFalse utilizado sin un punto de control, verifique el script.",
-            "File Name": "Nome do Arquivo",
+        "Error Log": "SMARTCLIENT encontrou um problema durante a execucao e sera finalizado. Para informacoes adicionais clique em detalhes",
+        "Error Log Print": "SMARTCLIENT encontrou um problema durante a execucao e sera finalizado. Para informacoes adicionais verifique print efetuado da tela",
+        "Error Msg Required": "Não é possível completar a ação. Existem campos obrigatórios não preenchidos.",
+        "Help": "Ajuda:",
+        "Problem": "Problema:",
+        "Solution": "Solução:",
+        "Branches": "Filiais",
+        "Grid Steps Misuse": "Uso de grid errado. Passe apenas um grupo de inputs ou um grupo de checks em cada bloco de grid.",
+        "Grid Steps Empty": "Nenhum passo de grid encontrado. Passe um grupo de inputs ou um grupo de checks em cada bloco de grid.",
+        "Grid Line Error": "Linha não existe na grid atual.",
+        "Grid Column Error": "Coluna não existe na grid atual.",
+        "Grid Number Error": "Não existe essa quantidade de grids na tela atual.",
+        "Text Not Found": "Texto não encontrado.",
+        "Help Not Found": "Help não encontrado.",
+        "User Not Authenticated": "Usuário não autenticado",
+        "Change Environment": "Trocar módulo",
+        "Invert Selection": "Inverte Seleção",
+        "Parameter Menu": "Entorno > Archivos > Parametros",
+        "Search 2": "Buscar",
+        "Search By": "Buscar:",
+        "From": "De",
+        "To": "Ate",
+        "Coins": "Monedas",
+        "Next": "Avançar >>",
+        "LogOff": "Log Off",
+        "Checkhelp": "Help:",
+        "Checkproblem": "Problema:",
+        "Checksolution": "Solucion:",
+        "ChangePassword": "Reserved",
+        "UserLogin": "Login del usuario*",
+        "CurrentPassword": "Contrasena actual*",
+        "NewPassword": "Nueva contrasena*",
+        "ConfirmNewPassword": "Confirmar nueva contrasena*",
+        "Yes":"Reserved",
+        "AssertFalseMessage": "Método AssertFalse utilizado sin un punto de control, verifique el script.",
+        "File Name": "Nome do Arquivo",
 			"Open": "Abierto",
-            "Warning": "Atención",
-            "News": "Noticias",
-            "Continue": "Continuar",
-            "Short Confirm": "Confirmar",
-            "Enter in environment screen": "Entrar",
-            "Code Coverage": "Aguarde... Coletando informacoes de cobertura de codigo.",
-            "Release": "Release",
-            "Top DataBase": "Top DataBase",
-            "Lib Version": "Versão da lib",
-            "Build": "Build",
-            "Issued": "Emision",
-            "Ref.Dt": "Fc.Ref.",
-            "Time": "Hora",
-            "End Time": "Hora Término",
-            "Procedure Menu": "Base de Dados > Dicionário > Stored Procedure",
-            "Code": "Código",
-            "Success": "Sucessos",
-            "Procedure Install": "Instalar processos selecionados",
-            "Procedure Uninstall": "Remover processos selecionados",
-            "Schedule Menu": "Entorno > Schedule > Schedule",
-            "Input Set Program": "Buscar y ejecutar",
-            "New Home Menu About": "Sobre",
-            "Filters": "Filtros",
-            "Apply Filters": "Aplicar Filtros",
-            "Remove Filters": "Eliminar filtros",
-            "Remove All Filters": "Eliminar todos",
-            "Old Browse Edit":"Modificar",
-            "Old Browse Delete":"Borrar",
-            "Old Browse Insert":"Incluir",
-            "Old Browse Other Actions":"Otras acciones",
-            
-            "New Browse Edit":"Edit",
-            "New Browse Delete":"Eliminar",
-            "New Browse Insert":"Incluir",
-            "New Browse Other Actions":"Acciones de registro",
-
-            "Perform Advanced Search":"Realizar búsqueda avanzada.",
-            "Select":"Seleccionar",
-            "Module":"Módulo",
-            "Change Module":"Cambiar módulo"
-        }
-        russian = {
-            "User": "Пользователь",
-            "Password": "Пароль",
-            "Database": "Базовая дата",
-            "Group": "Группа",
-            "Branch": "Филиал",
-            "Environment": "Среда",
-            "Add": "Добавить",
-            "Delete": "Удалить",
-            "Edit": "редактировать",
-            "Editar": "Изменить", #usado num elemento especifico por conta do ambiente russo
-            "Cancel": "Отмена",
-            "View": "Просмотр",
-            "Visualizar": "Вид...", #usado num elemento especifico por conta do ambiente russo
-            #"Other Actions": "Другие Действия",
-            "Other Actions": "Др. действия",
-            "Confirm": "Подтвердить",
-            "Save": "Сохранить",
-            "Close": "Закрыть",
-            "Exit": "Выход",
-            "Leave Page": "Выйти без сохранения",
-            "Enter": "Войти",
-            "Finish": "Завершить",
-            "Details": "Подробнее",
-            "Search": "Поиск",
-            "Ok": "Да",
-            "Copy": "Copy",
-            "Cut": "Cut",
-            "Paste": "Paste",
-            "Calculator": "Calculator",
-            "Spool": "Spool",
-            "Help": "Help",
-            #"Help": "Помощь:",
-            "Folders": "Folders",
-            "Generate Differential File": "Создать файл изменений",
-            "Include": "Bставить",
-            "Filter": "фильтр",
-            "Menu About": "Справки > О программе…",
-            "Error Log": "SMARTCLIENT проблема обнаружена при работе системы, и она будет закрыта. Д/др. инфор-и нажать «Подробности»",
-            "Error Log Print": "SMARTCLIENT проблема обнаружена при работе системы, и она будет закрыта.Для получения дополнительной информации проверьте распечатку экрана",
-            "Error Msg Required": "Не удалось завершить это действие. Не заполнены обязательные поля.",
-            "Problem": "Проблема:",
-            "Solution": "Решение:",
-            "Branches": "",
-            "Grid Steps Misuse": "Grid steps misuse. Be sure to only use a group of inputs or a group of checks in each Grid Block.",
-            "Grid Steps Empty": "No grid steps were found. Be sure to only use a group of inputs or a group of checks in each Grid Block.",
-            "Grid Line Error": "Line does not exist in current grid.",
-            "Grid Column Error": "Column does not exist in current grid.",
-            "Grid Number Error": "There is not that many grids on the current screen.",
-            "Text Not Found": "Text Not Found",
-            "Help Not Found": "Help Not Found",
-            "User Not Authenticated": "User Not Authenticated",
-            "Change Environment": "Change environment",
-            "Invert Selection": "Invert Selection",
-            "Parameter Menu": "Среда > НСИ > Параметры",
-            "Search 2": "оиск",
-            "Search By": "Поиск по:",
-            "From": "De",
-            "To": "Ate",
-            "Coins": "Валюта",
-            "Next": "Далее >>",
-            "LogOff": "Завершить",
-            "Checkhelp": "Помощь:",
-            "Checkproblem": "Проблема:",
-            "Checksolution": "Решение:",
-            "ChangePassword": "Смена пароля",
-            "UserLogin": "Пользователь (логин)",
-            "CurrentPassword": "Текущий пароль*",
-            "NewPassword": "Нов. пароль*",
-            "ConfirmNewPassword": "Подтв. новый пароль*",
-            "File Name": "имя файла",
+        "Warning": "Atención",
+        "News": "Noticias",
+        "Continue": "Continuar",
+        "Short Confirm": "Confirmar",
+        "Enter in environment screen": "Entrar",
+        "Code Coverage": "Aguarde... Coletando informacoes de cobertura de codigo.",
+        "Release": "Release",
+        "Top DataBase": "Top DataBase",
+        "Lib Version": "Versão da lib",
+        "Build": "Build",
+        "Issued": "Emision",
+        "Ref.Dt": "Fc.Ref.",
+        "Time": "Hora",
+        "End Time": "Hora Término",
+        "Procedure Menu": "Base de Dados > Dicionário > Stored Procedure",
+        "Code": "Código",
+        "Success": "Sucessos",
+        "Procedure Install": "Instalar processos selecionados",
+        "Procedure Uninstall": "Remover processos selecionados",
+        "Schedule Menu": "Entorno > Schedule > Schedule",
+        "Input Set Program": "Buscar y ejecutar",
+        "New Home Menu About": "Sobre",
+        "Filters": "Filtros",
+        "Apply Filters": "Aplicar Filtros",
+        "Remove Filters": "Eliminar filtros",
+        "Remove All Filters": "Eliminar todos",
+        "Old Browse Edit":"Modificar",
+        "Old Browse Delete":"Borrar",
+        "Old Browse Insert":"Incluir",
+        "Old Browse Other Actions":"Otras acciones",
+        
+        "New Browse Edit":"Edit",
+        "New Browse Delete":"Eliminar",
+        "New Browse Insert":"Incluir",
+        "New Browse Other Actions":"Acciones de registro",
+
+        "Perform Advanced Search":"Realizar búsqueda avanzada.",
+        "Select":"Seleccionar",
+        "Module":"Módulo",
+        "Change Module":"Cambiar módulo"
+    }
+
+
+def russian():
+    """
+    [Internal]
+    """
+    return {
+        "User": "Пользователь",
+        "Password": "Пароль",
+        "Database": "Базовая дата",
+        "Group": "Группа",
+        "Branch": "Филиал",
+        "Environment": "Среда",
+        "Add": "Добавить",
+        "Delete": "Удалить",
+        "Edit": "редактировать",
+        "Editar": "Изменить", #usado num elemento especifico por conta do ambiente russo
+        "Cancel": "Отмена",
+        "View": "Просмотр",
+        "Visualizar": "Вид...", #usado num elemento especifico por conta do ambiente russo
+        #"Other Actions": "Другие Действия",
+        "Other Actions": "Др. действия",
+        "Confirm": "Подтвердить",
+        "Save": "Сохранить",
+        "Close": "Закрыть",
+        "Exit": "Выход",
+        "Leave Page": "Выйти без сохранения",
+        "Enter": "Войти",
+        "Finish": "Завершить",
+        "Details": "Подробнее",
+        "Search": "Поиск",
+        "Ok": "Да",
+        "Copy": "Copy",
+        "Cut": "Cut",
+        "Paste": "Paste",
+        "Calculator": "Calculator",
+        "Spool": "Spool",
+        "Help": "Help",
+        #"Help": "Помощь:",
+        "Folders": "Folders",
+        "Generate Differential File": "Создать файл изменений",
+        "Include": "Bставить",
+        "Filter": "фильтр",
+        "Menu About": "Справки > О программе…",
+        "Error Log": "SMARTCLIENT проблема обнаружена при работе системы, и она будет закрыта. Д/др. инфор-и нажать «Подробности»",
+        "Error Log Print": "SMARTCLIENT проблема обнаружена при работе системы, и она будет закрыта.Для получения дополнительной информации проверьте распечатку экрана",
+        "Error Msg Required": "Не удалось завершить это действие. Не заполнены обязательные поля.",
+        "Problem": "Проблема:",
+        "Solution": "Решение:",
+        "Branches": "",
+        "Grid Steps Misuse": "Grid steps misuse. Be sure to only use a group of inputs or a group of checks in each Grid Block.",
+        "Grid Steps Empty": "No grid steps were found. Be sure to only use a group of inputs or a group of checks in each Grid Block.",
+        "Grid Line Error": "Line does not exist in current grid.",
+        "Grid Column Error": "Column does not exist in current grid.",
+        "Grid Number Error": "There is not that many grids on the current screen.",
+        "Text Not Found": "Text Not Found",
+        "Help Not Found": "Help Not Found",
+        "User Not Authenticated": "User Not Authenticated",
+        "Change Environment": "Change environment",
+        "Invert Selection": "Invert Selection",
+        "Parameter Menu": "Среда > НСИ > Параметры",
+        "Search 2": "оиск",
+        "Search By": "Поиск по:",
+        "From": "De",
+        "To": "Ate",
+        "Coins": "Валюта",
+        "Next": "Далее >>",
+        "LogOff": "Завершить",
+        "Checkhelp": "Помощь:",
+        "Checkproblem": "Проблема:",
+        "Checksolution": "Решение:",
+        "ChangePassword": "Смена пароля",
+        "UserLogin": "Пользователь (логин)",
+        "CurrentPassword": "Текущий пароль*",
+        "NewPassword": "Нов. пароль*",
+        "ConfirmNewPassword": "Подтв. новый пароль*",
+        "File Name": "имя файла",
 			"Open": "открыто",
-            "Yes": "Да",
-            "AssertFalseMessage": "AssertFalse method used without a checkpoint, check the script.",
-            "Warning": "Берегись",
-            "News": "Новости",
-            "Continue": "Продолжить",
-            "Short Confirm": "Подтв.",
-            "Enter in environment screen": "Ввод",
-            "Code Coverage": "Aguarde... Coletando informacoes de cobertura de codigo.",
-            "Release": "Сброс RPO",
-            "Top DataBase": "БД",
-            "Lib Version": "Версия библиотеки",
-            "Build": "Верс.",
-            "Issued": "Issued",
-            "Ref.Dt": "Ref.Dt",
-            "Time": "Time",
-            "End Time": "End Time",
-            "Procedure Menu": "Database > Dictionary > Stored Procedure",
-            "Code": "Код",
-            "Success": "успех",
-            "Procedure Install": "Установить выбранные процессы",
-            "Procedure Uninstall": "Удалить выбранные процессы",
-            "Schedule Menu": "Settings > Schedule > Schedule",
-            "Input Set Program": "Ищи и беги",
-            "New Home Menu About": "О программе…",
-            "Filters": "Фильтры",
-            "Apply Filters": "Применить фильтры",
-            "Remove Filters": "Удалить фильтры",
-            "Remove All Filters": "Удалить все",
-
-            "Old Browse Edit":"Редактировать",
-            "Old Browse Delete":"Удалить",
-            "Old Browse Insert":"Включать",
-            "Old Browse Other Actions":"Другие действия",
-            
-            "New Browse Edit":"Редактировать",            
-            "New Browse Delete":"Удалить",
-            "New Browse Insert":"Включать",
-            "New Browse Other Actions":"Линейные действия",
-
-            "Perform Advanced Search":"Выполните расширенный поиск.",
-            "Select":"Выбирать",
-            "Module":"Модуль",
-            "Change Module":"Модуль изменений"
-        }
-
-        if language.lower() == "en-us":
-            return english
-        elif language.lower() == "pt-br":
-            return brazilian_portuguese
-        elif language.lower() == "ru-ru":
-            return russian
-        elif language.lower() == "es-es":
-            return spanish
-        else:
-            return brazilian_portuguese
+        "Yes": "Да",
+        "AssertFalseMessage": "AssertFalse method used without a checkpoint, check the script.",
+        "Warning": "Берегись",
+        "News": "Новости",
+        "Continue": "Продолжить",
+        "Short Confirm": "Подтв.",
+        "Enter in environment screen": "Ввод",
+        "Code Coverage": "Aguarde... Coletando informacoes de cobertura de codigo.",
+        "Release": "Сброс RPO",
+        "Top DataBase": "БД",
+        "Lib Version": "Версия библиотеки",
+        "Build": "Верс.",
+        "Issued": "Issued",
+        "Ref.Dt": "Ref.Dt",
+        "Time": "Time",
+        "End Time": "End Time",
+        "Procedure Menu": "Database > Dictionary > Stored Procedure",
+        "Code": "Код",
+        "Success": "успех",
+        "Procedure Install": "Установить выбранные процессы",
+        "Procedure Uninstall": "Удалить выбранные процессы",
+        "Schedule Menu": "Settings > Schedule > Schedule",
+        "Input Set Program": "Ищи и беги",
+        "New Home Menu About": "О программе…",
+        "Filters": "Фильтры",
+        "Apply Filters": "Применить фильтры",
+        "Remove Filters": "Удалить фильтры",
+        "Remove All Filters": "Удалить все",
+
+        "Old Browse Edit":"Редактировать",
+        "Old Browse Delete":"Удалить",
+        "Old Browse Insert":"Включать",
+        "Old Browse Other Actions":"Другие действия",
+        
+        "New Browse Edit":"Редактировать",            
+        "New Browse Delete":"Удалить",
+        "New Browse Insert":"Включать",
+        "New Browse Other Actions":"Линейные действия",
+
+        "Perform Advanced Search":"Выполните расширенный поиск.",
+        "Select":"Выбирать",
+        "Module":"Модуль",
+        "Change Module":"Модуль изменений"
+    }
+
+
+_builders = {
+    "en-us": english,
+    "pt-br": brazilian_portuguese,
+    "es-es": spanish,
+    "ru-ru": russian,
+}
+
 
 class Messages():
 
@@ -2,8 +2,6 @@ import time
 import os
 import sys
 from pathlib import Path
-import numpy as nump
-import pandas as panda
 import uuid
 import csv
 import inspect
@@ -14,7 +12,29 @@ import json
 from datetime import datetime
 from tir.technologies.core.config import ConfigLoader
 from tir.technologies.core.logging_config import logger
+from tir.technologies.core.log_sender import log_sender
+from tir.technologies.core.log_spool import log_spool
+from tir.technologies.core.http_session import post as http_post
+from tir.technologies.core.results_store import ResultsStore, RESULTS_SUFFIX
+from tir.technologies.core.execution_history import ExecutionHistory
 import getpass
+import tempfile
+
+SCREENSHOT_QUEUE_SIZE = 20
+
+_writable_folders = {}
+
+
+def default_folder(station=""):
+    """
+    [Internal]
+
+    Returns the Log folder used when LogFolder is not set, or its station folder:
+    /tmp/Log on Linux, Log in the current folder otherwise.
+    """
+    path = Path("/tmp/Log") if sys.platform.lower() == "linux" else Path("Log")
+    return Path(path, station) if station else path
+
 
 class Log:
     """
@@ -70,6 +90,9 @@ class Log:
         self.test_case = self.list_of_testcases()
         self.finish_testcase = []
         self.testcase_generate_log = []
+        self.results_store = None
+        self.stored_rows = 1
+        self.history = None
 
     def generate_header(self):
         """
@@ -109,10 +132,31 @@ class Log:
             self.table_rows.append(line)
             self.test_case_log.append(self.get_testcase_stack())
 
+            if self.config.history_path:
+                self.record_history(result, printable_message)
+
+    def record_history(self, result, message):
+        """
+        [Internal]
+
+        Records the test case duration and result in the local execution history (HistoryPath).
+        """
+        try:
+            if self.history is None:
+                self.history = ExecutionHistory(self.config.history_path)
+
+            self.history.record(self.get_file_name('testsuite'), self.get_testcase_stack(), self.program or self.get_program_name(),
+                                self.seconds, result, message, self.execution_id, self.station, self.release)
+        except Exception as error:
+            logger().debug(f"Fail in record execution history: {str(error)}")
+
     def save_file(self):
         """
         Writes the log file to the file system.
 
+        With ResultsStore enabled, only the rows added since the last call are appended
+        to the suite results store instead of writing a new CSV file.
+
         Usage:
 
         >>> # Calling the method:
@@ -127,11 +171,15 @@ class Log:
                     path = Path(self.folder, self.station+"_v6")
                     os.makedirs(path)
                 else:
-                    path = Path("/tmp/Log", self.station) if sys.platform.lower() == "linux" else Path("Log", self.station)
+                    path = default_folder(self.station)
                     os.makedirs(path)
             except OSError:
                 pass
 
+            if self.config.results_store:
+                self.save_results(path)
+                return
+
             self.checks_empty_line()
 
             with open( Path(path, log_file), mode="w", newline="", encoding="windows-1252") as csv_file:
@@ -147,6 +195,33 @@ class Log:
                             
             self.csv_log.append(self.get_testcase_stack())
 
+    def save_results(self, path):
+        """
+        [Internal]
+
+        Appends the new table rows to the results store of the suite run.
+
+        :param path: Folder of the results store.
+        :type path: Path
+        """
+        self.stored_rows = max(1, min(self.stored_rows, len(self.table_rows)))
+        new_rows = self.table_rows[self.stored_rows:]
+
+        if new_rows:
+            self.checks_empty_line(start=self.stored_rows)
+
+            if self.results_store is None:
+                self.results_store = ResultsStore(Path(path, f"{self.user}_{self.timestamp}_{os.getpid()}{RESULTS_SUFFIX}"))
+
+            try:
+                self.results_store.append(new_rows, testcase=self.get_testcase_stack())
+                self.stored_rows = len(self.table_rows)
+                logger().debug(f"Results stored successfully: {self.results_store.path}")
+            except Exception as error:
+                logger().debug(f"Fail in store results in: {self.results_store.path}: Error: {str(error)}")
+
+        self.csv_log.append(self.get_testcase_stack())
+
     def log_exec_file(self):
         """
         [Internal]
@@ -212,10 +287,13 @@ class Log:
         """
         return next(iter(list(map(lambda x: x.function, filter(lambda x: re.search('setUpClass|test_|tearDownClass', x.function), inspect.stack())))), None)
 
-    def checks_empty_line(self):
+    def checks_empty_line(self, start=0):
         """
         Checks if the log file is not empty.
         03 - 'Programa'  10 - 'Release' 14 - 'ID Execução' 15 - 'Pais' 
+
+        :param start: First row to be checked. - **Default:** 0
+        :type start: int
         [Internal]
         """
 
@@ -223,7 +301,7 @@ class Log:
 
         table_rows_has_line = False
 
-        for row in range(0, len(self.table_rows)):
+        for row in range(start, len(self.table_rows)):
             if self.table_rows[row][3] == '':
                 self.table_rows[row][3] = self.get_program_name()
 
@@ -339,26 +417,33 @@ class Log:
 
     def generate_json(self, dictionary):
         """
+        Sends the test case result to LogUrl1, falling back to LogUrl2.
+
+        With AsyncLog enabled the delivery runs on the background LogSender and the
+        test thread returns immediately. If no server accepts the result, it is
+        saved locally by save_json_file.
         """
         server_address1 = self.config.logurl1
         server_address2 = self.config.logurl2
 
-        success = False
+        json_data = json.dumps(dictionary)
 
-        data = dictionary
+        deliver = lambda attempt: self.send_request(server_address1, json_data) or self.send_request(server_address2, json_data)
 
-        json_data = json.dumps(data)
+        if self.config.async_log:
+            log_sender().submit(deliver, fallback=lambda: self.save_json_file(json_data))
+            return
+
+        success = False
 
         endtime = time.time() + 30
 
         while (time.time() < endtime and not success):
 
-            success = self.send_request(server_address1, json_data)
+            success = deliver(1)
 
             if not success:
-                success = self.send_request(server_address2, json_data)
-
-            time.sleep(10)
+                time.sleep(10)
 
         if not success:
             self.save_json_file(json_data)
@@ -372,7 +457,7 @@ class Log:
         headers = {'content-type': 'application/json'}
 
         try:
-            response = requests.post(server_address.strip(), data=json_data, headers=headers)
+            response = http_post("logurl", server_address.strip(), data=json_data, headers=headers)
         except:
             pass
 
@@ -412,7 +497,7 @@ class Log:
 
     def save_json_file(self, json_data):
         """
-        Writes the log file to the file system.
+        Appends the test case result to the local log spool, to be sent later by the replay command.
 
         Usage:
 
@@ -420,28 +505,19 @@ class Log:
         >>> self.log.save_json_file()
         """
 
-        try:
-            if self.folder:
-                path = Path(self.folder, "new_log")
-                os.makedirs(path)
-            else:
-                path = Path("/tmp/Log") if sys.platform.lower() == "linux" else Path("Log")
-                os.makedirs(path)
-        except OSError:
-            pass
-
-        log_file = f"{self.user}_{uuid.uuid4().hex}.json"
+        if self.folder:
+            path = Path(self.folder, "new_log")
+        else:
+            path = default_folder()
 
         if self.config.smart_test:
             self.log_exec_file()
 
         try:
-            with open( Path(path, log_file), mode="w", encoding="utf-8") as json_file:
-                json_file.write(json_data)
-            logger().debug(f"Log file created successfully: {Path(path, log_file)}")
+            log_spool(path).append([self.config.logurl1, self.config.logurl2], json_data)
+            logger().debug(f"Log spooled successfully: {log_spool(path).path}")
         except Exception as error:
-            logger().debug(f"Fail in create json file in: {Path(path, log_file)}: Error: {str(error)}")
-            pass
+            logger().debug(f"Fail in spool json log in: {path}: Error: {str(error)}")
 
     def generate_log(self):
         """
@@ -506,10 +582,13 @@ class Log:
         self.send_log_with_retries(log_data, api_url, api_url_ip, path_folder)
 
     def send_log_with_retries(self, log_data, api_url, api_url_ip, path_folder):
-        headers = {"Content-Type": "application/json; charset=utf-8"}
+        """
+        Sends the execution log to the createlog API, trying APIURL first and APIURLIP next.
+
+        With AsyncLog enabled the attempts run on the background LogSender with
+        exponential backoff, so the test thread does not wait on the API.
+        """
         body = json.dumps(log_data)
-        timeout_dns = 600
-        timeout_ip = 1200
         max_retries = 4
 
         if not api_url or not api_url_ip:
@@ -517,37 +596,58 @@ class Log:
             self.save_log_locally(path_folder, body)
             return
 
-        for attempt in range(1, max_retries + 1):
-            try:
-                # Primeiras tentativas usando DNS
-                if attempt <= 2:
-                    response = requests.post(f"{api_url}/createlog/", data=body, headers=headers, timeout=timeout_dns)
-                # Tentativas adicionais usando IP
-                else:
-                    response = requests.post(f"{api_url_ip}/createlog/", data=body, headers=headers, timeout=timeout_ip)
+        def deliver(attempt):
+            nonlocal body
+            status_code = self.post_log(body, attempt, api_url, api_url_ip)
+            if status_code == 400:
+                logger().debug("[FwSendLog]: Erro 400 - Limpando caracteres especiais do JSON.")
+                body = body.encode("ascii", "ignore").decode()
+            return status_code == 200
 
-                if response.status_code == 200:
-                    logger().debug(f"[FwSendLog]: Log enviado com sucesso na tentativa {attempt}.")
-                    return
-                elif response.status_code == 400:
-                    logger().debug("[FwSendLog]: Erro 400 - Limpando caracteres especiais do JSON.")
-                    body = body.encode("ascii", "ignore").decode()
+        if self.config.async_log:
+            log_sender().submit(deliver, fallback=lambda: self.spool_log(path_folder, body), max_retries=max_retries)
+            return
 
-            except requests.RequestException as e:
-                logger().debug(f"[FwSendLog]: Erro ao enviar log na tentativa {attempt}: {e}")
+        for attempt in range(1, max_retries + 1):
+            if deliver(attempt):
+                return
 
             time.sleep(3)  # Aguarda 3 segundos antes da próxima tentativa
 
         # Caso todas as tentativas falhem
-        self.save_log_locally(path_folder, body)
+        self.spool_log(path_folder, body)
+
+    def post_log(self, body, attempt, api_url, api_url_ip):
+        """
+        [Internal]
+
+        Posts the log body to the createlog API and returns the response status code,
+        or None if the request failed.
+        """
+        headers = {"Content-Type": "application/json; charset=utf-8"}
+
+        try:
+            # Primeiras tentativas usando DNS
+            if attempt <= 2:
+                response = http_post("createlog", f"{api_url}/createlog/", data=body, headers=headers)
+            # Tentativas adicionais usando IP
+            else:
+                response = http_post("createlog_ip", f"{api_url_ip}/createlog/", data=body, headers=headers)
+        except requests.RequestException as e:
+            logger().debug(f"[FwSendLog]: Erro ao enviar log na tentativa {attempt}: {e}")
+            return None
+
+        if response.status_code == 200:
+            logger().debug(f"[FwSendLog]: Log enviado com sucesso na tentativa {attempt}.")
+
+        return response.status_code
 
     def save_log_locally(self, path_folder, body):
         """
         Saves the log data locally as a JSON file.
         """
         
-        logger().info("[FwSendLog]: Não foi possível enviar o log após todas as tentativas.")
-        log_file_name = f"{int(time.time())}.json"
+        log_file_name = f"{time.time_ns()}.json"
         log_file_path = Path(path_folder, log_file_name)
         
         try:
@@ -557,6 +657,21 @@ class Log:
         except IOError as e:
             logger().info(f"[FwSendLog]: Falha ao salvar o log localmente: {e}")
 
+    def spool_log(self, path_folder, body):
+        """
+        Appends the log data to the local log spool after all send attempts failed.
+        """
+
+        logger().info("[FwSendLog]: Não foi possível enviar o log após todas as tentativas.")
+        urls = [f"{self.config.api_url}/createlog/", f"{self.config.api_url_ip}/createlog/"]
+
+        try:
+            log_spool(path_folder).append(urls, body)
+            logger().info(f"[FwSendLog]: Log salvo localmente em {log_spool(path_folder).path}.")
+        except (IOError, ValueError) as e:
+            logger().info(f"[FwSendLog]: Falha ao salvar o log no spool: {e}")
+            self.save_log_locally(path_folder, body)
+
     def ident_test(self):
         """
 
@@ -611,55 +726,118 @@ class Log:
 
         if self.config.debug_log:
             logger().debug(f"take_screenshot_log in:{datetime.now()}\n")
-            
-        try:
-            if self.config.log_http:
-                folder_path = Path(self.config.log_http, self.config.country, self.release, self.config.issue, self.config.execution_id, testsuite)
-                path = Path(folder_path, screenshot_file)
-                folder_path.mkdir(parents=True, exist_ok=True)
-            else:
-                path = Path("/tmp/Log", self.station, screenshot_file) if sys.platform.lower() == "linux" else Path("Log", self.station, screenshot_file)
-                path.parent.mkdir(parents=True, exist_ok=True)
-        except OSError:
-            pass
+
+        if self.config.log_http:
+            path = Path(self.config.log_http, self.config.country, self.release, self.config.issue, self.config.execution_id, testsuite, screenshot_file)
+        else:
+            path = Path(default_folder(self.station), screenshot_file)
 
         try:
-            parent = path.parent
-            if not parent.exists():
-                parent.mkdir(parents=True, exist_ok=True)
+            screenshot = driver.get_screenshot_as_png()
+        except Exception as e:
+            logger().exception(f"Warning Log Error get_screenshot_as_png exception {str(e)}")
+            return
+
+        if not self.folder_is_writable(path.parent):
+            path = Path(tempfile.gettempdir(), screenshot_file)
+            logger().debug(f"Falling back to temp dir for screenshot: {path}")
+
+        if self.config.async_log:
+            fallback_path = Path(tempfile.gettempdir(), screenshot_file)
+            log_sender("screenshot", max_queue_size=SCREENSHOT_QUEUE_SIZE).submit(lambda attempt: self.write_screenshot(path, screenshot),
+                fallback=lambda: self.write_screenshot(path, screenshot) or self.write_screenshot(fallback_path, screenshot), max_retries=2)
+        else:
+            self.write_screenshot(path, screenshot)
+
+    def folder_is_writable(self, folder):
+        """
+        [Internal]
+
+        Creates the folder and checks if it is writable. The result is cached per folder,
+        so the check and the IO diagnostic run only once per execution.
+
+        :param folder: The screenshot folder.
+        :type folder: Path
+
+        :return: True if files can be created in the folder.
+        :rtype: bool
+        """
+        key = str(folder)
+
+        if key not in _writable_folders:
+            try:
+                folder.mkdir(parents=True, exist_ok=True)
+                test_file = Path(folder, f".write_test_{uuid.uuid4().hex}")
+                test_file.write_bytes(b"")
+                test_file.unlink()
+                _writable_folders[key] = True
+            except Exception as write_err:
+                logger().warning(f"Screenshot directory not writable: {folder} - {write_err}")
+                _writable_folders[key] = False
 
             # Complementary diagnostic
             try:
-                diag = self.diagnostic_io(parent)
-                logger().debug(f"Diagnostic IO result: {diag}")
+                logger().debug(f"Diagnostic IO result: {self.diagnostic_io(folder)}")
             except Exception:
                 pass
 
-            # More reliable writability check: try creating a temporary file
-            try:
-                test_file = parent / f".write_test_{uuid.uuid4().hex}"
-                with open(test_file, "w") as tf:
-                    tf.write("")
-                test_file.unlink()
-            except Exception as write_err:
-                logger().warning(f"Screenshot directory not writable: {parent} - {write_err}")
-                # Fallback to system temp directory
-                try:
-                    import tempfile
-                    tmp_dir = Path(tempfile.gettempdir())
-                    path = Path(tmp_dir, screenshot_file)
-                    parent = path.parent
-                    parent.mkdir(parents=True, exist_ok=True)
-                    logger().debug(f"Falling back to temp dir for screenshot: {path}")
-                except Exception as fallback_err:
-                    logger().exception(f"Failed to fallback to temp dir for screenshots: {fallback_err}")
-
-            if driver.save_screenshot(str(path)):
-                logger().debug(f"Screenshot file created successfully: {path}")
-            else:
-                logger().debug(f"Screenshot file fail: {path}")
+        return _writable_folders[key]
+
+    def write_screenshot(self, path, screenshot):
+        """
+        [Internal]
+
+        Encodes the PNG screenshot in the ScreenshotFormat and writes it to path.
+
+        :return: True if the file was written.
+        :rtype: bool
+        """
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(self.encode_screenshot(screenshot))
+            logger().debug(f"Screenshot file created successfully: {path}")
+            return True
         except Exception as e:
-            logger().exception(f"Warning Log Error save_screenshot exception {str(e)}")
+            logger().debug(f"Screenshot file fail: {path} - {e}")
+            return False
+
+    def encode_screenshot(self, screenshot):
+        """
+        [Internal]
+
+        Converts the PNG bytes to the ScreenshotFormat (png, jpeg or webp) using ScreenshotQuality.
+        """
+        screenshot_format = self.screenshot_extension()
+
+        if screenshot_format == "png":
+            return screenshot
+
+        import cv2
+        import numpy as nump
+
+        image = cv2.imdecode(nump.frombuffer(screenshot, dtype=nump.uint8), cv2.IMREAD_COLOR)
+
+        if screenshot_format == "webp":
+            params = [cv2.IMWRITE_WEBP_QUALITY, self.config.screenshot_quality]
+        else:
+            params = [cv2.IMWRITE_JPEG_QUALITY, self.config.screenshot_quality]
+
+        success, encoded = cv2.imencode(f".{screenshot_format}", image, params)
+
+        return encoded.tobytes() if success else screenshot
+
+    def screenshot_extension(self):
+        """
+        [Internal]
+
+        Returns the file extension of the ScreenshotFormat.
+        """
+        screenshot_format = self.config.screenshot_format.lower()
+
+        if screenshot_format in ("jpg", "jpeg"):
+            return "jpg"
+
+        return screenshot_format if screenshot_format == "webp" else "png"
 
     def screenshot_file_name(self, description="", stack_item=""):
         """
@@ -670,10 +848,12 @@ class Log:
 
         today = datetime.today()
 
+        extension = self.screenshot_extension()
+
         if description:
-            return f"{self.user}_{today.strftime('%Y%m%d%H%M%S%f')[:-3]}_{stack_item}_{description}.png"
+            return f"{self.user}_{today.strftime('%Y%m%d%H%M%S%f')[:-3]}_{stack_item}_{description}.{extension}"
         else:
-            return f"{self.user}_{today.strftime('%Y%m%d%H%M%S%f')[:-3]}_{stack_item}.png"
+            return f"{self.user}_{today.strftime('%Y%m%d%H%M%S%f')[:-3]}_{stack_item}.{extension}"
 
     def printable_message(self, string):
         """
@@ -751,7 +931,7 @@ class Log:
             is_readable = os.access(str(parent), os.R_OK)
             path_exists = parent.exists()
 
-            logger().info(
+            logger().debug(
                 f"[DIAGNOSTIC] Write Attempt Details\n"
                 f" > User/Domain: {current_domain}\\{current_user}\n"
                 f" > Target Path: {parent}\n"
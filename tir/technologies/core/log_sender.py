@@ -0,0 +1,198 @@
+import atexit
+import queue
+import threading
+import time
+from tir.technologies.core.config import ConfigLoader
+from tir.technologies.core.logging_config import logger
+
+_senders = {}
+_senders_lock = threading.Lock()
+
+
+class Fallback:
+    """
+    [Internal]
+
+    Fallback of a job that runs at most once, either by the sender thread or by flush,
+    and not at all once the job was delivered.
+    """
+
+    def __init__(self, fallback):
+        self.fallback = fallback
+        self.settled = False
+        self.lock = threading.Lock()
+
+    def settle(self):
+        """
+        Marks the job as finished, returning False if it was already finished.
+        """
+        with self.lock:
+            settled, self.settled = self.settled, True
+        return not settled
+
+    def __call__(self):
+        if self.settle() and self.fallback:
+            self.fallback()
+
+
+class LogSender:
+    """
+    Delivers execution results to the log APIs from a background thread, so the
+    test thread never waits on network calls, retries or sleeps.
+
+    Each delivery is a job: a callable that receives the attempt number and returns
+    True when the result was accepted. Failed attempts are retried with exponential
+    backoff, and when every attempt fails (or the queue is full) the job fallback is
+    called, which saves the result locally.
+
+    :param max_queue_size: Maximum number of pending deliveries. - **Default:** 1000
+    :type max_queue_size: int
+    :param backoff_base: Delay in seconds before the first retry. - **Default:** 1.0
+    :type backoff_base: float
+    :param backoff_max: Maximum delay in seconds between two retries. - **Default:** 30.0
+    :type backoff_max: float
+
+    Usage:
+
+    >>> # Calling the method:
+    >>> log_sender().submit(lambda attempt: self.send_request(url, json_data), fallback=lambda: self.save_json_file(json_data))
+    """
+
+    def __init__(self, max_queue_size=1000, backoff_base=1.0, backoff_max=30.0):
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.queue = queue.Queue(maxsize=max_queue_size)
+        self.in_flight = None
+        self.thread = threading.Thread(target=self.worker, daemon=True)
+        self.thread.start()
+
+    def submit(self, job, fallback=None, max_retries=4):
+        """
+        Schedules a delivery without blocking the caller.
+
+        If the queue is full the fallback is called immediately, keeping memory bounded.
+
+        :param job: Callable receiving the attempt number and returning True on success.
+        :type job: callable
+        :param fallback: Callable used when every attempt fails. - **Default:** None
+        :type fallback: callable
+        :param max_retries: Number of attempts before calling the fallback. - **Default:** 4
+        :type max_retries: int
+        """
+        try:
+            self.queue.put_nowait((job, fallback, max_retries))
+        except queue.Full:
+            logger().debug("[LogSender]: Queue is full, saving log locally.")
+            self.run_fallback(fallback)
+
+    def worker(self):
+        """
+        [Internal]
+        """
+        while True:
+            job, fallback, max_retries = self.queue.get()
+            fallback = Fallback(fallback)
+            self.in_flight = fallback
+            try:
+                if self.deliver(job, fallback, max_retries):
+                    fallback.settle()
+            finally:
+                self.in_flight = None
+                self.queue.task_done()
+
+    def deliver(self, job, fallback, max_retries):
+        """
+        [Internal]
+
+        Runs a job until it succeeds or max_retries is reached.
+        """
+        for attempt in range(1, max_retries + 1):
+            try:
+                if job(attempt):
+                    return True
+            except Exception as e:
+                logger().debug(f"[LogSender]: Error on attempt {attempt}: {e}")
+
+            if attempt < max_retries:
+                time.sleep(self.backoff_delay(attempt))
+
+        self.run_fallback(fallback)
+        return False
+
+    def backoff_delay(self, attempt):
+        """
+        [Internal]
+
+        Returns the exponential backoff delay for the given attempt.
+        """
+        return min(self.backoff_base * (2 ** (attempt - 1)), self.backoff_max)
+
+    def run_fallback(self, fallback):
+        """
+        [Internal]
+        """
+        if fallback:
+            try:
+                fallback()
+            except Exception as e:
+                logger().debug(f"[LogSender]: Fallback error: {e}")
+
+    def flush(self, timeout=None):
+        """
+        Waits for pending deliveries to finish.
+
+        Jobs still queued when the timeout expires are not sent: their fallback is
+        called so the results are saved locally instead of being lost. The same happens
+        to the job being sent, since the sender thread is a daemon and doesn't survive
+        the interpreter exit (the job may be saved and also sent, but never lost).
+
+        :param timeout: Maximum time in seconds to wait. - **Default:** None (wait forever)
+        :type timeout: float
+
+        :return: True if every delivery finished within the timeout.
+        :rtype: bool
+        """
+        endtime = time.time() + timeout if timeout is not None else None
+
+        while self.queue.unfinished_tasks:
+            if endtime is not None and time.time() >= endtime:
+                break
+            time.sleep(0.1)
+
+        if not self.queue.unfinished_tasks:
+            return True
+
+        logger().debug("[LogSender]: Flush timeout reached, saving pending logs locally.")
+        in_flight = self.in_flight
+        if in_flight is not None:
+            self.run_fallback(in_flight)
+
+        while True:
+            try:
+                job, fallback, max_retries = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            self.run_fallback(fallback)
+            self.queue.task_done()
+
+        return False
+
+
+def log_sender(channel="log", max_queue_size=None):
+    """
+    Returns the process-wide LogSender of the channel, creating it on first use.
+
+    Each channel has its own thread and queue, so slow log uploads don't delay screenshots.
+    Senders are flushed when the interpreter exits, waiting at most TimeOut seconds.
+
+    :param channel: Name of the channel. - **Default:** "log"
+    :type channel: str
+    :param max_queue_size: Queue size used when the channel is created. - **Default:** LogQueueSize
+    :type max_queue_size: int
+    """
+    with _senders_lock:
+        if channel not in _senders:
+            config = ConfigLoader()
+            _senders[channel] = LogSender(max_queue_size=max_queue_size or config.log_queue_size)
+            atexit.register(_senders[channel].flush, config.time_out)
+        return _senders[channel]
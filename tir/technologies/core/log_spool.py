@@ -0,0 +1,333 @@
+import argparse
+import atexit
+import contextlib
+import json
+import os
+import socket
+import threading
+import time
+from pathlib import Path
+import requests
+from tir.technologies.core.config import ConfigLoader
+from tir.technologies.core.logging_config import logger
+from tir.technologies.core.http_session import post as http_post
+
+SPOOL_SUFFIX = ".ndjson"
+LOCK_SUFFIX = ".lock"
+SUCCESS_STATUS = (200, 201, 204)
+
+_spools = {}
+_spools_lock = threading.Lock()
+
+
+class LogSpool:
+    """
+    Append-only NDJSON spool that keeps the execution logs that could not be sent to the log APIs.
+
+    Each worker process writes to its own file, ``<hostname>_<pid>.ndjson``, one record per line
+    with the candidate URLs and the log data. Writes are flushed immediately and synced to disk
+    every ``fsync_every`` records and when the spool is closed.
+
+    While the file is open the spool holds the lock of ``<hostname>_<pid>.ndjson.lock``, so
+    :func:`replay` never rewrites a file that is still being written.
+
+    Spooled records are sent again by :func:`replay`.
+
+    :param folder: Folder where the spool file is created.
+    :type folder: str
+    :param fsync_every: Number of records written between two disk syncs. - **Default:** 20
+    :type fsync_every: int
+
+    Usage:
+
+    >>> # Calling the method:
+    >>> log_spool(path_folder).append([f"{api_url}/createlog/"], body)
+    """
+
+    def __init__(self, folder, fsync_every=20):
+        self.folder = Path(folder)
+        self.path = Path(folder, f"{socket.gethostname()}_{os.getpid()}{SPOOL_SUFFIX}")
+        self.fsync_every = fsync_every
+        self.pending = 0
+        self.file = None
+        self.lock_file = None
+        self.lock = threading.Lock()
+
+    def append(self, urls, body):
+        """
+        Appends a record to the spool file.
+
+        :param urls: URLs that should receive the record, in order of preference.
+        :type urls: list
+        :param body: JSON string sent to the log API.
+        :type body: str
+        """
+        record = {"time": time.strftime("%Y%m%d%H%M%S"), "urls": [url.strip() for url in urls if url], "data": json.loads(body)}
+        line = json.dumps(record, ensure_ascii=False)
+
+        with self.lock:
+            if self.file is None:
+                self.folder.mkdir(parents=True, exist_ok=True)
+                self.lock_file = acquire_lock(self.path)
+                self.file = open(self.path, mode="a", encoding="utf-8")
+
+            self.file.write(line + "\n")
+            self.file.flush()
+            self.pending += 1
+
+            if self.pending >= self.fsync_every:
+                self.sync()
+
+    def sync(self):
+        """
+        [Internal]
+        """
+        if self.file and self.pending:
+            os.fsync(self.file.fileno())
+            self.pending = 0
+
+    def close(self):
+        """
+        Syncs and closes the spool file.
+        """
+        with self.lock:
+            if self.file:
+                self.sync()
+                self.file.close()
+                self.file = None
+                release_lock(self.lock_file)
+                self.lock_file = None
+
+
+def log_spool(folder):
+    """
+    Returns the spool of the current process for the given folder, creating it on first use.
+    """
+    key = str(Path(folder).resolve())
+    with _spools_lock:
+        if key not in _spools:
+            _spools[key] = LogSpool(folder)
+        return _spools[key]
+
+
+def close_spools():
+    """
+    Closes every spool opened by the current process.
+    """
+    with _spools_lock:
+        for spool in _spools.values():
+            spool.close()
+
+
+atexit.register(close_spools)
+
+
+def acquire_lock(path, blocking=True):
+    """
+    [Internal]
+
+    Locks the lock file of the spool and returns it open. Without blocking, returns None
+    when another process (or another spool of this process) holds the lock.
+
+    The lock is released when the returned file is closed, also when the process dies.
+    """
+    while True:
+        lock_file = open(f"{path}{LOCK_SUFFIX}", mode="a+")
+        try:
+            if os.name == "nt":
+                import msvcrt
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            if not blocking:
+                return None
+            time.sleep(0.1)
+            continue
+
+        # A replay may have removed the lock file while this process was waiting for it.
+        try:
+            if os.path.samestat(os.fstat(lock_file.fileno()), os.stat(lock_file.name)):
+                return lock_file
+        except FileNotFoundError:
+            pass
+        lock_file.close()
+
+
+def release_lock(lock_file, remove=False):
+    """
+    [Internal]
+
+    Releases the lock, removing the lock file when remove is True. On POSIX the file is removed
+    while still locked; on Windows, where open files can't be removed, only if nobody opened it.
+    """
+    if remove and os.name != "nt":
+        with contextlib.suppress(OSError):
+            os.remove(lock_file.name)
+    lock_file.close()
+    if remove and os.name == "nt":
+        with contextlib.suppress(OSError):
+            os.remove(lock_file.name)
+
+
+def post_record(urls, body, timeout):
+    """
+    [Internal]
+
+    Posts the body to the first URL that accepts it.
+    """
+    headers = {"Content-Type": "application/json; charset=utf-8"}
+
+    for url in urls:
+        try:
+            response = http_post("spool", url, data=body.encode("utf-8"), headers=headers, timeout=timeout)
+            if response.status_code in SUCCESS_STATUS:
+                return True
+            logger().debug(f"[LogSpool]: {url} returned status code {response.status_code}")
+        except requests.RequestException as e:
+            logger().debug(f"[LogSpool]: Error sending spooled log to {url}: {e}")
+
+    return False
+
+
+def send_batch(records, bulk=False, timeout=60):
+    """
+    [Internal]
+
+    Sends a batch of records and returns how many of them were acknowledged, in order.
+
+    With bulk enabled, consecutive records with the same URLs are posted together as a JSON array.
+    """
+    chunks = []
+    for record in records:
+        if bulk and chunks and chunks[-1][0]["urls"] == record["urls"]:
+            chunks[-1].append(record)
+        else:
+            chunks.append([record])
+
+    acknowledged = 0
+    for chunk in chunks:
+        data = [record["data"] for record in chunk] if bulk else chunk[0]["data"]
+        if not post_record(chunk[0]["urls"], json.dumps(data, ensure_ascii=False), timeout):
+            break
+        acknowledged += len(chunk)
+
+    return acknowledged
+
+
+def rewrite_spool(path, records):
+    """
+    [Internal]
+
+    Replaces the spool file content with the records not yet acknowledged, removing it when empty.
+    """
+    if not records:
+        os.remove(path)
+        return
+
+    temp_path = Path(f"{path}.tmp")
+    with open(temp_path, mode="w", encoding="utf-8") as spool_file:
+        for record in records:
+            spool_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        spool_file.flush()
+        os.fsync(spool_file.fileno())
+    os.replace(temp_path, path)
+
+
+def replay_file(path, batch_size=50, bulk=False, timeout=60):
+    """
+    Sends the records of one spool file in batches and removes each acknowledged batch from it.
+
+    Sending stops at the first batch that is not fully acknowledged, keeping the remaining records.
+
+    :return: Number of records sent.
+    :rtype: int
+    """
+    records = []
+    with open(path, encoding="utf-8") as spool_file:
+        for line in spool_file:
+            try:
+                if line.strip():
+                    records.append(json.loads(line))
+            except json.JSONDecodeError:
+                logger().debug(f"[LogSpool]: Skipping invalid line in {path}")
+
+    sent = 0
+    while records:
+        batch = records[:batch_size]
+        acknowledged = send_batch(batch, bulk, timeout)
+        if acknowledged:
+            records = records[acknowledged:]
+            sent += acknowledged
+            rewrite_spool(path, records)
+        if acknowledged < len(batch):
+            break
+
+    if not records and os.path.exists(path):
+        os.remove(path)
+
+    return sent
+
+
+def replay(folder, batch_size=50, bulk=False, timeout=60):
+    """
+    Sends the records of every idle spool file in the folder.
+
+    Spool files locked by a running worker (of any host sharing the folder) are skipped. The
+    other ones are locked while they are replayed, so a worker that spools a new record waits
+    and then appends to the replayed file.
+
+    :param folder: Folder with the spool files.
+    :type folder: str
+    :param batch_size: Number of records acknowledged and truncated at a time. - **Default:** 50
+    :type batch_size: int
+    :param bulk: Posts each batch as a JSON array instead of one request per record. - **Default:** False
+    :type bulk: bool
+    :param timeout: Timeout in seconds of each request. - **Default:** 60
+    :type timeout: int
+
+    :return: Number of records sent.
+    :rtype: int
+
+    Usage:
+
+    >>> # Calling the method:
+    >>> replay(r"C:\\TIR\\Log\\new_log", bulk=True)
+    """
+    sent = 0
+
+    for path in sorted(Path(folder).glob(f"*{SPOOL_SUFFIX}")):
+        lock_file = acquire_lock(path, blocking=False)
+        if lock_file is None:
+            logger().debug(f"[LogSpool]: Skipping spool in use: {path}")
+            continue
+        try:
+            sent += replay_file(path, batch_size, bulk, timeout)
+        finally:
+            release_lock(lock_file, remove=not path.exists())
+
+    return sent
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sends the execution logs saved in TIR spool files.")
+    parser.add_argument("folders", nargs="*", help="Folders with .ndjson spool files. Default: APIJSONPATH and the JSON log folder (LogFolder/new_log)")
+    parser.add_argument("--config", default="config.json", help="Path to config.json")
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--bulk", action="store_true", help="Post each batch as a JSON array")
+    parser.add_argument("--timeout", type=int, default=60)
+    args = parser.parse_args()
+
+    from tir.technologies.core.log import default_folder
+
+    config = ConfigLoader(args.config)
+    # The folder of Log.save_json_file: LogFolder/new_log, or the Log folder of the platform without LogFolder.
+    json_folder = Path(config.log_folder, "new_log") if config.log_folder else default_folder()
+    folders = args.folders or [config.api_json_path, str(json_folder)]
+
+    for folder in folders:
+        if os.path.isdir(folder):
+            print(f"{folder}: {replay(folder, args.batch_size, args.bulk, args.timeout)} record(s) sent")
@@ -1,10 +1,19 @@
+import atexit
+import copy
+import csv
+import gzip
+import json
 import logging
+import queue
+import threading
 import time
 from logging.config import dictConfig
+from logging.handlers import QueueHandler, QueueListener
 from tir.technologies.core.config import ConfigLoader
 from datetime import datetime
 from pathlib import Path
 import os
+import shutil
 import socket
 import inspect
 import sys
@@ -14,6 +23,204 @@ folder = None
 file_path = None
 config = None
 _logger = None
+_listener = None
+_listener_logger = None
+_queue_handler = None
+_exit_registered = False
+
+
+class PeriodicFlushFileHandler(logging.FileHandler):
+    """
+    File handler that doesn't flush after each record: the file is flushed every
+    flush_interval seconds by a background thread, and immediately for ERROR records.
+
+    :param flush_interval: Seconds between two flushes. - **Default:** 5
+    :type flush_interval: float
+    """
+
+    def __init__(self, filename, mode='a', encoding=None, delay=False, flush_interval=5):
+        super().__init__(filename, mode, encoding, delay)
+        self.flush_interval = flush_interval
+        self.closed_event = threading.Event()
+        self.flusher = threading.Thread(target=self.periodic_flush, daemon=True)
+        self.flusher.start()
+
+    def emit(self, record):
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def periodic_flush(self):
+        while not self.closed_event.wait(self.flush_interval):
+            self.flush()
+
+    def close(self):
+        self.closed_event.set()
+        super().close()
+
+
+class RotatingLogHandler(PeriodicFlushFileHandler):
+    """
+    Log file handler that rotates the file by size and age.
+
+    Rotated segments are renamed to ``<name>.<number>.log``, compressed with gzip in a
+    background thread and registered in the TIR_index.csv file of the folder with their
+    start and end time, so the segment of a failure can be found quickly. After each
+    compression the oldest segments of the folder are removed to respect the disk quota.
+
+    :param max_bytes: Size in bytes that triggers a rotation. 0 disables it. - **Default:** 0
+    :type max_bytes: int
+    :param max_age: Age in seconds that triggers a rotation. 0 disables it. - **Default:** 0
+    :type max_age: float
+    :param folder_quota: Maximum size in bytes of the TIR log files in the folder. 0 disables it. - **Default:** 0
+    :type folder_quota: int
+    """
+
+    index_name = "TIR_index.csv"
+
+    def __init__(self, filename, mode='a', encoding=None, delay=False, flush_interval=5, max_bytes=0, max_age=0, folder_quota=0):
+        super().__init__(filename, mode, encoding, delay, flush_interval)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.folder_quota = folder_quota
+        self.segment = 0
+        self.segment_start = datetime.today()
+        self.compressors = []
+
+    def emit(self, record):
+        super().emit(record)
+        try:
+            if self.should_rotate():
+                self.rotate()
+        except Exception:
+            self.handleError(record)
+
+    def should_rotate(self):
+        if self.stream is None:
+            return False
+        if self.max_bytes and self.stream.tell() >= self.max_bytes:
+            return True
+        return bool(self.max_age) and (datetime.today() - self.segment_start).total_seconds() >= self.max_age
+
+    def rotate(self):
+        """
+        Closes the current segment, opens a new file and compresses the segment in background.
+        """
+        self.segment += 1
+        base = Path(self.baseFilename)
+        segment_path = Path(base.parent, f"{base.stem}.{self.segment:03d}{base.suffix}")
+
+        self.stream.close()
+        self.stream = None
+        os.replace(self.baseFilename, segment_path)
+        self.stream = self._open()
+
+        segment_end = datetime.today()
+        compressor = threading.Thread(target=self.compress, args=(segment_path, self.segment_start, segment_end), daemon=True)
+        compressor.start()
+        self.compressors = [thread for thread in self.compressors if thread.is_alive()] + [compressor]
+        self.segment_start = segment_end
+
+    def compress(self, segment_path, start, end):
+        """
+        [Internal]
+        """
+        compressed_path = Path(f"{segment_path}.gz")
+        try:
+            with open(segment_path, 'rb') as source, gzip.open(compressed_path, 'wb') as target:
+                shutil.copyfileobj(source, target)
+            os.remove(segment_path)
+        except OSError:
+            compressed_path = segment_path
+
+        self.write_index(compressed_path, start, end)
+        self.apply_quota()
+
+    def write_index(self, segment_path, start, end):
+        """
+        [Internal]
+        """
+        try:
+            with open(Path(segment_path.parent, self.index_name), 'a', newline='', encoding='utf-8') as index_file:
+                csv.writer(index_file, delimiter=';').writerow([segment_path.name, start.strftime('%Y-%m-%d %H:%M:%S'),
+                                                                end.strftime('%Y-%m-%d %H:%M:%S'), os.getpid(), Path(self.baseFilename).name])
+        except OSError:
+            pass
+
+    def apply_quota(self):
+        """
+        [Internal]
+
+        Removes the oldest compressed segments while the TIR log files of the folder exceed the quota.
+        """
+        if not self.folder_quota:
+            return
+
+        folder = Path(self.baseFilename).parent
+        files = [path for path in folder.glob('TIR_*.log*') if path.is_file()]
+        total = sum(path.stat().st_size for path in files)
+
+        for path in sorted(filter(lambda x: x.suffix == '.gz', files), key=lambda x: x.stat().st_mtime):
+            if total <= self.folder_quota:
+                break
+            try:
+                size = path.stat().st_size
+                path.unlink()
+                total -= size
+            except OSError:
+                pass
+
+    def close(self):
+        for compressor in self.compressors:
+            compressor.join()
+        if self.stream is not None and self.segment:
+            self.write_index(Path(self.baseFilename), self.segment_start, datetime.today())
+        super().close()
+
+
+class BlockingQueueHandler(QueueHandler):
+    """
+    Queue handler that waits for free space instead of failing when the bounded queue is full.
+    """
+
+    def enqueue(self, record):
+        self.queue.put(record)
+
+    def prepare(self, record):
+        """
+        Merges the arguments into the message, keeping exc_info (cleared by QueueHandler for
+        queues between processes), so the formatters of the listener still get the exception.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formats each record as a JSON line.
+    """
+
+    def format(self, record):
+        data = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "process": record.process,
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False)
 
 def get_file_name(file_name):
     """
@@ -160,27 +367,82 @@ def configure_logger():
     }
 
     if file_path and os.path.exists(file_path):
-        logging_config['handlers']['memory_handler'] = {
-            'level': 'DEBUG',
-            'formatter': 'debug',
-            'class': 'logging.handlers.MemoryHandler',
-            'capacity': 5*1024*1024,
-            'flushLevel': logging.CRITICAL,
-            'target': 'debug_file_handler'
+        logging_config['formatters']['json'] = {
+            '()': JsonFormatter
         }
         logging_config['handlers']['debug_file_handler'] = {
             'level': 'DEBUG',
-            'formatter': 'debug',
-            'class': 'logging.FileHandler',
+            'formatter': 'json' if config.log_json else 'debug',
+            '()': RotatingLogHandler,
             'filename': file_path,
-            'mode': 'a'
+            'mode': 'a',
+            'flush_interval': config.log_flush_interval,
+            'max_bytes': config.log_max_size * 1024 * 1024,
+            'max_age': config.log_max_age * 60,
+            'folder_quota': config.log_folder_quota * 1024 * 1024
         }
-        logging_config['loggers']['root']['handlers'].append('memory_handler')
         logging_config['loggers']['root']['handlers'].append('debug_file_handler')
 
+    stop_queue_listener()
     dictConfig(logging_config)
     _logger = logging.getLogger(logger_profile)
     _logger.propagate = False
+    start_queue_listener(_logger)
+
+def start_queue_listener(profile_logger):
+    """
+    Moves the handlers of the logger to a QueueListener thread, so records are formatted
+    and written outside the test thread. The queue is bounded by LogRecordQueueSize records.
+    [Internal]
+    """
+
+    global _listener
+    global _listener_logger
+    global _queue_handler
+    global _exit_registered
+
+    stop_queue_listener()
+
+    handlers = list(profile_logger.handlers)
+    log_queue = queue.Queue(maxsize=config.log_record_queue_size)
+
+    for handler in handlers:
+        profile_logger.removeHandler(handler)
+
+    _queue_handler = BlockingQueueHandler(log_queue)
+    _listener_logger = profile_logger
+    profile_logger.addHandler(_queue_handler)
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+    if not _exit_registered:
+        atexit.register(stop_queue_listener)
+        _exit_registered = True
+
+def stop_queue_listener():
+    """
+    Writes the pending records, stops the QueueListener thread and gives the handlers back
+    to the logger, so records emitted later (as the metrics logged at exit) are still written.
+    [Internal]
+    """
+
+    global _listener
+    global _listener_logger
+    global _queue_handler
+
+    if _listener:
+        _listener.stop()
+        _listener_logger.removeHandler(_queue_handler)
+        for handler in _listener.handlers:
+            try:
+                handler.flush()
+            except (OSError, ValueError):
+                pass
+            _listener_logger.addHandler(handler)
+        _listener = None
+        _listener_logger = None
+        _queue_handler = None
 
 def logger():
     global _logger
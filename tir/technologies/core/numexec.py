@@ -1,8 +1,8 @@
 from tir.technologies.core.config import ConfigLoader
-import requests
 import json
 import time
 from tir.technologies.core.logging_config import logger
+from tir.technologies.core.http_session import post as http_post
 from pathlib import Path
 import os
 
@@ -65,7 +65,7 @@ class NumExec():
 
         data = {'num_exec': self.config.num_exec, 'ip_exec': self.config.ipExec}
 
-        response = requests.post(url.strip(), json=data, proxies=proxies)
+        response = http_post("numexec", url.strip(), json=data, proxies=proxies)
 
         json_data = json.loads(response.text)
 
@@ -0,0 +1,309 @@
+import mmap
+import os
+import re
+from collections import deque
+from contextlib import contextmanager
+from difflib import SequenceMatcher
+from functools import lru_cache
+from itertools import islice
+
+"""
+Report comparison: normalizes a printed report (spool .##r or .xml) into its "auto" file and
+compares it with the "base" file of BaseLine_Spool.
+
+The normalization rules of each extension are compiled once and applied to blocks of lines,
+and the auto file is written through a single buffered handle. The comparison reads both files
+line by line (memory-mapped for very large spool files) and yields every block of differing
+lines with its line number and the lines around it, matching the files again after inserted or
+deleted lines.
+"""
+
+DATE = r"\d{2}-\d{2}-\d{4}"
+CLOCK = r"\d{2}:\d{2}:\d{2}"
+
+XML_RULES = (
+    (re.compile(r'encoding=(?:"UTF-8"|"")'), 'encoding=""'),
+    (re.compile(r'"DateTime">\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}'), '"DateTime">2015-01-01T00:00:00'),
+    (re.compile(r'ss:Width="\d+"'), 'ss:Width="100"'),
+)
+
+# Labels of the Portuguese and Spanish reports, used by Poui.
+DATE_LABELS = ("Emissão", "Emision", "DT.Ref.", "Fc.Ref.")
+TIME_LABELS = ("Hora...", "Hora Término")
+
+BLOCK_LINES = 10000
+MMAP_THRESHOLD = 64 * 1024 * 1024
+MAX_DIFFERENCES = 50
+# Lines of each file kept in a Difference; the other ones are only counted.
+MAX_BLOCK_LINES = 20
+# Lines searched ahead for the files to match again after a difference, and how many equal lines match.
+SYNC_WINDOW = 500
+SYNC_LINES = 3
+
+
+@lru_cache(maxsize=32)
+def rule_set(extension, date_labels=(), time_labels=()):
+    """
+    Returns the compiled normalization rules of the extension, as (pattern, replacement) pairs.
+
+    Reports (.##r) have the dates after date_labels changed to 01-01-2015, the times after
+    time_labels changed to 00:00:00 and '/' changed to '@'. XML reports have the encoding,
+    the DateTime cells and the column widths fixed.
+
+    :param extension: Extension of the report, with the dot.
+    :type extension: str
+    :param date_labels: Labels followed by ": dd-mm-yyyy", e.g. ("Emissão", "DT.Ref."). - **Default:** ()
+    :type date_labels: tuple
+    :param time_labels: Labels followed by ": hh:mm:ss", e.g. ("Hora...", "Hora Término"). - **Default:** ()
+    :type time_labels: tuple
+
+    :rtype: tuple
+
+    Usage:
+
+    >>> # Calling the method:
+    >>> rules = rule_set(".##r", ("Emissão", "DT.Ref."), ("Hora...", "Hora Término"))
+    """
+    if extension.lower() == ".xml":
+        return XML_RULES
+
+    rules = []
+    for labels, value, replacement in ((date_labels, DATE, "01-01-2015"), (time_labels, CLOCK, "00:00:00")):
+        if labels:
+            alternatives = "|".join(re.escape(label) for label in sorted(set(labels), key=len, reverse=True))
+            rules.append((re.compile(rf"({alternatives}): {value}"), rf"\1: {replacement}"))
+    rules.append((re.compile("/"), "@"))
+    return tuple(rules)
+
+
+def normalize(text, rules):
+    """
+    Applies the rules to a line or to a block of lines. None of the rules match a line break,
+    so a block gives the same result as its lines one by one.
+
+    :rtype: str
+    """
+    for pattern, replacement in rules:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def normalize_file(source, target, rules, encoding=None):
+    """
+    Writes the normalized source to target, reading and writing blocks of BLOCK_LINES lines.
+
+    :param source: Path of the printed report.
+    :type source: str
+    :param target: Path of the auto file, overwritten if it exists.
+    :type target: str
+    :param rules: Rules returned by rule_set.
+    :type rules: tuple
+    :param encoding: Encoding of the files. - **Default:** None (Encoding of the platform)
+    :type encoding: str
+
+    :return: Number of lines written.
+    :rtype: int
+    """
+    lines = 0
+    with open(source, encoding=encoding) as source_file, open(target, "w", encoding=encoding) as target_file:
+        while True:
+            block = list(islice(source_file, BLOCK_LINES))
+            if not block:
+                break
+            lines += len(block)
+            target_file.write(normalize("".join(block), rules))
+    return lines
+
+
+class Difference:
+    """
+    Block of consecutive lines that differ between the base and the current file.
+
+    Up to MAX_BLOCK_LINES lines of each file are kept; base_count and current_count have the
+    number of lines of the block in each file.
+
+    :param line: Number of the first differing line of the base file (1-based).
+    :type line: int
+    :param before: Lines of the base file before the block.
+    :type before: list
+    :param current_line: Number of the first differing line of the current file. - **Default:** None (line)
+    :type current_line: int
+    """
+
+    def __init__(self, line, before, current_line=None):
+        self.line = line
+        self.current_line = current_line or line
+        self.before = before
+        self.base = []
+        self.current = []
+        self.after = []
+        self.base_count = 0
+        self.current_count = 0
+
+    @property
+    def last_line(self):
+        return self.line + max(self.base_count, self.current_count) - 1
+
+    def add(self, base_lines, current_lines, decode):
+        """
+        [Internal]
+
+        Adds differing lines of each file to the block, keeping up to MAX_BLOCK_LINES of them.
+        """
+        self.base += [decode(line) for line in base_lines[:max(0, MAX_BLOCK_LINES - len(self.base))]]
+        self.current += [decode(line) for line in current_lines[:max(0, MAX_BLOCK_LINES - len(self.current))]]
+        self.base_count += len(base_lines)
+        self.current_count += len(current_lines)
+
+    def __str__(self):
+        lines = f"line {self.line}" if self.last_line == self.line else f"lines {self.line}-{self.last_line}"
+        text = [f"Report difference in {lines}:"]
+        text += [f"    {self.line - len(self.before) + index}  {line}" for index, line in enumerate(self.before)]
+        text += [f"  - {self.line + index}  {line}" for index, line in enumerate(self.base)]
+        if self.base_count > len(self.base):
+            text.append(f"  - ... {self.base_count - len(self.base)} more line(s)")
+        text += [f"  + {self.current_line + index}  {line}" for index, line in enumerate(self.current)]
+        if self.current_count > len(self.current):
+            text.append(f"  + ... {self.current_count - len(self.current)} more line(s)")
+        text += [f"    {self.line + self.base_count + index}  {line}" for index, line in enumerate(self.after)]
+        return "\n".join(text)
+
+
+class _Reader:
+    """
+    [Internal]
+
+    Line iterator with look-ahead, counting the lines consumed.
+    """
+
+    def __init__(self, lines):
+        self.lines = lines
+        self.buffer = deque()
+        self.number = 0
+
+    def next(self):
+        line = self.buffer.popleft() if self.buffer else next(self.lines, None)
+        if line is not None:
+            self.number += 1
+        return line
+
+    def push(self, line):
+        if line is not None:
+            self.buffer.appendleft(line)
+            self.number -= 1
+
+    def peek(self, count):
+        while len(self.buffer) < count:
+            line = next(self.lines, None)
+            if line is None:
+                break
+            self.buffer.append(line)
+        return list(islice(self.buffer, count))
+
+    def take(self, count):
+        self.number += count
+        return [self.buffer.popleft() for _ in range(count)]
+
+
+def _sync(base_window, current_window):
+    """
+    [Internal]
+
+    Returns how many lines of each window differ before both files have SYNC_LINES equal lines
+    again (or equal lines up to their end), or the whole windows when they don't.
+    """
+    at_end = len(base_window) < SYNC_WINDOW and len(current_window) < SYNC_WINDOW
+    matcher = SequenceMatcher(None, base_window, current_window, autojunk=False)
+    for base_index, current_index, size in matcher.get_matching_blocks():
+        if size >= SYNC_LINES or (size and at_end and base_index + size == len(base_window) and current_index + size == len(current_window)):
+            return base_index, current_index
+    return len(base_window), len(current_window)
+
+
+@contextmanager
+def _lines(path, use_mmap, encoding):
+    """
+    [Internal]
+
+    Yields an iterator of the lines of the file without the line break, as bytes when the file
+    is memory-mapped and as str otherwise.
+    """
+    if not use_mmap:
+        with open(path, encoding=encoding) as file:
+            yield (line.rstrip("\r\n") for line in file)
+        return
+
+    with open(path, "rb") as file:
+        if not os.fstat(file.fileno()).st_size:
+            yield iter(())
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield (line.rstrip(b"\r\n") for line in iter(mapped.readline, b""))
+
+
+def iter_differences(base, current, context=2, use_mmap=None, encoding=None):
+    """
+    Compares the files line by line and yields every block of differing lines as a Difference,
+    with up to context lines before and after it. Lines present in only one of the files are
+    differences too.
+
+    After a difference, the comparison is synchronized again with difflib on the next
+    SYNC_WINDOW lines of each file, so an inserted or deleted line is reported alone instead of
+    shifting every following line.
+
+    :param base: Path of the base file.
+    :type base: str
+    :param current: Path of the file compared with the base (the auto file).
+    :type current: str
+    :param context: Number of lines shown before and after each block. - **Default:** 2
+    :type context: int
+    :param use_mmap: Memory-maps the files. - **Default:** None (When a file has MMAP_THRESHOLD bytes or more)
+    :type use_mmap: bool
+    :param encoding: Encoding of the files. - **Default:** None (Encoding of the platform)
+    :type encoding: str
+
+    :return: Generator of Difference.
+
+    Usage:
+
+    >>> # Calling the method:
+    >>> for difference in iter_differences("acda080rbase.##r", "acda080rauto.##r"):
+    >>>     print(difference)
+    """
+    if use_mmap is None:
+        use_mmap = max(os.path.getsize(base), os.path.getsize(current)) >= MMAP_THRESHOLD
+
+    decode = (lambda line: line.decode(encoding or "latin-1", errors="replace")) if use_mmap else (lambda line: line)
+
+    before = deque(maxlen=context)
+    difference = None
+    with _lines(base, use_mmap, encoding) as base_lines, _lines(current, use_mmap, encoding) as current_lines:
+        base_reader, current_reader = _Reader(base_lines), _Reader(current_lines)
+        while True:
+            base_line, current_line = base_reader.next(), current_reader.next()
+            if base_line is None and current_line is None:
+                break
+
+            if base_line == current_line:
+                if difference is not None:
+                    if len(difference.after) < context:
+                        difference.after.append(decode(base_line))
+                    if len(difference.after) >= context:
+                        yield difference
+                        difference = None
+                before.append(base_line)
+                continue
+
+            base_reader.push(base_line)
+            current_reader.push(current_line)
+            if difference is None or difference.after:
+                if difference is not None:
+                    yield difference
+                difference = Difference(base_reader.number + 1, [decode(line) for line in before], current_reader.number + 1)
+
+            base_count, current_count = _sync(base_reader.peek(SYNC_WINDOW), current_reader.peek(SYNC_WINDOW))
+            difference.add(base_reader.take(base_count), current_reader.take(current_count), decode)
+            before.clear()
+
+    if difference is not None:
+        yield difference
@@ -0,0 +1,167 @@
+import argparse
+import csv
+import sqlite3
+import threading
+from pathlib import Path
+
+"""
+Suite results store: appends the Log table rows of a suite run to a single sqlite file,
+instead of writing one CSV file per test case, and exports the legacy CSV on demand.
+"""
+
+# Legacy CSV header (Log.generate_header) and the matching sqlite column names.
+COLUMNS = [
+    ("Data", "data"),
+    ("Usuário", "usuario"),
+    ("Estação", "estacao"),
+    ("Programa", "programa"),
+    ("Data Programa", "data_programa"),
+    ("Total CTs", "total_cts"),
+    ("Passou", "passou"),
+    ("Falhou", "falhou"),
+    ("Segundos", "segundos"),
+    ("Versão", "versao"),
+    ("Release", "release"),
+    ("CTs Falhou", "cts_falhou"),
+    ("Banco de dados", "banco_de_dados"),
+    ("Chamado", "chamado"),
+    ("ID Execução", "id_execucao"),
+    ("Pais", "pais"),
+    ("Tipo de Teste", "tipo_de_teste"),
+]
+
+RESULTS_SUFFIX = "_results.db"
+
+
+class ResultsStore:
+    """
+    Appends suite results to a sqlite file with one column per Log header field and
+    an index on program, test case and execution id.
+
+    :param path: Path of the sqlite file.
+    :type path: str
+
+    Usage:
+
+    >>> # Calling the method:
+    >>> ResultsStore(path).append(self.table_rows[1:], testcase="test_MATA010_001")
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        self.created = False
+
+    def connect(self):
+        """
+        [Internal]
+        """
+        connection = sqlite3.connect(str(self.path))
+
+        if not self.created:
+            columns = ", ".join(name for _, name in COLUMNS)
+            connection.execute(f"CREATE TABLE IF NOT EXISTS results (id INTEGER PRIMARY KEY AUTOINCREMENT, testcase TEXT, {columns})")
+            connection.execute("CREATE INDEX IF NOT EXISTS idx_results_program ON results (programa, testcase, id_execucao)")
+            self.created = True
+
+        return connection
+
+    def append(self, rows, testcase=""):
+        """
+        Appends Log table rows (without the header) to the store.
+
+        :param rows: Rows with the same fields as Log.generate_header.
+        :type rows: list
+        :param testcase: Test case that generated the rows. - **Default:** "" (empty string)
+        :type testcase: str
+        """
+        if not rows:
+            return
+
+        columns = ", ".join(["testcase"] + [name for _, name in COLUMNS])
+        placeholders = ", ".join(["?"] * (len(COLUMNS) + 1))
+
+        with self.lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = self.connect()
+            try:
+                with connection:
+                    connection.executemany(f"INSERT INTO results ({columns}) VALUES ({placeholders})",
+                                           [[testcase] + list(row[:len(COLUMNS)]) for row in rows])
+            finally:
+                connection.close()
+
+
+def read_rows(paths, program="", execution_id=""):
+    """
+    Returns the rows of one or more results stores, in legacy column order.
+
+    :param paths: Paths of the sqlite files.
+    :type paths: list
+    :param program: Filters rows by program. - **Default:** "" (all)
+    :type program: str
+    :param execution_id: Filters rows by execution id. - **Default:** "" (all)
+    :type execution_id: str
+    """
+    columns = ", ".join(name for _, name in COLUMNS)
+    query = f"SELECT {columns} FROM results"
+    filters = []
+    parameters = []
+
+    if program:
+        filters.append("programa = ?")
+        parameters.append(program)
+    if execution_id:
+        filters.append("id_execucao = ?")
+        parameters.append(execution_id)
+    if filters:
+        query += " WHERE " + " AND ".join(filters)
+
+    rows = []
+    for path in paths:
+        connection = sqlite3.connect(str(path))
+        try:
+            rows.extend(list(row) for row in connection.execute(query + " ORDER BY id", parameters))
+        finally:
+            connection.close()
+
+    return rows
+
+
+def export_csv(paths, csv_path, program="", execution_id=""):
+    """
+    Writes the rows of one or more results stores to a CSV file in the legacy
+    Log.save_file format (windows-1252, ';' delimited).
+
+    :return: Number of rows written.
+    :rtype: int
+
+    Usage:
+
+    >>> # Calling the method:
+    >>> export_csv(glob.glob(r"C:\\TIR\\Log\\*_results.db"), "nightly.csv")
+    """
+    rows = read_rows(paths, program, execution_id)
+
+    with open(csv_path, mode="w", newline="", encoding="windows-1252", errors="replace") as csv_file:
+        csv_writer_header = csv.writer(csv_file, delimiter=';', quoting=csv.QUOTE_NONE)
+        csv_writer_header.writerow([header for header, _ in COLUMNS])
+        csv_writer = csv.writer(csv_file, delimiter=';', quotechar='"', quoting=csv.QUOTE_NONNUMERIC)
+        csv_writer.writerows(rows)
+
+    return len(rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Exports TIR results stores to the legacy CSV format.")
+    parser.add_argument("paths", nargs="+", help=f"*{RESULTS_SUFFIX} files or folders containing them")
+    parser.add_argument("--output", required=True, help="CSV file to be written")
+    parser.add_argument("--program", default="")
+    parser.add_argument("--execution-id", default="")
+    args = parser.parse_args()
+
+    files = []
+    for path in map(Path, args.paths):
+        files.extend(sorted(path.glob(f"*{RESULTS_SUFFIX}")) if path.is_dir() else [path])
+
+    print(f"{export_csv(files, args.output, args.program, args.execution_id)} row(s) exported to {args.output}")
@@ -1,6 +1,7 @@
 
 from tir.technologies.core.config import ConfigLoader
 from tir.technologies.core.language import LanguagePack
+from tir.technologies.core.session import current_session, use_session
 
 class Router:
     """
@@ -21,11 +22,13 @@ class Router:
     :param inst_webapp: Optional WebappInternal instance for injection
     :param inst_poui: Optional PouiInternal instance for injection
 
-    Note: Driver instances are created lazily only when needed.
+    Note: Driver instances are created lazily only when needed, in the session
+    that was current when the Router was created.
     """
 
     def __init__(self, config_path="", inst_webapp=None, inst_poui=None):
-        self.config = ConfigLoader()
+        self.session = current_session()
+        self.config = self.session.config or ConfigLoader()
         self._config_path = config_path
         self.__webapp = None
         self.__poui = None
@@ -51,7 +54,8 @@ class Router:
 
         if self.__webapp is None or not self._is_driver_active(self.__webapp):
             from tir.technologies.webapp_internal import WebappInternal
-            self.__webapp = WebappInternal(self._config_path, autostart=False)
+            with use_session(self.session):
+                self.__webapp = WebappInternal(self._config_path, autostart=False)
         
         return self.__webapp
 
@@ -63,7 +67,8 @@ class Router:
 
         if self.__poui is None or not self._is_driver_active(self.__poui):
             from tir.technologies.poui_internal import PouiInternal
-            self.__poui = PouiInternal(self._config_path, autostart=False)
+            with use_session(self.session):
+                self.__poui = PouiInternal(self._config_path, autostart=False)
         
         return self.__poui
     
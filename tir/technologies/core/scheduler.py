@@ -0,0 +1,403 @@
+import argparse
+import csv
+import heapq
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from tir.technologies.core.execution_history import ExecutionHistory
+from tir.technologies.core.results_store import RESULTS_SUFFIX, read_rows
+
+"""
+Duration-aware sharding: predicts the runtime of each test suite from the durations TIR already
+records (HistoryPath, *_results.db stores and the Log CSV files), splits the suites into shards
+with balanced predicted runtime (longest processing time first) and writes one manifest per agent.
+
+Manifests can be loaded into a sqlite work queue, from which local workers or the suite runner
+claim the longest pending suite first.
+"""
+
+DEFAULT_SECONDS = 60.0
+MANIFEST_PREFIX = "shard_"
+
+
+def suite_name(file):
+    """
+    [Internal]
+
+    Returns the suite name (file stem) and the program, e.g. ("MATA010TESTSUITE", "MATA010").
+    """
+    stem = Path(file).stem
+    program = stem.upper()
+    for suffix in ("TESTSUITE", "TESTCASE"):
+        program = program.split(suffix)[0]
+    return stem, program.strip("_")
+
+
+def history_durations(path):
+    """
+    Returns the predicted seconds of each test suite recorded in an execution history file,
+    as the sum of the average duration of its test cases.
+
+    :rtype: dict
+    """
+    durations = {}
+    for (testsuite, _), runs in ExecutionHistory(path).runs().items():
+        seconds = [run_seconds for _, run_seconds, _ in runs]
+        durations[testsuite] = durations.get(testsuite, 0.0) + sum(seconds) / len(seconds)
+    return durations
+
+
+def results_durations(paths):
+    """
+    Returns the average seconds of each program in results stores and Log CSV files.
+
+    Rows with the same suite date, station and program are one suite run, whose duration is
+    the sum of their seconds. Log.save_file writes every row of the suite so far to a new
+    *_auto.csv file, so a run found in several CSV files takes the longest of them.
+
+    :param paths: *_results.db and *.csv files or folders containing them.
+    :type paths: list
+    :rtype: dict
+    """
+    runs = {}
+    for path in map(Path, paths):
+        files = sorted(path.glob(f"**/*{RESULTS_SUFFIX}")) + sorted(path.glob("**/*_auto.csv")) if path.is_dir() else [path]
+        for file in files:
+            if file.name.endswith(RESULTS_SUFFIX):
+                runs.update(suite_runs(read_rows([file]), runs))
+            else:
+                with open(file, newline="", encoding="windows-1252") as csv_file:
+                    for key, seconds in suite_runs(list(csv.reader(csv_file, delimiter=';', quotechar='"'))[1:]).items():
+                        runs[key] = max(runs.get(key, 0.0), seconds)
+
+    totals = {}
+    for (_, _, program), seconds in runs.items():
+        totals.setdefault(program, []).append(seconds)
+
+    return {program: sum(seconds) / len(seconds) for program, seconds in totals.items()}
+
+
+def suite_runs(rows, runs=None):
+    """
+    [Internal]
+
+    Adds the seconds of the rows to their suite runs, by suite date, station and program.
+    """
+    runs = dict(runs or {})
+    for row in rows:
+        try:
+            key = (row[0], row[2], str(row[3]).upper())
+            runs[key] = runs.get(key, 0.0) + float(row[8] or 0)
+        except (IndexError, ValueError):
+            continue
+    return runs
+
+
+def predict(files, history=None, results=None, default=None):
+    """
+    Returns the predicted seconds of each file.
+
+    The suite name is searched in the history durations, then its program in the results
+    durations. Unknown suites receive the median of the known ones (or DEFAULT_SECONDS).
+
+    :param files: TESTSUITE/TESTCASE files.
+    :type files: list
+    :param history: Durations by suite name, from history_durations. - **Default:** None
+    :type history: dict
+    :param results: Durations by program, from results_durations. - **Default:** None
+    :type results: dict
+    :param default: Seconds of the unknown suites. - **Default:** None (median)
+    :type default: float
+    :rtype: dict
+    """
+    history = history or {}
+    results = results or {}
+    predicted = {}
+
+    for file in files:
+        stem, program = suite_name(file)
+        seconds = history.get(stem, results.get(program))
+        if seconds is not None:
+            predicted[str(file)] = round(seconds, 2)
+
+    if default is None:
+        known = sorted(predicted.values())
+        default = known[len(known) // 2] if known else DEFAULT_SECONDS
+
+    return {str(file): predicted.get(str(file), default) for file in files}
+
+
+def plan_shards(predicted, shards):
+    """
+    Splits the files into shards with balanced predicted runtime, assigning the longest
+    file first to the shard with the lowest load (LPT).
+
+    :param predicted: Predicted seconds by file.
+    :type predicted: dict
+    :param shards: Number of shards (agents).
+    :type shards: int
+
+    :return: List of shards, each one a dict with shard, predicted_seconds and files.
+    :rtype: list
+
+    Usage:
+
+    >>> # Calling the method:
+    >>> plan = plan_shards(predict(files, history_durations("history.db")), shards=4)
+    """
+    plan = [{"shard": shard, "predicted_seconds": 0.0, "files": []} for shard in range(max(1, shards))]
+    loads = [(0.0, shard) for shard in range(len(plan))]
+
+    for file, seconds in sorted(predicted.items(), key=lambda x: (-x[1], x[0])):
+        load, shard = heapq.heappop(loads)
+        plan[shard]["files"].append({"file": file, "predicted_seconds": seconds})
+        plan[shard]["predicted_seconds"] = round(load + seconds, 2)
+        heapq.heappush(loads, (load + seconds, shard))
+
+    return plan
+
+
+def write_manifests(plan, folder):
+    """
+    Writes one shard_<n>.json manifest per shard.
+
+    Files are written relative to the manifest folder, so the manifests can be shared by
+    agents with a different checkout path.
+
+    :return: Paths of the manifests.
+    :rtype: list
+    """
+    Path(folder).mkdir(parents=True, exist_ok=True)
+    paths = []
+    for shard in plan:
+        path = Path(folder, f"{MANIFEST_PREFIX}{shard['shard']}.json")
+        files = [{**item, "file": relative_path(item["file"], folder)} for item in shard["files"]]
+        with open(path, mode="w", encoding="utf-8") as manifest:
+            json.dump({**shard, "files": files}, manifest, indent=2)
+        paths.append(path)
+    return paths
+
+
+def relative_path(file, folder):
+    """
+    [Internal]
+
+    Returns the file relative to the folder, with "/" separators, or the file itself when it
+    is on another drive.
+    """
+    try:
+        return Path(os.path.relpath(Path(file).resolve(), Path(folder).resolve())).as_posix()
+    except ValueError:
+        return str(file)
+
+
+def resolve_file(file, root):
+    """
+    Returns the path of a manifest or work queue file, resolving relative files from root.
+
+    :param file: File of a manifest or work queue item.
+    :type file: str
+    :param root: Folder the file is relative to (the manifest folder).
+    :type root: str
+    :rtype: Path
+    """
+    return Path(root, file).resolve()
+
+
+def read_manifest(path):
+    """
+    Returns the files of a manifest with their predicted seconds, resolved from the manifest folder.
+
+    :rtype: list
+    """
+    with open(path, encoding="utf-8") as manifest:
+        files = json.load(manifest)["files"]
+    return [{**item, "file": str(resolve_file(item["file"], Path(path).parent))} for item in files]
+
+
+class WorkQueue:
+    """
+    sqlite-backed queue of test suites shared by the workers of one or more agents.
+
+    Workers claim the pending file with the longest predicted runtime, so the queue also
+    balances the work dynamically when the predictions are wrong.
+
+    A claimed file is leased to its worker, which must renew the lease while the file runs.
+    Files whose lease expired, because the worker or its agent died, are pending again and
+    claimed by the next worker.
+
+    :param path: Path of the sqlite file.
+    :type path: str
+    :param lease_seconds: Seconds a claimed file stays with its worker without a renewal. - **Default:** 300
+    :type lease_seconds: float
+
+    Usage:
+
+    >>> # Calling the method:
+    >>> work_queue = WorkQueue("nightly_queue.db")
+    >>> work_queue.put(read_manifest("shard_0.json"), shard=0)
+    >>> item = work_queue.claim("agent01-worker0")
+    >>> work_queue.renew(item["id"])
+    >>> work_queue.done(item["id"], returncode=0, seconds=35.2)
+    """
+
+    def __init__(self, path, lease_seconds=300):
+        self.path = Path(path)
+        self.lease_seconds = lease_seconds
+        self.lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = self.connect()
+        try:
+            with connection:
+                connection.execute("CREATE TABLE IF NOT EXISTS queue (id INTEGER PRIMARY KEY AUTOINCREMENT, file TEXT, "
+                                   "predicted_seconds REAL, shard INTEGER, status TEXT DEFAULT 'pending', agent TEXT, "
+                                   "started TEXT, seconds REAL, returncode INTEGER, expires REAL)")
+                if "expires" not in [column[1] for column in connection.execute("PRAGMA table_info(queue)")]:
+                    connection.execute("ALTER TABLE queue ADD COLUMN expires REAL")
+                connection.execute("CREATE INDEX IF NOT EXISTS idx_queue_status ON queue (status, shard, predicted_seconds)")
+        finally:
+            connection.close()
+
+    def connect(self):
+        """
+        [Internal]
+        """
+        return sqlite3.connect(str(self.path), timeout=30, isolation_level=None)
+
+    def put(self, files, shard=None):
+        """
+        Adds files to the queue.
+
+        :param files: Dicts with file and predicted_seconds, as in the manifests.
+        :type files: list
+        :param shard: Shard of the files. - **Default:** None (any agent)
+        :type shard: int
+        """
+        with self.lock:
+            connection = self.connect()
+            try:
+                connection.execute("BEGIN IMMEDIATE")
+                connection.executemany("INSERT INTO queue (file, predicted_seconds, shard) VALUES (?, ?, ?)",
+                                       [(item["file"], item.get("predicted_seconds", DEFAULT_SECONDS), shard) for item in files])
+                connection.execute("COMMIT")
+            finally:
+                connection.close()
+
+    def claim(self, agent, shard=None):
+        """
+        Marks the longest pending file as running, leased to the agent, and returns it. Running
+        files with an expired lease are pending again before the claim.
+
+        :param agent: Name of the agent or worker claiming the file.
+        :type agent: str
+        :param shard: Claims only files of this shard, falling back to any shard when it is empty. - **Default:** None
+        :type shard: int
+
+        :return: Dict with id, file and predicted_seconds, or None when the queue is empty.
+        :rtype: dict
+        """
+        with self.lock:
+            connection = self.connect()
+            try:
+                connection.execute("BEGIN IMMEDIATE")
+                connection.execute("UPDATE queue SET status = 'pending', agent = NULL, started = NULL, expires = NULL "
+                                   "WHERE status = 'running' AND expires < ?", (time.time(),))
+                row = None
+                if shard is not None:
+                    row = connection.execute("SELECT id, file, predicted_seconds FROM queue WHERE status = 'pending' AND shard = ? "
+                                             "ORDER BY predicted_seconds DESC, id LIMIT 1", (shard,)).fetchone()
+                if row is None:
+                    row = connection.execute("SELECT id, file, predicted_seconds FROM queue WHERE status = 'pending' "
+                                             "ORDER BY predicted_seconds DESC, id LIMIT 1").fetchone()
+                if row:
+                    connection.execute("UPDATE queue SET status = 'running', agent = ?, started = ?, expires = ? WHERE id = ?",
+                                       (agent, time.strftime("%Y-%m-%d %H:%M:%S"), time.time() + self.lease_seconds, row[0]))
+                connection.execute("COMMIT")
+            finally:
+                connection.close()
+
+        return {"id": row[0], "file": row[1], "predicted_seconds": row[2]} if row else None
+
+    def renew(self, item_id):
+        """
+        Extends the lease of a running file by lease_seconds.
+
+        :return: False when the file is no longer running, e.g. its lease expired and it was claimed again.
+        :rtype: bool
+        """
+        with self.lock:
+            connection = self.connect()
+            try:
+                return connection.execute("UPDATE queue SET expires = ? WHERE id = ? AND status = 'running'",
+                                          (time.time() + self.lease_seconds, item_id)).rowcount > 0
+            finally:
+                connection.close()
+
+    def done(self, item_id, returncode, seconds):
+        """
+        Marks a claimed file as finished.
+        """
+        with self.lock:
+            connection = self.connect()
+            try:
+                connection.execute("UPDATE queue SET status = 'done', returncode = ?, seconds = ?, expires = NULL WHERE id = ?",
+                                   (returncode, seconds, item_id))
+            finally:
+                connection.close()
+
+    def status(self):
+        """
+        Returns the number of files by status.
+
+        :rtype: dict
+        """
+        connection = self.connect()
+        try:
+            return dict(connection.execute("SELECT status, COUNT(*) FROM queue GROUP BY status").fetchall())
+        finally:
+            connection.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Splits TIR test suites into shards with balanced predicted runtime.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    plan_parser = subparsers.add_parser("plan", help="Writes one manifest per shard")
+    plan_parser.add_argument("files", nargs="+", help="TESTSUITE/TESTCASE files or folders containing them")
+    plan_parser.add_argument("--shards", type=int, required=True)
+    plan_parser.add_argument("--history", help="Execution history file (HistoryPath)")
+    plan_parser.add_argument("--results", nargs="*", default=[], help="*_results.db/*.csv files or log folders")
+    plan_parser.add_argument("--output", default="manifests")
+
+    enqueue_parser = subparsers.add_parser("enqueue", help="Loads manifests into a sqlite work queue, keeping their relative files")
+    enqueue_parser.add_argument("manifests", nargs="+")
+    enqueue_parser.add_argument("--queue", required=True)
+
+    status_parser = subparsers.add_parser("status", help="Shows the work queue status")
+    status_parser.add_argument("--queue", required=True)
+
+    args = parser.parse_args()
+
+    if args.command == "plan":
+        files = []
+        for path in map(Path, args.files):
+            files.extend(sorted(path.glob("*TESTSUITE.py")) if path.is_dir() else [path])
+
+        predicted = predict([str(file.resolve()) for file in files],
+                            history_durations(args.history) if args.history else None,
+                            results_durations(args.results) if args.results else None)
+        plan = plan_shards(predicted, args.shards)
+        for shard, path in zip(plan, write_manifests(plan, args.output)):
+            print(f"{path}: {len(shard['files'])} file(s), {shard['predicted_seconds']}s predicted")
+    elif args.command == "enqueue":
+        work_queue = WorkQueue(args.queue)
+        for path in args.manifests:
+            with open(path, encoding="utf-8") as manifest:
+                shard = json.load(manifest)
+            work_queue.put(shard["files"], shard.get("shard"))
+        print(work_queue.status())
+    else:
+        print(WorkQueue(args.queue).status())
@@ -0,0 +1,100 @@
+import contextvars
+import itertools
+from contextlib import contextmanager
+
+"""
+Browser sessions: each Session owns the WebDriver, WebDriverWait, config, log, error list and
+event handlers shared by the technology instances (WebappInternal, PouiInternal and Router)
+that drive one browser, so several independent sessions can run in the same process.
+
+The current session is kept in a context variable. Threads start with the default session and
+can bind their own with use_session() or bind_session().
+"""
+
+_counter = itertools.count(1)
+
+
+class Session:
+    """
+    Holds the state shared by every technology instance that drives the same browser.
+
+    :param name: Name of the session, used in the logs. - **Default:** "session-<n>"
+    :type name: str
+    :param config: Config used by the instances of the session. - **Default:** None (ConfigLoader)
+    :type config: ConfigLoader
+    :param overrides: config.json keys of this session, applied over config with ConfigLoader.derive. - **Default:** None
+    :type overrides: dict
+
+    Usage:
+
+    >>> # Calling the method:
+    >>> with use_session(Session("worker-1")):
+    >>>     oHelper = Webapp()
+    >>> with use_session(Session("sped", overrides={"Environment": "SPED", "User": "tir02"})):
+    >>>     oHelperSped = Webapp()
+    """
+
+    def __init__(self, name="", config=None, overrides=None):
+        self.name = name or f"session-{next(_counter)}"
+        if overrides:
+            from tir.technologies.core.config import ConfigLoader
+            config = (config or ConfigLoader()).derive(overrides)
+        self.config = config
+        self.driver = None
+        self.wait = None
+        self.log = None
+        self.errors = []
+        self.subscribers = {}
+        self.transport = None
+        self.transport_driver = None
+
+    def __repr__(self):
+        return f"Session({self.name!r})"
+
+
+_default_session = Session("default")
+_current_session = contextvars.ContextVar("tir_session", default=_default_session)
+
+
+def current_session():
+    """
+    Returns the session bound to the current thread or context.
+    """
+    return _current_session.get()
+
+
+def bind_session(session):
+    """
+    Binds the session to the current thread or context.
+
+    :param session: Session to be bound.
+    :type session: Session
+
+    :return: Token used to restore the previous session with unbind_session.
+    """
+    return _current_session.set(session)
+
+
+def unbind_session(token):
+    """
+    Restores the session bound before bind_session.
+    """
+    _current_session.reset(token)
+
+
+@contextmanager
+def use_session(session):
+    """
+    Binds the session while the block runs, restoring the previous one at the end.
+
+    Usage:
+
+    >>> # Calling the method:
+    >>> with use_session(self.session):
+    >>>     self.__webapp = WebappInternal(self._config_path, autostart=False)
+    """
+    token = bind_session(session)
+    try:
+        yield session
+    finally:
+        unbind_session(token)
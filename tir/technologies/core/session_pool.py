@@ -0,0 +1,133 @@
+import atexit
+import threading
+from tir.technologies.core.config import ConfigLoader
+from tir.technologies.core.logging_config import logger
+
+"""
+Warm session pool: keeps browsers already logged in Protheus at the main menu, so the next
+suite of the same process skips Start, get_url, program_screen, user_screen and
+environment_screen.
+
+A browser is returned to the pool by TearDown when the suite had no errors and the main menu
+is visible, and it is closed after SessionPoolMaxUses suites.
+"""
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+class SessionPool:
+    """
+    Keeps idle logged-in browsers by url, environment, user and browser.
+
+    Each entry is a dict with the driver, the wait, the number of uses and the login
+    (initial program and environment) used by the last suite.
+
+    :param max_uses: Number of suites served by a browser before it is closed. - **Default:** 20
+    :type max_uses: int
+    :param max_idle: Number of idle browsers kept for each key. - **Default:** 1
+    :type max_idle: int
+
+    Usage:
+
+    >>> # Calling the method:
+    >>> entry = session_pool().acquire(self.config)
+    """
+
+    def __init__(self, max_uses=20, max_idle=1):
+        self.max_uses = max_uses
+        self.max_idle = max_idle
+        self.idle = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key(config):
+        """
+        [Internal]
+        """
+        return (config.url, config.environment, config.user, config.browser.lower())
+
+    def acquire(self, config):
+        """
+        Takes an idle browser of the config key out of the pool.
+
+        Browsers whose WebDriver session is no longer active are closed and skipped.
+
+        :return: The pool entry or None when there is no idle browser.
+        :rtype: dict
+        """
+        key = self.key(config)
+
+        while True:
+            with self.lock:
+                entries = self.idle.get(key, [])
+                if not entries:
+                    return None
+                entry = entries.pop()
+
+            try:
+                entry["driver"].current_url
+            except Exception:
+                self.discard(entry)
+                continue
+
+            entry["uses"] += 1
+            logger().info(f"[SessionPool]: Reusing logged-in browser ({entry['uses']}/{self.max_uses})")
+            return entry
+
+    def release(self, entry, healthy=True):
+        """
+        Returns a browser to the pool, or closes it when it is not healthy, reached
+        max_uses or there are already max_idle browsers for its key.
+
+        :param entry: Pool entry with key, driver, wait, uses and login.
+        :type entry: dict
+        :param healthy: Whether the suite ended without errors at the main menu. - **Default:** True
+        :type healthy: bool
+
+        :return: True if the browser was kept in the pool.
+        :rtype: bool
+        """
+        if healthy and entry["uses"] < self.max_uses:
+            with self.lock:
+                entries = self.idle.setdefault(entry["key"], [])
+                if len(entries) < self.max_idle:
+                    entries.append(entry)
+                    return True
+
+        self.discard(entry)
+        return False
+
+    def discard(self, entry):
+        """
+        Closes the browser of the entry.
+        """
+        logger().debug(f"[SessionPool]: Closing browser after {entry['uses']} use(s)")
+        try:
+            entry["driver"].quit()
+        except Exception as e:
+            logger().debug(f"[SessionPool]: Error closing browser: {e}")
+
+    def close(self):
+        """
+        Closes every idle browser.
+        """
+        with self.lock:
+            entries = [entry for entries in self.idle.values() for entry in entries]
+            self.idle.clear()
+
+        for entry in entries:
+            self.discard(entry)
+
+
+def session_pool():
+    """
+    Returns the process-wide SessionPool, creating it on first use with SessionPoolMaxUses.
+    Idle browsers are closed when the interpreter exits.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = SessionPool(max_uses=ConfigLoader().session_pool_max_uses)
+            atexit.register(_pool.close)
+        return _pool
@@ -0,0 +1,178 @@
+import functools
+import json
+import os
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from tir.technologies.core.log import default_folder
+from tir.technologies.core.logging_config import logger
+
+"""
+Startup profiler: times the phases between Webapp()/Poui() and the first menu (Start, get_url,
+webapp_shadowroot, program_screen, user_screen, environment_screen, close_screen_before_menu...)
+and, at the end of Setup, logs a summary and, with StartupProfile, appends one metrics line
+to startup_metrics.ndjson. StartupTrace also writes a Chrome trace-event file, which can be
+opened in chrome://tracing or https://ui.perfetto.dev.
+"""
+
+METRICS_FILE = "startup_metrics.ndjson"
+
+
+class StartupProfiler:
+    """
+    Records the duration of the startup phases of one technology instance.
+
+    Phases shorter than min_seconds are not recorded, so methods that return a cached value
+    (as webapp_shadowroot after the first probe) don't flood the trace.
+
+    :param name: Name of the profiled instance, used in the trace. - **Default:** "startup"
+    :type name: str
+    :param min_seconds: Minimum duration of a recorded phase. - **Default:** 0.001
+    :type min_seconds: float
+
+    Usage:
+
+    >>> # Calling the method:
+    >>> with self.startup.phase("get_url"):
+    >>>     self.driver.get(url)
+    """
+
+    def __init__(self, name="startup", min_seconds=0.001):
+        self.name = name
+        self.min_seconds = min_seconds
+        self.started = time.time()
+        self.perf_started = time.perf_counter()
+        self.events = []
+        self.active = True
+        self.depth = 0
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Records the duration of the block as a phase.
+        """
+        if not self.active:
+            yield
+            return
+
+        start = time.perf_counter()
+        self.depth += 1
+        try:
+            yield
+        finally:
+            self.depth -= 1
+            self.record(name, start)
+
+    def record(self, name, start):
+        """
+        Records a phase started at start (time.perf_counter) and ending now, for the parts of
+        a method that are not worth a method of their own.
+
+        Usage:
+
+        >>> # Calling the method:
+        >>> start = time.perf_counter()
+        >>> self.driver.maximize_window()
+        >>> self.startup.record("window_sizing", start)
+        """
+        seconds = time.perf_counter() - start
+        if self.active and seconds >= self.min_seconds:
+            self.events.append({"name": name, "start": start - self.perf_started, "seconds": seconds,
+                                "depth": self.depth, "tid": threading.get_ident()})
+
+    def summary(self):
+        """
+        Returns the total startup seconds and, for each phase, its calls and seconds.
+        Seconds of nested phases are also counted in the phases that contain them.
+
+        :rtype: dict
+        """
+        phases = {}
+        for event in self.events:
+            phase = phases.setdefault(event["name"], {"calls": 0, "seconds": 0.0})
+            phase["calls"] += 1
+            phase["seconds"] += event["seconds"]
+
+        return {
+            "total": round(time.perf_counter() - self.perf_started, 3),
+            "phases": {name: {"calls": phase["calls"], "seconds": round(phase["seconds"], 3)}
+                       for name, phase in sorted(phases.items(), key=lambda x: -x[1]["seconds"])},
+        }
+
+    def trace_events(self):
+        """
+        Returns the phases as Chrome trace events (complete events, in microseconds).
+
+        :rtype: list
+        """
+        pid = os.getpid()
+        return [{"name": event["name"], "cat": "startup", "ph": "X", "pid": pid, "tid": event["tid"],
+                 "ts": round(event["start"] * 1e6), "dur": round(event["seconds"] * 1e6),
+                 "args": {"depth": event["depth"]}} for event in self.events]
+
+    def finish(self, config, folder="", extra=None):
+        """
+        Stops the profiling and emits the results: a summary in the log, a line in
+        startup_metrics.ndjson (StartupProfile) and a Chrome trace file (StartupTrace).
+
+        :param config: The config of the instance.
+        :type config: ConfigLoader
+        :param folder: Log folder. - **Default:** "" (Log folder of the station, as in Log)
+        :type folder: str
+        :param extra: Fields added to the metrics, e.g. the initial program. - **Default:** None
+        :type extra: dict
+
+        :return: The summary.
+        :rtype: dict
+        """
+        if not self.active:
+            return None
+        self.active = False
+
+        summary = self.summary()
+        phases = " | ".join(f"{name} {phase['seconds']}s" + (f" ({phase['calls']}x)" if phase["calls"] > 1 else "")
+                            for name, phase in summary["phases"].items())
+        message = f"[Startup]: {summary['total']}s until the menu | {phases}"
+
+        if not (config.startup_profile or config.startup_trace):
+            logger().debug(message)
+            return summary
+
+        logger().info(message)
+
+        station = socket.gethostname()
+        path = Path(folder or default_folder(station), "startup")
+        try:
+            path.mkdir(parents=True, exist_ok=True)
+            metrics = {"time": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.started)),
+                       "station": station, "name": self.name, **(extra or {}), **summary}
+
+            if config.startup_profile:
+                with open(Path(path, METRICS_FILE), mode="a", encoding="utf-8") as metrics_file:
+                    metrics_file.write(json.dumps(metrics, ensure_ascii=False) + "\n")
+
+            if config.startup_trace:
+                trace_path = Path(path, f"{self.name}_{time.strftime('%Y%m%d%H%M%S', time.localtime(self.started))}_{os.getpid()}.trace.json")
+                with open(trace_path, mode="w", encoding="utf-8") as trace_file:
+                    json.dump({"traceEvents": self.trace_events(), "metadata": metrics}, trace_file, ensure_ascii=False)
+                logger().info(f"[Startup]: Trace written to {trace_path}")
+        except OSError as e:
+            logger().warning(f"[Startup]: Couldn't write the startup metrics: {e}")
+
+        return summary
+
+
+def startup_phase(func):
+    """
+    Decorator that records the method as a startup phase of the instance profiler (self.startup).
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        profiler = getattr(self, "startup", None)
+        if profiler is None or not profiler.active:
+            return func(self, *args, **kwargs)
+        with profiler.phase(func.__name__):
+            return func(self, *args, **kwargs)
+    return wrapper
@@ -0,0 +1,315 @@
+import argparse
+import csv
+import json
+import os
+import queue
+import shutil
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from tir.technologies.core.config import OVERRIDES_ENV
+from tir.technologies.core.results_store import RESULTS_SUFFIX, COLUMNS, read_rows
+from tir.technologies.core.scheduler import WorkQueue, read_manifest, resolve_file
+
+"""
+Parallel suite runner: distributes TESTSUITE/TESTCASE files over a pool of workers, each one
+with its own headless browser, LogFolder and ScreenshotFolder, and merges the Log table rows
+and JSON logs of every worker at the end.
+
+Each worker runs its suites one at a time in a new Python process, so the ConfigLoader of the
+suite is loaded with the worker config overrides (for example a different User per worker,
+since Protheus allows one session per user and environment).
+"""
+
+SUMMARY_FILE = "runner_summary.json"
+LEGACY_SUFFIX = "_auto.csv"
+
+
+def collect_files(paths):
+    """
+    Returns the files to be run: the files themselves, the *TESTSUITE.py files of the folders
+    and the files of the shard manifests (.json).
+
+    :param paths: Files, folders and manifests.
+    :type paths: list
+
+    :rtype: list
+    """
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(path.glob("*TESTSUITE.py")))
+        elif path.suffix == ".json":
+            files.extend(Path(item["file"]) for item in read_manifest(path))
+        else:
+            files.append(path)
+    return files
+
+
+def last_log_file(paths):
+    """
+    [Internal]
+
+    Log.save_file writes every row of the suite to a new *_auto.csv file on each call, so the
+    files of a suite are cumulative: returns the one with the most lines (the newest on ties).
+    """
+    def size(path):
+        with open(path, newline="", encoding="windows-1252") as log_file:
+            return sum(1 for _ in log_file), path.stat().st_mtime
+
+    return max(paths, key=size) if paths else None
+
+
+class SuiteRunner:
+    """
+    Runs test suites in parallel worker processes.
+
+    :param files: TESTSUITE or TESTCASE files to be executed.
+    :type files: list
+    :param workers: Number of workers (browsers) running at the same time. - **Default:** 2
+    :type workers: int
+    :param output: Folder that receives the worker folders and the merged results. - **Default:** "tir_run"
+    :type output: str
+    :param overrides: Config keys applied to every worker. - **Default:** None
+    :type overrides: dict
+    :param worker_overrides: Config keys of each worker, by worker index. - **Default:** None
+    :type worker_overrides: list
+    :param headless: Runs the browsers in headless mode. - **Default:** True
+    :type headless: bool
+    :param work_queue: Shared WorkQueue the workers claim files from, instead of files. - **Default:** None
+    :type work_queue: WorkQueue
+    :param agent: Name of this agent in the work queue. - **Default:** host name
+    :type agent: str
+    :param shard: Shard claimed first from the work queue. - **Default:** None
+    :type shard: int
+    :param root: Folder the relative files of the work queue are resolved from, the manifests folder of this agent. - **Default:** current folder
+    :type root: str
+
+    Usage:
+
+    >>> # Calling the method:
+    >>> runner = SuiteRunner(["MATA010TESTSUITE.py", "MATA020TESTSUITE.py"], workers=2,
+    >>>                      worker_overrides=[{"User": "tir01"}, {"User": "tir02"}])
+    >>> summary = runner.run()
+    """
+
+    def __init__(self, files, workers=2, output="tir_run", overrides=None, worker_overrides=None, headless=True,
+                 work_queue=None, agent="", shard=None, root=""):
+        self.files = [Path(file).resolve() for file in files]
+        self.work_queue = work_queue
+        self.agent = agent or socket.gethostname()
+        self.shard = shard
+        self.root = Path(root or os.getcwd())
+        self.workers = max(1, workers if work_queue else min(workers, len(self.files) or 1))
+        self.output = Path(output).resolve()
+        self.overrides = overrides or {}
+        self.worker_overrides = worker_overrides or []
+        self.headless = headless
+        self.results = []
+        self.lock = threading.Lock()
+
+    def worker_folder(self, worker):
+        """
+        [Internal]
+        """
+        return Path(self.output, f"worker_{worker}")
+
+    def worker_config(self, worker):
+        """
+        [Internal]
+
+        Returns the config overrides of the worker: isolated LogFolder and ScreenshotFolder,
+        Headless, the overrides of every worker and the overrides of this worker.
+        """
+        folder = self.worker_folder(worker)
+        config = {
+            "LogFolder": str(Path(folder, "Log")),
+            "ScreenshotFolder": str(Path(folder, "Screenshot")),
+            "Headless": self.headless,
+        }
+        config.update(self.overrides)
+        if worker < len(self.worker_overrides):
+            config.update(self.worker_overrides[worker] or {})
+        return config
+
+    def run(self):
+        """
+        Runs every file and merges the results of the workers.
+
+        :return: Summary with the result of each file and the merged files.
+        :rtype: dict
+        """
+        pending = queue.Queue()
+        for file in self.files:
+            pending.put(file)
+
+        starttime = time.time()
+        threads = [threading.Thread(target=self.worker, args=(worker, pending), daemon=True) for worker in range(self.workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        summary = {
+            "workers": self.workers,
+            "seconds": round(time.time() - starttime, 2),
+            "passed": all(result["returncode"] == 0 for result in self.results),
+            "suites": sorted(self.results, key=lambda x: (self.files.index(Path(x["file"])) if Path(x["file"]) in self.files else len(self.files), x["file"])),
+            "merged": self.merge(),
+        }
+
+        with open(Path(self.output, SUMMARY_FILE), mode="w", encoding="utf-8") as summary_file:
+            json.dump(summary, summary_file, indent=2, ensure_ascii=False)
+
+        return summary
+
+    def worker(self, worker, pending):
+        """
+        [Internal]
+
+        Runs the next pending file (or the next file claimed from the work queue) until the queue is empty.
+        """
+        folder = self.worker_folder(worker)
+        Path(folder, "output").mkdir(parents=True, exist_ok=True)
+        log_folder = Path(folder, "Log")
+
+        env = dict(os.environ)
+        env[OVERRIDES_ENV] = json.dumps(self.worker_config(worker))
+
+        while True:
+            item = None
+            if self.work_queue:
+                item = self.work_queue.claim(f"{self.agent}-worker{worker}", self.shard)
+                if not item:
+                    return
+                file = resolve_file(item["file"], self.root)
+            else:
+                try:
+                    file = pending.get_nowait()
+                except queue.Empty:
+                    return
+
+            log_files = set(log_folder.glob(f"**/*{LEGACY_SUFFIX}"))
+            starttime = time.time()
+            output_file = Path(folder, "output", f"{file.stem}.log")
+            with open(output_file, mode="w", encoding="utf-8") as output:
+                process = subprocess.Popen([sys.executable, str(file)], cwd=str(file.parent), env=env,
+                                           stdout=output, stderr=subprocess.STDOUT)
+                returncode = self.wait(process, item)
+
+            seconds = round(time.time() - starttime, 2)
+            if item:
+                self.work_queue.done(item["id"], returncode, seconds)
+
+            log_file = last_log_file(sorted(set(log_folder.glob(f"**/*{LEGACY_SUFFIX}")) - log_files))
+
+            with self.lock:
+                self.results.append({"file": str(file), "worker": worker, "returncode": returncode,
+                                     "seconds": seconds, "output": str(output_file),
+                                     "log_file": str(log_file) if log_file else None})
+
+    def wait(self, process, item=None):
+        """
+        [Internal]
+
+        Waits for the suite process, renewing the lease of the work queue item while it runs.
+        """
+        if not item:
+            return process.wait()
+
+        while True:
+            try:
+                return process.wait(timeout=max(1, self.work_queue.lease_seconds / 3))
+            except subprocess.TimeoutExpired:
+                self.work_queue.renew(item["id"])
+
+    def merge(self):
+        """
+        Merges the Log table rows of the workers into results.csv and copies their
+        JSON logs and spool files to the new_log folder of the output.
+
+        Rows come from the results stores of the workers and, for the suites that wrote
+        legacy CSV files, from the last (cumulative) *_auto.csv file of each suite.
+
+        :return: Paths of the merged files.
+        :rtype: dict
+        """
+        log_folders = [Path(self.worker_folder(worker), "Log") for worker in range(self.workers)]
+        csv_path = Path(self.output, "results.csv")
+        json_folder = Path(self.output, "new_log")
+
+        rows = read_rows([path for folder in log_folders for path in sorted(folder.glob(f"**/*{RESULTS_SUFFIX}"))])
+
+        with open(csv_path, mode="w", newline="", encoding="windows-1252", errors="replace") as csv_file:
+            csv_writer_header = csv.writer(csv_file, delimiter=';', quoting=csv.QUOTE_NONE)
+            csv_writer_header.writerow([header for header, _ in COLUMNS])
+            csv_writer = csv.writer(csv_file, delimiter=';', quotechar='"', quoting=csv.QUOTE_NONNUMERIC)
+            csv_writer.writerows(rows)
+
+            for result in sorted(self.results, key=lambda x: x["worker"]):
+                if result.get("log_file"):
+                    with open(result["log_file"], newline="", encoding="windows-1252") as worker_file:
+                        lines = worker_file.readlines()[1:]
+                    csv_file.writelines(line if line.endswith("\n") else f"{line}\r\n" for line in lines)
+                    rows.extend(lines)
+
+        json_files = 0
+        for worker, folder in enumerate(log_folders):
+            for path in sorted(Path(folder, "new_log").glob("**/*")):
+                if path.is_file() and path.suffix in (".json", ".ndjson"):
+                    json_folder.mkdir(parents=True, exist_ok=True)
+                    target = Path(json_folder, path.name)
+                    shutil.copy2(path, target if not target.exists() else Path(json_folder, f"worker_{worker}_{path.name}"))
+                    json_files += 1
+
+        return {"csv": str(csv_path), "rows": len(rows), "json_folder": str(json_folder), "json_files": json_files}
+
+
+def parse_overrides(values):
+    """
+    [Internal]
+
+    Converts Key=Value arguments into a dict, reading values as JSON when possible.
+    """
+    overrides = {}
+    for value in values or []:
+        key, _, raw = value.partition("=")
+        try:
+            overrides[key] = json.loads(raw)
+        except json.JSONDecodeError:
+            overrides[key] = raw
+    return overrides
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Runs TIR test suites in parallel headless browsers.")
+    parser.add_argument("files", nargs="*", help="TESTSUITE/TESTCASE files, folders containing them or shard manifests (.json)")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--output", default="tir_run", help="Folder of the worker logs and merged results")
+    parser.add_argument("--set", action="append", metavar="KEY=VALUE", help="Config key applied to every worker")
+    parser.add_argument("--workers-config", help="JSON file with a list of config overrides, one per worker")
+    parser.add_argument("--no-headless", action="store_true")
+    parser.add_argument("--queue", help="sqlite work queue shared by the agents (see scheduler enqueue)")
+    parser.add_argument("--agent", default="", help="Agent name in the work queue. Default: host name")
+    parser.add_argument("--shard", type=int, help="Shard claimed first from the work queue")
+    parser.add_argument("--root", default="", help="Folder of the manifests loaded into the work queue. Default: current folder")
+    args = parser.parse_args()
+
+    files = collect_files(args.files)
+
+    worker_overrides = None
+    if args.workers_config:
+        with open(args.workers_config, encoding="utf-8") as workers_file:
+            worker_overrides = json.load(workers_file)
+
+    runner = SuiteRunner(files, args.workers, args.output, parse_overrides(args.set), worker_overrides, not args.no_headless,
+                         WorkQueue(args.queue) if args.queue else None, args.agent, args.shard, args.root)
+    summary = runner.run()
+
+    for result in summary["suites"]:
+        print(f"[worker {result['worker']}] {'OK' if result['returncode'] == 0 else 'FAILED'} {result['seconds']}s {result['file']}")
+    print(f"{summary['merged']['rows']} row(s) merged in {summary['merged']['csv']}")
+    sys.exit(0 if summary["passed"] else 1)
@@ -1,6 +1,5 @@
 import re
 import time
-import pandas as pd
 import inspect
 import os
 import random
@@ -24,6 +23,9 @@ from math import sqrt, pow
 from selenium.common.exceptions import *
 from datetime import datetime
 from tir.technologies.core.logging_config import logger
+from tir.technologies.core.startup_profiler import startup_phase
+from tir.technologies.core.csv_provider import read_csv
+from tir.technologies.core.report_comparison import rule_set, normalize, normalize_file, iter_differences, MAX_DIFFERENCES, DATE_LABELS, TIME_LABELS
 import pathlib
 import json
 from typing import List
@@ -114,15 +116,6 @@ class PouiInternal(Base):
         }
         self.closed_user_guide_routines = []
         
-        if not Base.driver:
-            Base.driver = self.driver
-
-        if not Base.wait:
-            Base.wait = self.wait
-
-        if not Base.errors:
-            Base.errors = self.errors
-
         if not self.config.smart_test and self.config.issue:
             self.check_mot_exec()
 
@@ -141,6 +134,7 @@ class PouiInternal(Base):
             with open("firefox_task_kill.bat", "w", ) as firefox_task_kill:
                 firefox_task_kill.write(f"taskkill /f /PID {self.driver.service.process.pid} /T")
 
+    @startup_phase
     def program_screen(self, initial_program="", environment="", coverage=False):
         """
         [Internal]
@@ -233,6 +227,7 @@ class PouiInternal(Base):
             button = self.driver.find_element(By.CSS_SELECTOR, ".button-ok")
             self.click(button)
 
+    @startup_phase
     def user_screen(self, admin_user = False):
         """
         [Internal]
@@ -364,6 +359,7 @@ class PouiInternal(Base):
         self.wait_element_timeout(term="[name='cGetUser'] > input",
          scrap_type=enum.ScrapType.CSS_SELECTOR, timeout = self.config.time_out , main_container='body')
 
+    @startup_phase
     def environment_screen(self, change_env=False):
         """
         [Internal]
@@ -3300,20 +3296,18 @@ class PouiInternal(Base):
 
         >>> file_csv _no_header_filter = self.oHelper.OpenCSV(delimiter=";", csv_file="no_header.csv", filter_column=0, filter_value='A00_FILIAL')
         """
-
         has_header = 'infer' if header else None
         
         if self.config.csv_path:
-            data = pd.read_csv(self.replace_slash(f"{self.config.csv_path}\\{csv_file}"), sep=delimiter, encoding='latin-1', error_bad_lines=False, header=has_header, index_col=False, dtype=str)
-            df = pd.DataFrame(data)
-            df = df.dropna(axis=1, how='all')
+            data = read_csv(self.replace_slash(f"{self.config.csv_path}\\{csv_file}"), delimiter, has_header, on_bad_lines="skip")
+            df = data.df
 
             filter_column_user = filter_column
             
             if filter_column and filter_value:
                 if isinstance(filter_column, int):
                     filter_column_user = filter_column - 1
-                df = self.filter_dataframe(df, filter_column_user, filter_value)
+                df = data.filter(filter_column_user, filter_value)
             elif (filter_column and not filter_value) or (filter_value and not filter_column):
                 logger().warning('WARNING: filter_column and filter_value is necessary to filter rows by column content. Data wasn\'t filtered')
                 
@@ -3321,12 +3315,6 @@ class PouiInternal(Base):
         else:
             self.log_error("CSV Path wasn't found, please check 'CSVPath' key in the config.json.")
 
-    def filter_dataframe(self, df, column, value):
-        """
-        [Internal]
-        """
-        return df[df[column] == value]
-
     def return_data(self, df, has_header, column):
         """
         [Internal]
@@ -3413,6 +3401,9 @@ class PouiInternal(Base):
             '"DateTime">2015-01-01T00:00:00'
             'ss:Width="100"'
 
+        Every block of differing lines is reported with its line numbers and the lines around it
+        (the first 50 blocks, followed by the number of blocks not shown).
+
         :param base_file: Base file that reflects the expected. If doesn't exist make a copy of auto and then rename to base
         :param current_file: Current file recently impressed, this file is use to generate file_auto automatically.
         >>> # File example:
@@ -3423,8 +3414,6 @@ class PouiInternal(Base):
         :return:
         """
 
-        message = ""
-
         if not self.config.baseline_spool:
             self.log_error("No path in BaseLine_Spool in config.json! Please make sure to put a valid path in this key")
 
@@ -3433,23 +3422,30 @@ class PouiInternal(Base):
         else:
             auto_file = self.create_auto_file(current_file)
             logger().warning(
-                self.replace_slash(f'We created a "auto" based in current file in "{self.config.baseline_spool}\\{current_file}". please, if you dont have a base file, make a copy of auto and rename to base then run again.'f'We created a "auto" based in current file in "{self.config.baseline_spool}\\{current_file}". please, if you dont have a base file, make a copy of auto and rename to base then run again.'))
+                self.replace_slash(f'We created a "auto" based in current file in "{self.config.baseline_spool}\\{current_file}". please, if you dont have a base file, make a copy of auto and rename to base then run again.'))
             self.check_file(base_file, current_file)
 
-            with open(self.replace_slash(f'{self.config.baseline_spool}\\{base_file}')) as base_file:
-                with open(auto_file) as auto_file:
-                    for line_base_file, line_auto_file in zip(base_file, auto_file):
-                        if line_base_file != line_auto_file:
-                            logger().warning("Make sure you are comparing two treated files")
-                            message = f'Base line content: "{line_base_file}" is different of Auto line content: "{line_auto_file}"'
-                            self.errors.append(message)
-                            break
+            differences = 0
+            base_path = self.replace_slash(f'{self.config.baseline_spool}\\{base_file}')
+            for difference in iter_differences(base_path, auto_file):
+                differences += 1
+                if differences <= MAX_DIFFERENCES:
+                    self.errors.append(str(difference))
+
+            if differences:
+                logger().warning("Make sure you are comparing two treated files")
+            if differences > MAX_DIFFERENCES:
+                self.errors.append(f'{differences - MAX_DIFFERENCES} more report differences between "{base_file}" and "{auto_file}" were not shown.')
 
     def create_auto_file(self, file=""):
         """
+        [Internal]
 
-        :param file:
-        :return:
+        Writes the current report normalized by the rules of its extension to the auto file.
+
+        :param file: Current report file in BaseLine_Spool.
+        :type file: str
+        :return: Path of the auto file.
         """
 
         file_extension = file[-4:].lower()
@@ -3458,19 +3454,7 @@ class PouiInternal(Base):
 
         auto_file_path = self.replace_slash(f'{self.config.baseline_spool}\\{next(iter(file.split(".")))}auto{file_extension}')
 
-        if pathlib.Path(f'{auto_file_path}').exists():
-            pathlib.Path(f'{auto_file_path}').unlink()
-
-        with open(full_path) as file_obj:
-            readlines = file_obj.readlines()
-
-            for line in readlines:
-                content = self.sub_string(line, file_extension)
-
-                with open(
-                            self.replace_slash(rf'{self.config.baseline_spool}\\{next(iter(file.split(".")))}auto{file_extension}'),
-                            "a") as write_file:
-                        write_file.write(content)
+        normalize_file(full_path, auto_file_path, self.report_rules(file_extension))
 
         logger().warning(
                 f'Auto file created in: "{auto_file_path}"')
@@ -3479,59 +3463,25 @@ class PouiInternal(Base):
 
     def sub_string(self, line, file_extension):
         """
+        [Internal]
 
-        :param line:
-        :param file_extension:
-        :return:
-        """
-
-        if not file_extension == '.xml':
-
-            emissao = re.search(r'(Emissão: )(?:(\d{2}-\d{2}-\d{4}))', line)
-
-            emision = re.search(r'(Emision: )(?:(\d{2}-\d{2}-\d{4}))', line)
-
-            dtref = re.search(r'(DT\.Ref\.: )(?:(\d{2}-\d{2}-\d{4}))', line)
-
-            fcref = re.search(r'(Fc\.Ref\.: )(?:(\d{2}-\d{2}-\d{4}))', line)
-
-            hora = re.search(r'(Hora\.\.\.: )(?:(\d{2}:\d{2}:\d{2}))', line)
-
-            hora_termino = re.search(r'(Hora Término: )(?:(\d{2}:\d{2}:\d{2}))', line)
-
-            slash = re.search(r'(/)', line)
-
-            if emissao:
-                line = re.sub(emissao.group(0), 'Emissão: 01-01-2015', line)
-            if emision:
-                line = re.sub(emision.group(0), 'Emision: 01-01-2015', line)
-            if dtref:
-                line = re.sub(dtref.group(0), 'DT.Ref.: 01-01-2015', line)
-            if fcref:
-                line = re.sub(fcref.group(0), 'Fc.Ref.: 01-01-2015', line)
-            if hora:
-                line = re.sub(hora.group(0), 'Hora...: 00:00:00', line)
-            if hora_termino:
-                line = re.sub(hora_termino.group(0), 'Hora Término: 00:00:00', line)
-            if slash:
-                line = re.sub(slash.group(0), '@', line)
-
-        else:
-
-            encoding = re.search(r'(encoding=)(?:("UTF-8")|(""))', line)
-
-            datetime = re.search(r'("DateTime">)(?:(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}))', line)
+        Returns the line normalized by the rules of the report extension.
 
-            width = re.search(r'(ss:Width=)"(?:(\d+))"', line)
+        :param line: Line of the report.
+        :type line: str
+        :param file_extension: Extension of the report (".##r", ".xml").
+        :type file_extension: str
+        :return: The normalized line.
+        """
+        return normalize(line, self.report_rules(file_extension))
 
-            if encoding:
-                line = re.sub(encoding.group(0), 'encoding=""', line)
-            if datetime:
-                line = re.sub(datetime.group(0), '"DateTime">2015-01-01T00:00:00', line)
-            if width:
-                line = re.sub(datetime.group(0), 'ss:Width="100"', line)
+    def report_rules(self, file_extension):
+        """
+        [Internal]
 
-        return line
+        Returns the compiled normalization rules of the report extension, built once per extension and labels.
+        """
+        return rule_set(file_extension, DATE_LABELS, TIME_LABELS)
 
     def check_file(self, base_file="", current_file=""):
         """
@@ -4860,6 +4810,7 @@ class PouiInternal(Base):
         :param object: BeautifulSoup4 Table
         :return: Pandas dataframe
         '''
+        import pandas as pd
 
         df = (next(iter(pd.read_html(str(object)))))
 
@@ -5954,6 +5905,7 @@ class PouiInternal(Base):
             module=module,
             save_input=save_input
         )
+        self.startup.finish(self.config, self.config.log_folder, {"program": initial_program})
 
     def ChangeEnvironment(self, date: str = "", group: str = "", branch: str = "", module: str = "") -> None:
         """
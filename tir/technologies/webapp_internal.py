@@ -1,13 +1,11 @@
 import re
 import time
-import pandas as pd
 import inspect
 import os
 import random
 import uuid
 import glob
 import shutil
-import cv2
 import socket
 import pathlib
 import sys
@@ -22,9 +20,9 @@ from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.ui import Select
 from tir.technologies.core import base
-from tir.technologies.core.log import Log, nump
+from tir.technologies.core.log import Log
 from tir.technologies.core.config import ConfigLoader
-from tir.technologies.core.language import LanguagePack
+from tir.technologies.core.language import LanguagePack, normalize_caption
 from tir.technologies.core.third_party.xpath_soup import xpath_soup
 from tir.technologies.core.psutil_info import system_info
 from tir.technologies.core.base import Base
@@ -33,8 +31,11 @@ from math import sqrt, pow
 from selenium.common.exceptions import *
 from datetime import datetime
 from tir.technologies.core.logging_config import logger
+from tir.technologies.core.session_pool import session_pool
+from tir.technologies.core.startup_profiler import startup_phase
+from tir.technologies.core.csv_provider import read_csv, iter_csv
+from tir.technologies.core.report_comparison import rule_set, normalize, normalize_file, iter_differences, MAX_DIFFERENCES
 from io import StringIO
-from tir.technologies.core.base_database import BaseDatabase
 
 def count_time(func):
     """
@@ -68,6 +69,8 @@ class WebappInternal(Base):
     >>>     self.__webapp = WebappInternal(config_path, autostart)
     """
 
+    session_poolable = True
+
     def __init__(self, config_path="", autostart=True):
         """
         [Internal]
@@ -125,9 +128,12 @@ class WebappInternal(Base):
         self.registry_endpoint = ''
         self.rac_endpoint = ''
         self.platform_endpoint = ''
-
-        if not Base.errors:
-            Base.errors = self.errors
+        self.pool_ready = False
+        self.pool_healthy = True
+        self.recovering = False
+        self.restarting = False
+        self._base_database = None
+        self.fixtures = []
 
         if not self.config.smart_test and self.config.issue:
             self.check_mot_exec()
@@ -273,37 +279,39 @@ class WebappInternal(Base):
                 self.config.language = self.get_language()
                 self.language = LanguagePack(self.config.language)
 
-           
-            if not self.config.skip_environment and not self.config.coverage:
-                self.program_screen(initial_program=initial_program, environment=server_environment, poui=self.config.poui_login)
+            warm_session = self.pooled and self.resume_warm_session(initial_program, date, group, branch, module)
 
-            self.log.webapp_version = self.driver.execute_script(
-                        "return (typeof app !== 'undefined' && app && app.VERSION)"
-                        " ? app.VERSION"
-                        " : ((typeof window !== 'undefined' && typeof window.getApplicationVersion === 'function')"
-                        " ? window.getApplicationVersion()"
-                        " : null)"
-                    )
+            if not warm_session:
+                if not self.config.skip_environment and not self.config.coverage:
+                    self.program_screen(initial_program=initial_program, environment=server_environment, poui=self.config.poui_login)
 
-            if not self.config.sso_login:    
-                self.user_screen(True) if initial_program.lower() == "sigacfg" else self.user_screen()
+                self.log.webapp_version = self.driver.execute_script(
+                            "return (typeof app !== 'undefined' && app && app.VERSION)"
+                            " ? app.VERSION"
+                            " : ((typeof window !== 'undefined' && typeof window.getApplicationVersion === 'function')"
+                            " ? window.getApplicationVersion()"
+                            " : null)"
+                        )
 
-                endtime = time.time() + self.config.time_out
-                if not self.config.poui_login:
-                    if self.webapp_shadowroot():
-                        while (time.time() < endtime and (
-                        not self.element_exists(term=self.language.database, scrap_type=enum.ScrapType.MIXED,
-                                                main_container="body", optional_term='wa-text-view'))):
-                            self.update_password()
-                    else:
-                        while (time.time() < endtime and (
-                        not self.element_exists(term=self.language.database, scrap_type=enum.ScrapType.MIXED,
-                                                main_container=".twindow", optional_term=".tsay"))):
-                            self.update_password()
+                if not self.config.sso_login:    
+                    self.user_screen(True) if initial_program.lower() == "sigacfg" else self.user_screen()
 
-            self.environment_screen()
+                    endtime = time.time() + self.config.time_out
+                    if not self.config.poui_login:
+                        if self.webapp_shadowroot():
+                            while (time.time() < endtime and (
+                            not self.element_exists(term=self.language.database, scrap_type=enum.ScrapType.MIXED,
+                                                    main_container="body", optional_term='wa-text-view'))):
+                                self.update_password()
+                        else:
+                            while (time.time() < endtime and (
+                            not self.element_exists(term=self.language.database, scrap_type=enum.ScrapType.MIXED,
+                                                    main_container=".twindow", optional_term=".tsay"))):
+                                self.update_password()
 
-            self.close_screen_before_menu()
+                self.environment_screen()
+
+                self.close_screen_before_menu()
 
             if save_input:
                 if self.config.log_info_config:
@@ -315,17 +323,84 @@ class WebappInternal(Base):
             self.log.country = self.config.country
             self.log.execution_id = self.config.execution_id
             self.log.issue = self.config.issue
+            self.pool_ready = True
 
         except ValueError as error:
             self.log_error(error)
         except Exception as e:
             logger().exception(str(e))
 
+        self.startup.finish(self.config, self.config.log_folder, {"program": initial_program, "pooled": bool(self.pooled)})
+
         if self.config.num_exec:
             if not self.num_exec.post_exec(self.config.url_set_start_exec, 'ErrorSetIniExec'):
                 self.restart_counter = 3
                 self.log_error(f"WARNING: Couldn't possible send num_exec to server please check log.")
 
+    def resume_warm_session(self, initial_program, date, group, branch, module):
+        """
+        [Internal]
+
+        Validates the logged-in browser taken from the session pool: it must be at the main menu
+        of the same initial program, and the environment is changed with ChangeEnvironment when
+        the suite uses another date, group, branch or module.
+
+        When the browser can't be reused it is closed and a new one is started, so Setup logs in again.
+
+        :return: True if the logged-in browser is being reused.
+        :rtype: bool
+        """
+        login = self.pooled["login"]
+        environment = (self.date_format(date), group, branch, module)
+
+        if login["initial_program"].lower() == initial_program.lower() and self.escape_to_main_menu(log_error=False):
+            self.log.webapp_version = self.driver.execute_script(
+                        "return (typeof app !== 'undefined' && app && app.VERSION)"
+                        " ? app.VERSION"
+                        " : ((typeof window !== 'undefined' && typeof window.getApplicationVersion === 'function')"
+                        " ? window.getApplicationVersion()"
+                        " : null)"
+                    )
+            if environment != login["environment"]:
+                logger().info(f"[SessionPool]: Changing environment from {login['environment']} to {environment}")
+                self.ChangeEnvironment(*environment)
+            return True
+
+        logger().info("[SessionPool]: Pooled browser is not at the expected main menu, logging in again")
+        session_pool().discard(self.pooled)
+        self.pooled = None
+        self.Start()
+        return False
+
+    def release_session(self):
+        """
+        [Internal]
+
+        Returns the logged-in browser to the session pool at the end of the suite.
+
+        The browser is kept only when SessionPool is enabled, Setup finished, the suite had no
+        errors and the main menu is visible. Otherwise it is closed by the pool.
+
+        :return: True if the browser was handed to the pool (kept or closed by it), so the caller must not close it.
+        :rtype: bool
+        """
+        if not self.config.session_pool or self.config.coverage or not self.driver:
+            return False
+
+        entry = self.pooled or {"uses": 1}
+        entry.update({
+            "key": session_pool().key(self.config),
+            "driver": self.driver,
+            "wait": self.wait,
+            "login": {"initial_program": self.config.initial_program,
+                      "environment": (self.config.date, self.config.group, self.config.branch, self.config.module)},
+        })
+
+        healthy = self.pool_ready and self.pool_healthy and self.escape_to_main_menu(timeout=10, log_error=False)
+        if not session_pool().release(entry, healthy):
+            self.driver = None
+        return True
+
     def date_format(self, date):
         """
         [Internal]
@@ -382,6 +457,7 @@ class WebappInternal(Base):
             split_date = date.split(d)
             return f"{split_date[0]}{d}{split_date[1]}{d}{split_date[-1][-2:]}"
 
+    @startup_phase
     def close_screen_before_menu(self):
         """
         [Internal]
@@ -414,6 +490,7 @@ class WebappInternal(Base):
                 with open("firefox_task_kill.bat", "w", ) as firefox_task_kill:
                     firefox_task_kill.write(f"taskkill /f /PID {self.driver.service.process.pid} /T")
 
+    @startup_phase
     def program_screen(self, initial_program="", environment="", poui=False):
         """
         [Internal]
@@ -551,6 +628,7 @@ class WebappInternal(Base):
             self.log_error(message)
             raise ValueError(message)
 
+    @startup_phase
     def user_screen(self, admin_user=False):
         """
         [Internal]
@@ -775,6 +853,7 @@ class WebappInternal(Base):
                 button = self.soup_to_selenium(bs4_close_button())
                 self.click(button)
 
+    @startup_phase
     def environment_screen(self, change_env=False):
         """
         [Internal]
@@ -1968,40 +2047,62 @@ class WebappInternal(Base):
         except Exception as e:
             logger().exception(str(e))
 
-    def escape_to_main_menu(self):
+    def escape_to_main_menu(self, timeout=None, log_error=True):
         """[Internal]
 
         Tries to navigate back to the main menu screen by sending ESC keys and closing open dialogs.
         Waits until the menu is visible and there is only one dialog layer.
 
-        :return: None
+        :param timeout: Maximum time in seconds to reach the main menu. - **Default:** None (Half of TimeOut)
+        :type timeout: float
+        :param log_error: Logs an error when the main menu is not reached. When False, errors of the
+        browser are not raised either, so it can be used to check a browser. - **Default:** True
+        :type log_error: bool
+
+        :return: True if the main menu is visible.
+        :rtype: bool
         """
         success = False
+        escaped = False
         container_term = 'wa-dialog'
 
-        endtime = time.time() + self.config.time_out /2
-        while time.time() < endtime and not success:
-            logger().info('Escape to menu')
-            ActionChains(self.driver).send_keys(Keys.ESCAPE).perform()
+        endtime = time.time() + (timeout if timeout is not None else self.config.time_out / 2)
+        while True:
+            try:
+                menu_screen = self.check_tmenu_screen()
+                container_layers = self.check_layers(container_term) == 1
+                success = menu_screen and container_layers
 
-            if any([self.check_warning_screen(), self.check_coin_screen(), self.check_news_screen()]) \
-                and self.check_layers(container_term) > 1:
-                logger().info('Found layers after Escape to menu')
-                self.close_screen_before_menu()
+                logger().debug(f'Check Menu Screen: {menu_screen}')
+                logger().debug(f'wa-dialog layers: {container_layers}')
 
-            menu_screen = self.check_tmenu_screen()
-            container_layers = self.check_layers(container_term) == 1
-            success = menu_screen and container_layers
+                if success or time.time() >= endtime:
+                    break
 
-            logger().debug(f'Check Menu Screen: {menu_screen}')
-            logger().debug(f'wa-dialog layers: {container_layers}')
+                logger().info('Escape to menu')
+                ActionChains(self.driver).send_keys(Keys.ESCAPE).perform()
+                escaped = True
+
+                if any([self.check_warning_screen(), self.check_coin_screen(), self.check_news_screen()]) \
+                    and self.check_layers(container_term) > 1:
+                    logger().info('Found layers after Escape to menu')
+                    self.close_screen_before_menu()
+            except Exception as e:
+                if log_error:
+                    raise
+                logger().debug(f"Main menu check error: {e}")
+                return False
 
         if not success:
-            self.log_error('Home screen not found!')     
-        
-        # wait trasitions between screens to avoid errors in layers number
-        self.wait_element_timeout(term=container_term, scrap_type=enum.ScrapType.CSS_SELECTOR,
-                                    position=2, timeout=6, main_container='body')
+            if log_error:
+                self.log_error('Home screen not found!')
+            return False
+
+        if escaped:
+            # wait trasitions between screens to avoid errors in layers number
+            self.wait_element_timeout(term=container_term, scrap_type=enum.ScrapType.CSS_SELECTOR,
+                                        position=2, timeout=6, main_container='body')
+        return True
 
     def check_layers(self, term):
         """
@@ -3801,12 +3902,18 @@ class WebappInternal(Base):
         return value
 
 
-    def restart(self):
+    def restart(self, refresh=False):
         """
         [Internal]
 
         Restarts the Protheus Webapp and fills the initial screens.
 
+        :param refresh: Reloads the page in the same browser instead of restarting it. - **Default:** False
+        :type refresh: bool
+
+        :return: False if the page was reloaded but the main menu wasn't found after the login.
+        :rtype: bool
+
         Usage:
 
         >>> # Calling the method:
@@ -3823,7 +3930,11 @@ class WebappInternal(Base):
                 logger().debug(f'sc_query exception: {err}')
 
         try:
-            self.restart_browser()
+            if refresh:
+                logger().debug(f"Get url {self.config.url}")
+                self.get_url()
+            else:
+                self.restart_browser()
         except WebDriverException as e:
             webdriver_exception = e
 
@@ -3860,10 +3971,16 @@ class WebappInternal(Base):
 
             twebview = True if self.config.new_home else False
 
+            menu_ready = False
             endtime = time.time() + self.config.time_out
-            while(time.time() < endtime and not self.element_exists(term=".tmenu, .dict-tmenu, [class*='card-wrapper']", scrap_type=enum.ScrapType.CSS_SELECTOR, main_container="body", twebview=twebview)):
-                self.close_warning_screen()
-                self.close_modal()
+            while(time.time() < endtime and not menu_ready):
+                menu_ready = self.element_exists(term=".tmenu, .dict-tmenu, [class*='card-wrapper']", scrap_type=enum.ScrapType.CSS_SELECTOR, main_container="body", twebview=twebview)
+                if not menu_ready:
+                    self.close_warning_screen()
+                    self.close_modal()
+
+            if refresh and not menu_ready:
+                return False
 
             if self.config.log_info_config:
                 self.set_log_info_config() 
@@ -3875,13 +3992,113 @@ class WebappInternal(Base):
             self.log.execution_id = self.config.execution_id
             self.log.issue = self.config.issue
 
+            return self.restore_routine()
 
-            if self.config.routine:
-                from tir.technologies.core.events import emit
-                if self.config.routine_type == 'SetLateralMenu':
-                    emit('route.set_lateral_menu', self.config.routine, save_input=False)
-                elif self.config.routine_type == 'Program':
-                    emit('route.set_program', self.config.routine)
+    def restore_routine(self):
+        """
+        [Internal]
+
+        Opens again the routine of the suite (SetLateralMenu or Program) after a recovery.
+
+        :return: True if the suite has no routine or the routine is open.
+        :rtype: bool
+        """
+        if not self.config.routine or self.config.routine_type not in ('SetLateralMenu', 'Program'):
+            return True
+
+        from tir.technologies.core.events import emit
+        if self.config.routine_type == 'SetLateralMenu':
+            emit('route.set_lateral_menu', self.config.routine, save_input=False)
+        else:
+            emit('route.set_program', self.config.routine)
+
+        endtime = time.time() + self.config.time_out / 2
+        while not self.routine_open():
+            if time.time() >= endtime:
+                logger().debug(f"[Recovery]: Routine {self.config.routine} was not opened again")
+                return False
+            time.sleep(1)
+        return True
+
+    def routine_open(self):
+        """
+        [Internal]
+
+        Returns True if a routine is open over the main menu.
+        """
+        try:
+            if self.webapp_shadowroot():
+                return self.check_layers('wa-dialog') > 1
+            return not self.check_tmenu_screen()
+        except Exception:
+            return False
+
+    def recover(self, stack_item=""):
+        """
+        [Internal]
+
+        Brings the Webapp back to the routine of the suite after an error, trying the cheapest step first:
+
+        1. Closes the open dialogs and escapes to the main menu (SoftRecovery).
+        2. Reloads the page and logs in again in the same browser (SoftRecovery).
+        3. Restarts the browser and logs in again.
+
+        Each step is verified (the routine must be open again) before the next one is tried, and its
+        duration is logged. Errors logged by the SoftRecovery steps (log_error) make the step fail
+        instead of starting another recovery. The browser restart keeps the log_error contract: an
+        error logged while it runs restarts the browser again, until restart_counter reaches 3 and
+        the error is logged and the test fails.
+
+        :param stack_item: Test case being executed. Errors in setUpClass always restart the browser.
+        :type stack_item: str
+
+        Usage:
+
+        >>> # Calling the method:
+        >>> self.recover(stack_item)
+        """
+        if self.recovering:
+            return
+
+        if self.config.soft_recovery and not self.restarting and stack_item != "setUpClass" and self.restart_counter < 3:
+            self.recovering = True
+            try:
+                for name, step in (("escape to main menu", self.soft_reset),
+                                   ("page reload and login", lambda: self.restart(refresh=True))):
+                    starttime = time.time()
+                    try:
+                        recovered = step() is not False
+                    except Exception as e:
+                        logger().debug(f"[Recovery]: {name} error: {str(e)}")
+                        recovered = False
+
+                    logger().info(f"[Recovery]: {name} {'succeeded' if recovered else 'failed'} in {round(time.time() - starttime, 2)}s")
+                    if recovered:
+                        return
+            finally:
+                self.recovering = False
+
+        restarting, self.restarting = self.restarting, True
+        starttime = time.time()
+        try:
+            self.restart()
+        finally:
+            self.restarting = restarting
+        logger().info(f"[Recovery]: browser restart finished in {round(time.time() - starttime, 2)}s")
+
+    def soft_reset(self):
+        """
+        [Internal]
+
+        Closes the open dialogs, escapes to the main menu and opens the routine of the suite again.
+
+        :return: True if the routine of the suite is open again.
+        :rtype: bool
+        """
+        if not self.escape_to_main_menu(log_error=False):
+            return False
+
+        return self.restore_routine()
 
     def wait_user_screen(self):
 
@@ -3940,6 +4157,9 @@ class WebappInternal(Base):
         """
         element = None
 
+        if self._base_database:
+            self._base_database.disconnect_database()
+
         if self.config.coverage:
            self.get_coverage()
         else:
@@ -4402,11 +4622,12 @@ class WebappInternal(Base):
             error_message = f"Error Log: {error_paragraphs[0]} - {error_paragraphs[1]}" if len(error_paragraphs) > 2 else label
             message = error_message.replace("\n", " ")
 
+            details_term = normalize_caption(self.language.details)
             if self.webapp_shadowroot():
-                button = next(iter(filter(lambda x: self.language.details.lower() in x.get('caption').lower().replace('<u>', '').replace('</u>',''),top_layer.select("wa-button"))), None)
+                button = next(iter(filter(lambda x: details_term in normalize_caption(x.get('caption') or ''),top_layer.select("wa-button"))), None)
                 self.driver.execute_script(f"return arguments[0].click()", self.soup_to_selenium(button))
             else:
-                button = next(iter(filter(lambda x: self.language.details.lower() in x.text.lower(),top_layer.select("button"))), None)
+                button = next(iter(filter(lambda x: details_term in normalize_caption(x.text),top_layer.select("button"))), None)
                 self.click(self.driver.find_element(By.XPATH, xpath_soup(button)))
             time.sleep(1)
         self.restart_counter += 1
@@ -4659,11 +4880,10 @@ class WebappInternal(Base):
                         self.restart_counter += 1
                         self.log_error(f"Couldn't find lateral menu")
 
-                regex = r"(<[^>]*>)?"
                 if self.webapp_shadowroot():
+                    menuitem_term = normalize_caption(menuitem).strip()
                     child = list(filter(
-                        lambda x: hasattr(x, 'caption') and re.sub(regex, '', x['caption'].lower().strip()).startswith(
-                            menuitem.lower().strip()), subMenuElements))
+                        lambda x: hasattr(x, 'caption') and normalize_caption(x['caption']).strip().startswith(menuitem_term), subMenuElements))
                 else:
                     child = list(filter(lambda x: x.text.startswith(menuitem), subMenuElements))
 
@@ -4935,7 +5155,7 @@ class WebappInternal(Base):
                 logger().debug(f"***System Info*** Before Clicking on button:{button}")
                 system_info()
 
-            regex = r"(<[^>]*>)?"
+            button_term = normalize_caption(button)
             filtered_button = []
             next_button = None
             while(time.time() < endtime and not soup_element):
@@ -4946,7 +5166,7 @@ class WebappInternal(Base):
                     soup_objects = soup.select(term_button)
 
                     if soup_objects and not filtered_button:
-                        filtered_button = list(filter(lambda x: hasattr(x,'caption') and button.lower() in re.sub(regex,'',x['caption'].lower()) and self.element_is_displayed(x), soup_objects ))
+                        filtered_button = list(filter(lambda x: hasattr(x,'caption') and button_term in normalize_caption(x['caption']) and self.element_is_displayed(x), soup_objects ))
 
                         if not filtered_button:
                             filtered_button = self.return_soup_by_selenium(elements=soup_objects, term=button, selectors='label, span')
@@ -4967,7 +5187,7 @@ class WebappInternal(Base):
                             filtered_button = parents_actives
                         next_button = filtered_button[position]
                     else:
-                        filtered_button = list(filter(lambda x: (hasattr(x,'caption') and button.lower() in re.sub(regex,'',x['caption'].lower())) and 'focus' in x.get('class'), soup_objects ))
+                        filtered_button = list(filter(lambda x: (hasattr(x,'caption') and button_term in normalize_caption(x['caption'])) and 'focus' in x.get('class'), soup_objects ))
 
                     if not filtered_button:
                         filtered_button = self.web_scrap(term=button, scrap_type=enum.ScrapType.MIXED, optional_term="wa-button", main_container = self.containers_selectors["SetButton"])
@@ -6382,6 +6602,7 @@ class WebappInternal(Base):
         """
         [Internal]
         """
+        import pandas as pd
         term = self.grid_selectors["new_web_app"]
 
         if wait:
@@ -8531,6 +8752,7 @@ class WebappInternal(Base):
         >>> # Calling the method:
         >>> x3_dictionaries = self.get_x3_dictionaries(field_list)
         """
+        import pandas as pd
         prefixes = list(set(map(lambda x:x.split("_")[0] + "_" if "_" in x else "", fields)))
         regex = self.generate_regex_by_prefixes(prefixes)
 
@@ -9282,6 +9504,9 @@ class WebappInternal(Base):
         >>> self.log_error("Element was not found")
         """
 
+        if self.recovering:
+            raise self.failureException(f"[Recovery]: {message}")
+
         if self.blocker:
             message += f' Blocker: {self.blocker}'
             self.blocker = None
@@ -9290,6 +9515,7 @@ class WebappInternal(Base):
             self.log.log_exec_file()
 
         self.restart_counter = restart_counter_param if restart_counter_param else self.restart_counter
+        self.pool_healthy = False
 
         self.clear_grid()
         logger().warning(f"Warning log_error {message}")
@@ -9317,14 +9543,13 @@ class WebappInternal(Base):
 
         if self.config.screenshot and proceed_action() and stack_item not in self.log.test_case_log and self.driver:
             self.log.take_screenshot_log(self.driver, stack_item, test_number)
-            time.sleep(1)
 
         if new_log_line and proceed_action():
             self.log.new_line(False, log_message)
         if proceed_action() and self.log.has_csv_condition():
             self.log.generate_log()
         if not self.config.skip_restart and len(self.log.list_of_testcases()) >= 1 and self.config.initial_program != '':
-            self.restart()
+            self.recover(stack_item)
         elif self.config.coverage and self.config.initial_program != '':
             self.restart()
         else:
@@ -10687,6 +10912,8 @@ class WebappInternal(Base):
         >>> self.TearDown()
         """
 
+        self.restore_fixtures()
+
         if self.config.new_log:
             self.execution_flow()
 
@@ -10746,6 +10973,9 @@ class WebappInternal(Base):
             if self.config.check_dump:
                 self.check_dmp_file()
 
+        if self.release_session():
+            return
+
         try:
             self.driver.close()
         except Exception as e:
@@ -11530,7 +11760,7 @@ class WebappInternal(Base):
             else:
                 pass
 
-    def open_csv(self, csv_file, delimiter, column, header, filter_column, filter_value):
+    def open_csv(self, csv_file, delimiter, column, header, filter_column, filter_value, chunksize=None):
         """
         Returns a dictionary when the file has a header in another way returns a list
         The folder must be entered in the CSVPath parameter in the config.json. Ex:
@@ -11553,6 +11783,8 @@ class WebappInternal(Base):
         :type filter_column: str or int
         :param filter_value: Value used in pair with filter_column parameter
         :type filter_value: str
+        :param chunksize: Reads the file in chunks of chunksize rows, returning a generator with the data of each chunk
+        :type chunksize: int
 
         >>> # Call the method:
         >>> file_csv = test_helper.OpenCSV(delimiter=";", csv_file="no_header.csv")
@@ -11573,33 +11805,30 @@ class WebappInternal(Base):
 
         >>> file_csv _no_header_filter = self.oHelper.OpenCSV(delimiter=";", csv_file="no_header.csv", filter_column=0, filter_value='A00_FILIAL')
         """
-
         has_header = 'infer' if header else None
 
         if self.config.csv_path:
-            data = pd.read_csv(self.replace_slash(f"{self.config.csv_path}\\{csv_file}"), sep=delimiter, encoding='latin-1', on_bad_lines="error", header=has_header, index_col=False, dtype=str)
-            df = pd.DataFrame(data)
-            df = df.dropna(axis=1, how='all')
+            path = self.replace_slash(f"{self.config.csv_path}\\{csv_file}")
 
             filter_column_user = filter_column
 
             if filter_column and filter_value:
                 if isinstance(filter_column, int):
                     filter_column_user = filter_column - 1
-                df = self.filter_dataframe(df, filter_column_user, filter_value)
             elif (filter_column and not filter_value) or (filter_value and not filter_column):
                 logger().warning('WARNING: filter_column and filter_value is necessary to filter rows by column content. Data wasn\'t filtered')
+                filter_column_user = None
+
+            if chunksize:
+                return (self.return_data(df, has_header, column) for df in iter_csv(path, delimiter, has_header, chunksize, filter_column_user, filter_value))
+
+            data = read_csv(path, delimiter, has_header)
+            df = data.filter(filter_column_user, filter_value) if filter_column and filter_value else data.df
 
             return self.return_data(df, has_header, column)
         else:
             self.log_error("CSV Path wasn't found, please check 'CSVPath' key in the config.json.")
 
-    def filter_dataframe(self, df, column, value):
-        """
-        [Internal]
-        """
-        return df[df[column] == value]
-
     def return_data(self, df, has_header, column):
         """
         [Internal]
@@ -11840,6 +12069,8 @@ class WebappInternal(Base):
         :param img2: cv2 object
         :return: Mean Squared Error (Matching error) between the images.
         """
+        import cv2
+        import numpy as nump
         h, w = img1.shape
         diff = cv2.subtract(img1, img2)
         err = nump.sum(diff**2)
@@ -11886,6 +12117,9 @@ class WebappInternal(Base):
             '"DateTime">2015-01-01T00:00:00'
             'ss:Width="100"'
 
+        Every block of differing lines is reported with its line numbers and the lines around it
+        (the first 50 blocks, followed by the number of blocks not shown).
+
         :param base_file: Base file that reflects the expected. If doesn't exist make a copy of auto and then rename to base
         :param current_file: Current file recently impressed, this file is use to generate file_auto automatically.
         >>> # File example:
@@ -11896,8 +12130,6 @@ class WebappInternal(Base):
         :return:
         """
 
-        message = ""
-
         if not self.config.baseline_spool:
             self.log_error("No path in BaseLine_Spool in config.json! Please make sure to put a valid path in this key")
 
@@ -11909,20 +12141,27 @@ class WebappInternal(Base):
                 self.replace_slash(f'We created a "auto" based in current file in "{self.config.baseline_spool}\\{current_file}". please, if you dont have a base file, make a copy of auto and rename to base then run again.'))
             self.check_file(base_file, current_file)
 
-            with open(self.replace_slash(f'{self.config.baseline_spool}\\{base_file}')) as base_file:
-                with open(auto_file) as auto_file:
-                    for line_base_file, line_auto_file in zip(base_file, auto_file):
-                        if line_base_file != line_auto_file:
-                            logger().warning("Make sure you are comparing two treated files")
-                            message = f'Base line content: "{line_base_file}" is different of Auto line content: "{line_auto_file}"'
-                            self.errors.append(message)
-                            break
+            differences = 0
+            base_path = self.replace_slash(f'{self.config.baseline_spool}\\{base_file}')
+            for difference in iter_differences(base_path, auto_file):
+                differences += 1
+                if differences <= MAX_DIFFERENCES:
+                    self.errors.append(str(difference))
+
+            if differences:
+                logger().warning("Make sure you are comparing two treated files")
+            if differences > MAX_DIFFERENCES:
+                self.errors.append(f'{differences - MAX_DIFFERENCES} more report differences between "{base_file}" and "{auto_file}" were not shown.')
 
     def create_auto_file(self, file=""):
         """
+        [Internal]
 
-        :param file:
-        :return:
+        Writes the current report normalized by the rules of its extension to the auto file.
+
+        :param file: Current report file in BaseLine_Spool.
+        :type file: str
+        :return: Path of the auto file.
         """
 
         file = re.sub('auto', '', file)
@@ -11936,16 +12175,7 @@ class WebappInternal(Base):
         if pathlib.Path(f'{auto_file_path}').exists():
             return auto_file_path
 
-        with open(full_path) as file_obj:
-            readlines = file_obj.readlines()
-
-            for line in readlines:
-                content = self.sub_string(line, file_extension)
-
-                with open(
-                            self.replace_slash(rf'{self.config.baseline_spool}\\{next(iter(file.split(".")))}auto{file_extension}'),
-                            "a") as write_file:
-                        write_file.write(content)
+        normalize_file(full_path, auto_file_path, self.report_rules(file_extension))
 
         logger().warning(
                 f'Auto file created in: "{auto_file_path}"')
@@ -11954,51 +12184,25 @@ class WebappInternal(Base):
 
     def sub_string(self, line, file_extension):
         """
+        [Internal]
 
-        :param line:
-        :param file_extension:
-        :return:
-        """
-
-        if not file_extension == '.xml':
-
-            emissao = re.search(r'('+self.language.issued+': )(?:(\d{2}-\d{2}-\d{4}))', line)
-
-            dtref = re.search(r'('+self.language.ref_dt+': )(?:(\d{2}-\d{2}-\d{4}))', line)
-
-            hora = re.search(r'('+self.language.time+'\.\.\.: )(?:(\d{2}:\d{2}:\d{2}))', line)
-
-            hora_termino = re.search(r'('+self.language.end_time+': )(?:(\d{2}:\d{2}:\d{2}))', line)
-
-            slash = re.search(r'(/)', line)
-
-            if emissao:
-                line = re.sub(emissao.group(0), self.language.issued+': 01-01-2015', line)
-            if dtref:
-                line = re.sub(dtref.group(0), self.language.ref_dt+': 01-01-2015', line)
-            if hora:
-                line = re.sub(hora.group(0), self.language.time+'...: 00:00:00', line)
-            if hora_termino:
-                line = re.sub(hora_termino.group(0), self.language.end_time+': 00:00:00', line)
-            if slash:
-                line = re.sub(slash.group(0), '@', line)
-
-        else:
-
-            encoding = re.search(r'(encoding=)(?:("UTF-8")|(""))', line)
-
-            datetime = re.search(r'("DateTime">)(?:(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}))', line)
+        Returns the line normalized by the rules of the report extension.
 
-            width = re.search(r'(ss:Width=)"(?:(\d+))"', line)
+        :param line: Line of the report.
+        :type line: str
+        :param file_extension: Extension of the report (".##r", ".xml").
+        :type file_extension: str
+        :return: The normalized line.
+        """
+        return normalize(line, self.report_rules(file_extension))
 
-            if encoding:
-                line = re.sub(encoding.group(0), 'encoding=""', line)
-            if datetime:
-                line = re.sub(datetime.group(0), '"DateTime">2015-01-01T00:00:00', line)
-            if width:
-                line = re.sub(width.group(0), 'ss:Width="100"', line)
+    def report_rules(self, file_extension):
+        """
+        [Internal]
 
-        return line
+        Returns the compiled normalization rules of the report extension, built once per extension and labels.
+        """
+        return rule_set(file_extension, (self.language.issued, self.language.ref_dt), (f"{self.language.time}...", self.language.end_time))
 
     def check_file(self, base_file="", current_file=""):
         """
@@ -12674,8 +12878,19 @@ class WebappInternal(Base):
 
         return container.select(selector) if select_all else container.select_one(selector)
 
+    @property
+    def base_database(self):
+        """
+        [Internal]
 
-    def query_execute(self, query, database_driver, dbq_oracle_server, database_server, database_port, database_name, database_user, database_password):
+        BaseDatabase of the instance, created (and sqlalchemy imported) on the first database call.
+        """
+        if self._base_database is None:
+            from tir.technologies.core.base_database import BaseDatabase
+            self._base_database = BaseDatabase(self.config)
+        return self._base_database
+
+    def query_execute(self, query, database_driver, dbq_oracle_server, database_server, database_port, database_name, database_user, database_password, result_format="dict"):
         """
         [Internal]
 
@@ -12697,15 +12912,73 @@ class WebappInternal(Base):
         :type database_user: str
         :param database_password: Password for database authentication.
         :type database_password: str
+        :param result_format: Format of the SELECT result: "dict", "records", "tuples", "dataframe" or "arrow".
+        :type result_format: str
 
         :return: Query result set.
         """
-        base_database = BaseDatabase()
         try:
-            return base_database.query_execute(query, database_driver, dbq_oracle_server, database_server, database_port, database_name, database_user, database_password)
+            return self.base_database.query_execute(query, database_driver, dbq_oracle_server, database_server, database_port, database_name, database_user, database_password, result_format)
         except Exception as e:
             self.log_error(f"Error in query_execute: {str(e)}")
 
+    def execute_many(self, statements, database_driver, dbq_oracle_server, database_server, database_port, database_name, database_user, database_password, batch_size):
+        """
+        [Internal]
+
+        Executes parameter-bound statements in a single transaction.
+
+        :return: Number of rows affected.
+        """
+        try:
+            return self.base_database.execute_many(statements, database_driver, dbq_oracle_server, database_server, database_port, database_name, database_user, database_password, batch_size)
+        except Exception as e:
+            self.log_error(f"Error in execute_many: {str(e)}")
+
+    def load_fixture(self, paths, keys, delimiter, database_driver, dbq_oracle_server, database_server, database_port, database_name, database_user, database_password):
+        """
+        [Internal]
+
+        Loads the datasets of the paths and keeps the fixture to be restored by TearDown.
+
+        :return: The loaded fixture.
+        :rtype: Fixture
+        """
+        from tir.technologies.core.fixtures import Fixture, read_datasets
+        try:
+            engine = self.base_database.connect_database("", database_driver, dbq_oracle_server, database_server, database_port, database_name, database_user, database_password)
+            fixture = Fixture(read_datasets(paths, delimiter), engine, keys).load()
+            self.fixtures.append(fixture)
+            return fixture
+        except Exception as e:
+            self.log_error(f"Error in load_fixture: {str(e)}")
+
+    def restore_fixtures(self):
+        """
+        [Internal]
+
+        Restores the tables changed by the fixtures, the last loaded first.
+        """
+        while self.fixtures:
+            fixture = self.fixtures.pop()
+            try:
+                fixture.restore()
+            except Exception as e:
+                logger().exception(f"Error restoring fixture: {str(e)}")
+
+    def query_stream(self, query, database_driver, dbq_oracle_server, database_server, database_port, database_name, database_user, database_password, chunksize, result_format):
+        """
+        [Internal]
+
+        Yields the rows of a SELECT in chunks of chunksize rows.
+
+        :return: Generator of chunks in the result_format.
+        """
+        try:
+            yield from self.base_database.query_stream(query, database_driver, dbq_oracle_server, database_server, database_port, database_name, database_user, database_password, chunksize, result_format)
+        except Exception as e:
+            self.log_error(f"Error in query_stream: {str(e)}")
+
 
     def set_mock_route(self, route, sub_route, registry):
         """